@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from models.coord import Coord
 from models.inventory import Inventory
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     _pos: Coord
     _inventory: Inventory = field(default_factory=Inventory)
@@ -23,3 +23,6 @@ class Player:
     @inventory.setter
     def inventory(self, value: Inventory) -> None:
         self._inventory = value
+
+    def clone(self) -> "Player":
+        return Player(self._pos, self._inventory.clone())
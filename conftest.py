@@ -0,0 +1 @@
+# racine du dépôt : rend les imports absolus (models, world, game...) disponibles pour tests/
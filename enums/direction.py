@@ -7,10 +7,33 @@ class Direction(Enum):
     LEFT = auto()
     RIGHT = auto()
 
+    # membres uniques et égalité par identité : hash d'identité (en C) au lieu de hash(nom),
+    # les dicts indexés par Direction sont bien plus rapides
+    __hash__ = object.__hash__
+
     @staticmethod
     def delta(d: "Direction") -> tuple[int, int]:
-        if d is Direction.UP: return (-1, 0)
-        if d is Direction.DOWN: return (1, 0)
-        if d is Direction.LEFT: return (0, -1)
-        if d is Direction.RIGHT: return (0, 1)
-        raise ValueError("Unknown direction")
+        try:
+            return _DELTAS[d]
+        except KeyError:
+            raise ValueError("Unknown direction") from None
+
+    @staticmethod
+    def opposite(d: "Direction") -> "Direction":
+        return OPPOSITE[d]
+
+
+# tables (construites une fois : Direction.UP coûte un accès d'attribut d'Enum)
+_DELTAS = {
+    Direction.UP: (-1, 0),
+    Direction.DOWN: (1, 0),
+    Direction.LEFT: (0, -1),
+    Direction.RIGHT: (0, 1),
+}
+
+OPPOSITE = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT,
+}
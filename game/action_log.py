@@ -0,0 +1,98 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from functools import wraps
+from inspect import signature
+from typing import Callable, Iterator, List, Optional, TextIO
+import json
+
+# Version du format de journal (à incrémenter si les règles de rejeu changent)
+LOG_VERSION = 1
+
+
+class ActionLog:
+    """
+    Journal compact, en ajout seul, des appels qui modifient une partie.
+    Chaque entrée est un tuple (op, *args) avec des arguments JSON (noms de Direction, entiers...).
+    Avec un `sink` (fichier texte), chaque entrée est écrite immédiatement (format JSON lines).
+    """
+    def __init__(self, header: Optional[dict] = None, sink: Optional[TextIO] = None):
+        self.header: dict = dict(header or {})
+        self.actions: List[tuple] = []
+        self._sink = sink
+        self._depth = 0  # > 0 pendant un appel déjà journalisé (ex: buy -> place_object_at)
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def start(self, **header) -> None:
+        """Complète l'en-tête (graine, mode rng, taille) et l'écrit dans le sink."""
+        self.header.update(header)
+        self.header.setdefault("version", LOG_VERSION)
+        if self._sink is not None:
+            self._sink.write(json.dumps(self.header) + "\n")
+            self._sink.flush()
+
+    def append(self, op: str, *args) -> None:
+        entry = (op,) + args
+        self.actions.append(entry)
+        if self._sink is not None:
+            self._sink.write(json.dumps(entry) + "\n")
+            self._sink.flush()
+
+    @contextmanager
+    def record(self, op: str, *args) -> Iterator[None]:
+        """Journalise un appel de haut niveau ; les appels imbriqués ne sont pas répétés."""
+        if self._depth == 0:
+            self.append(op, *args)
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+
+    # ---------- fichiers ----------
+    def dump(self, fp: TextIO) -> None:
+        fp.write(json.dumps(self.header) + "\n")
+        for entry in self.actions:
+            fp.write(json.dumps(entry) + "\n")
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as fp:
+            self.dump(fp)
+
+    @classmethod
+    def load(cls, fp: TextIO) -> "ActionLog":
+        lines = [line for line in fp if line.strip()]
+        if not lines:
+            raise ValueError("Journal vide.")
+        log = cls(json.loads(lines[0]))
+        log.actions = [tuple(json.loads(line)) for line in lines[1:]]
+        return log
+
+    @classmethod
+    def load_file(cls, path: str) -> "ActionLog":
+        with open(path, encoding="utf-8") as fp:
+            return cls.load(fp)
+
+
+def recorded(op: str, encode: Optional[Callable[..., tuple]] = None):
+    """
+    Décorateur pour les méthodes de Game : journalise l'appel dans game.action_log (si présent).
+    `encode` convertit les arguments en valeurs JSON. Les arguments nommés sont remis dans
+    l'ordre de la signature avant journalisation : le rejeu les passe par position.
+    """
+    def decorator(fn):
+        sig = signature(fn)
+
+        @wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            log = self.action_log
+            if log is None:
+                return fn(self, *args, **kwargs)
+            bound = sig.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            args = bound.args[1:]
+            with log.record(op, *(encode(*args) if encode else args)):
+                return fn(self, *args)
+        return wrapper
+    return decorator
@@ -1,41 +1,70 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from contextlib import nullcontext
+from copy import copy
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple, Type
 import random
 
-from enums.direction import Direction
+from enums.direction import Direction, OPPOSITE
 from enums.lock_level import LockLevel
 from models.coord import Coord
 from models.door import Door
 from world.manor import Manor
+from world.door_graph import DoorGraph
+from world.pathfinding import PathFinder, Route
+from world.lock_table import lock_table
 from actors.player import Player
 
-# toutes tes rooms
-from rooms.special_rooms import (
-    Kitchen, Pantry, Garden, LockerRoom,
-    Armory, Library, PlainRoom,
-    Furnace, Greenhouse, Solarium, Veranda, MaidsChamber,
-    EntranceHall, Antechamber, WeightRoom, MasterBedroom,
-    UtilityRoom, ChamberOfMirrors, RumpusRoom   # 👈 
-)
-
-# objets
-from objects.consumable import Apple, Banana, Cake, Sandwich, Meal
-from objects.permanent import (
-    ShovelObj, HammerObj, LockpickKitObj, MetalDetectorObj, RabbitFootObj
-)
-from objects.interactive import Chest, DigSpot, Locker
+from rooms.room_base import Room
+from rooms.special_rooms import EntranceHall, Antechamber, PlainRoom
+from rooms.loot import roll_loot
 from items.permanent_item import PermanentItem
+from rooms.catalog import DRAWABLE_ROOM_CLASSES, get_catalog
+from rooms.draw_modifiers import ClassBoost, active_layers
+from rooms.draw_sampler import DrawTable, RoomDrawSampler
+from game.action_log import ActionLog, recorded
+from game.modifiers import ROOMS, STEPS, ModifierScheduler
+from game.rng import RNG_MODES, STREAM_DRAW, STREAM_LOCK, keyed_stream
+
+# tables de tirage partagées par toutes les parties du processus
+ROOM_SAMPLER = RoomDrawSampler()
 
 
 @dataclass
 class Game:
     manor: Manor
+    seed: Optional[int] = None
+    # générateur propre à la partie (toute l'aléa du jeu passe par lui)
+    rng: Optional[random.Random] = field(default=None, repr=False)
+    # "sequential" : tout sort de self.rng, dans l'ordre des appels
+    # "counter"    : tirages de pièces et verrous indexés par (graine, case, n-ième tirage)
+    rng_mode: str = "sequential"
+    # journal des actions (rejeu), None = pas d'enregistrement
+    action_log: Optional[ActionLog] = field(default=None, repr=False)
 
     def __post_init__(self):
+        if self.rng_mode not in RNG_MODES:
+            raise ValueError(f"rng_mode must be one of {RNG_MODES}")
+        if self.seed is None and self.rng is None and self.action_log is not None:
+            # une partie journalisée doit être rejouable : on fixe une graine
+            self.seed = random.SystemRandom().getrandbits(63)
+        if self.rng is None:
+            self.rng = random.Random(self.seed)
+        if self.seed is None and self.rng_mode == "counter":
+            self.seed = self.rng.getrandbits(64)
+        # nombre de flux déjà consommés par (usage, case)
+        self._stream_counts = {}
+
         # Place les rooms de base
         self.player = Player(self.manor.start)
-        self.manor.cell(self.manor.start).room = EntranceHall()
-        self.manor.cell(self.manor.goal).room = Antechamber()
+        self.manor.place_room(self.manor.start, EntranceHall())
+        self.manor.place_room(self.manor.goal, Antechamber())
+
+        # graphe des portes en bitsets, tenu à jour à chaque pose / porte / déverrouillage
+        self.door_graph = DoorGraph.from_manor(self.manor)
+        # plus courts chemins avec clés (bots, déplacement automatique), mis à jour aux mêmes endroits
+        self.paths = PathFinder.from_manor(self.manor)
 
         # ici pour le ChamberOfMirrors qui ajoute une autre salle pour les choix
         self.extra_room_classes = []
@@ -45,223 +74,163 @@ class Game:
         self.current_draw_position = None   # Coord de la salle qu’on est en train de placer
         self.current_draw_direction = None  # direction depuis la salle du joueur
 
-        # pour Veranda & co : modif temporaire des loots
-        self.temporary_loot_modifiers = {}
+        # pour Veranda & co : modif temporaire des loots, avec durée de vie (salles posées / pas)
+        self.loot_modifiers = ModifierScheduler()
+        # effets actifs sur les tirages de salles (couches après rareté, outils et salle actuelle)
+        self._draw_effects: Tuple[ClassBoost, ...] = ()
+
+        if self.action_log is not None:
+            self.action_log.start(
+                seed=self.seed, rng_mode=self.rng_mode,
+                rows=self.manor.rows, cols=self.manor.cols
+            )
+
+    def recording(self, op: str, *args):
+        """Contexte qui journalise un appel externe (ex: achat au Vendor), sans effet si pas de journal."""
+        if self.action_log is None:
+            return nullcontext()
+        return self.action_log.record(op, *args)
+
+    @property
+    def temporary_loot_modifiers(self) -> Mapping[str, float]:
+        """Multiplicateurs de loot actifs (vue en lecture seule : programmer via loot_modifiers.schedule)."""
+        return MappingProxyType(self.loot_modifiers.modifiers)
+
+    @property
+    def draw_effects(self) -> Tuple[ClassBoost, ...]:
+        """Couches de tirage des effets actifs, dans l'ordre d'ajout."""
+        return self._draw_effects
+
+    def add_draw_effect(self, layer: ClassBoost) -> None:
+        """Active un effet de tirage (remplace l'effet de même source au lieu de l'empiler)."""
+        self._draw_effects = tuple(e for e in self._draw_effects if e.source != layer.source) + (layer,)
+
+    def remove_draw_effect(self, source: str) -> None:
+        self._draw_effects = tuple(e for e in self._draw_effects if e.source != source)
+
+    # =============================
+    # SNAPSHOT / CLONE
+    # =============================
+    def clone(self, rng: Optional[random.Random] = None) -> "Game":
+        """
+        Copie indépendante de la partie (recherche, rollouts). La copie n'est pas journalisée.
+        Par défaut l'état du générateur est copié à l'identique ; passer `rng` (ex: un
+        CounterRandom) évite de copier les ~2.5 Ko d'état du Mersenne Twister.
+        """
+        new = object.__new__(Game)
+        new.__dict__.update(self.__dict__)
+        new.manor = self.manor.clone()
+        new.player = self.player.clone()
+        new.door_graph = self.door_graph.clone()
+        new.paths = self.paths.clone()
+        if rng is None:
+            # copy() passe par __init__ (via __reduce__ ou CounterRandom.copy) : gauss_next compris
+            rng = copy(self.rng)
+        new.rng = rng
+        new.action_log = None
+        new.extra_room_classes = list(self.extra_room_classes)
+        new.current_room_choices = [room.clone() for room in self.current_room_choices]
+        new.loot_modifiers = self.loot_modifiers.clone()
+        new._stream_counts = dict(self._stream_counts)
+        return new
+
+    def snapshot(self) -> "Game":
+        """État figé de la partie, à passer à restore() (réutilisable plusieurs fois)."""
+        return self.clone()
+
+    def restore(self, snapshot: "Game") -> None:
+        """Remet la partie dans l'état d'un snapshot (le journal de self est conservé)."""
+        log = self.action_log
+        self.__dict__.update(snapshot.clone().__dict__)
+        self.action_log = log
 
     # --- outils internes ---
-    # def _neighbor(self, coord: Coord, d: Direction) -> Coord | None:
-    #     dr, dc = Direction.delta(d)
-    #     nxt = Coord(coord.r + dr, coord.c + dc)
-    #     return nxt if self.manor.in_bounds(nxt) else None
-    def _neighbor(self, coord, direction):
-        dr, dc = Direction.delta(direction)
-        nxt = Coord(coord.r + dr, coord.c + dc)
-        if not self.manor.in_bounds(nxt):
-            return None  # <-- IMPORTANT : retourne None si hors manoir
-        return nxt
+    def _neighbor(self, coord: Coord, direction: Direction) -> Coord | None:
+        # table de voisinage du manoir : Coord interné, None si hors manoir
+        return self.manor.topology.neighbor(coord, direction)
+
+    def _stream(self, purpose: int, coord: Coord, *extra: int) -> random.Random:
+        """Générateur à utiliser pour un tirage lié à une case (voir rng_mode)."""
+        if self.rng_mode != "counter":
+            return self.rng
+        key = (purpose, coord.r, coord.c) + extra
+        n = self._stream_counts.get(key, 0)
+        self._stream_counts[key] = n + 1
+        return keyed_stream(self.seed, purpose, coord.r, coord.c, n, *extra)
 
     # =============================
     # GESTION DES OBJETS DE SALLE
     # =============================
     def spawn_objects_for_room(self, coord):
-        # """Place automatiquement des objets dans une salle selon son type."""
-        cell = self.manor.cell(coord)
-        room = cell.room
+        # """Place automatiquement des objets dans une salle selon son type (voir rooms/loot.py)."""
+        room = self.manor.cell(coord).room
         if room is None:
             return  # sécurité
 
-        # on note combien il y avait d’objets AVANT
-        before_len = len(room.contents)
-
-        # petit filet de sécu
-        if not hasattr(self, "temporary_loot_modifiers") or self.temporary_loot_modifiers is None:
-            self.temporary_loot_modifiers = {}
-
-        # petit helper local pour appliquer un boost
-        def boosted_choice(candidates, name_hint=None):
-            """
-            candidates = [obj1, obj2, ...]
-            si on a un multiplicateur sur le nom de l’objet
-            (dans self.temporary_loot_modifiers), on le prend en compte.
-            """
-            if not self.temporary_loot_modifiers:
-                return random.choice(candidates)
-            weights = []
-            for obj in candidates:
-                obj_name = obj.__class__.__name__
-                mult = self.temporary_loot_modifiers.get(obj_name, 1.0)
-                weights.append(mult)
-            return random.choices(candidates, weights=weights, k=1)[0]
-
-        #  ucune apparition dans ces salles
-        if isinstance(room, (EntranceHall, Antechamber)):
-            return
-
-        # =============================
-        # 🧑‍🍳 SALLES DE NOURRITURE
-        # =============================
-        if isinstance(room, Kitchen):
-            # Beaucoup de nourriture (éventuellement boostée par Veranda)
-            food = [Apple(), Banana(), Cake(), Sandwich(), Meal()]
-            obj = boosted_choice(food, name_hint="Food")
-            room.contents.append(obj)
-
-        elif isinstance(room, Pantry):
-            # Nourriture plus forte
-            strong_food = [Sandwich(), Meal()]
-            obj = boosted_choice(strong_food, name_hint="FoodStrong")
-            room.contents.append(obj)
-
-        # =============================
-        # 🌿 SALLES EXTÉRIEURES
-        # =============================
-        elif isinstance(room, Garden):
-            room.contents.append(DigSpot())
-
-        # =============================
-        # 🔒 SALLES À CASIERS
-        # =============================
-        elif isinstance(room, LockerRoom):
-            room.contents.append(Locker())
-
-        # =============================
-        # 💎 SALLE TRÉSOR = UtilityRoom
-        # =============================
-        elif isinstance(room, UtilityRoom):
-            room.contents.append(Chest())
-            if random.random() < 0.5:
-                perm = [ShovelObj(), HammerObj(), LockpickKitObj(), MetalDetectorObj()]
-                obj = boosted_choice(perm, name_hint="Permanent")
-                room.contents.append(obj)
-
-        # =============================
-        # ⚔️ ARMORY
-        # =============================
-        elif isinstance(room, Armory):
-            perm = [ShovelObj(), HammerObj(), LockpickKitObj(), MetalDetectorObj()]
-            obj = boosted_choice(perm, name_hint="Permanent")
-            room.contents.append(obj)
-
-        # =============================
-        # 📚 LIBRARY
-        # =============================
-        elif isinstance(room, Library):
-            rare = [RabbitFootObj(), ShovelObj(), MetalDetectorObj(), Apple()]
-            obj = boosted_choice(rare, name_hint="LibraryLoot")
-            room.contents.append(obj)
-
-        # =============================
-        # 🧱 Plain Room
-        # =============================
-        elif isinstance(room, PlainRoom):
-            if random.random() < 0.2:
-                simple = [Apple(), Banana(), ShovelObj()]
-                obj = boosted_choice(simple, name_hint="PlainLoot")
-                room.contents.append(obj)
-        # sinon ne rien faire
-
-        # =============================
-       
-        # =============================
-        # condition : il existait un boost ET la salle n’a rien ajouté
-         #  FALLBACK SI une salle boostée (Veranda) n’a finalement rien eu
-        # 60% de chance de forcer un loot de nourriture (au lieu de 100%)
-        if self.temporary_loot_modifiers and len(room.contents) == before_len:
-            if random.random() < 0.50:  # 50% de chance
-                fallback_food = [Apple(), Banana(), Cake(), Sandwich(), Meal()]
-                try:
-                    forced = boosted_choice(fallback_food)
-                except NameError:
-                    forced = random.choice(fallback_food)
-                room.contents.append(forced)
+        # loot du type de salle (boosté par Veranda), seuls les objets retenus sont créés ;
+        # sans modificateur actif, tirage uniforme
+        room.contents.extend(roll_loot(room, self.rng, self.loot_modifiers.modifiers))
 
     # =============================
     # TIRAGE DES PIÈCES (partie 2.7)
     # =============================
-    def draw_three_rooms(self, r: int, c: int, direction: Direction) -> list:
-        possible_rooms = [
-            PlainRoom(), Kitchen(), Pantry(), LockerRoom(), UtilityRoom(),
-            Garden(), Armory(), Library(), Furnace(), Greenhouse(),
-            Solarium(), Veranda(), MaidsChamber(),
-            WeightRoom(), MasterBedroom(), ChamberOfMirrors()
-        ]
-
-        # Pour ChamberOfMirrors, la salle Rumpus est ajoutée dynamiquement
-        for cls in self.extra_room_classes:
-            possible_rooms.append(cls())
-
-        # filtrage par conditions de placement + porte dans la bonne direction
-        filtered_rooms = [
-            room for room in possible_rooms
-            if room.can_be_placed(r, c) and direction in room.possible_doors
-        ]
+    def _draw_table(self, r: int, c: int, direction: Direction) -> Optional[DrawTable]:
+        """Table de tirage pour la case (r, c) tirée depuis `direction` (None si aucun candidat)."""
+        # Catalogue précalculé : salles éligibles par (r, c, direction),
+        # la salle Rumpus (ChamberOfMirrors) y est ajoutée dynamiquement
+        catalog = get_catalog(
+            DRAWABLE_ROOM_CLASSES + tuple(self.extra_room_classes),
+            self.manor.rows, self.manor.cols
+        )
+        filtered_rooms = catalog.candidates(r, c, direction)
 
         if not filtered_rooms:
-            return [PlainRoom()]
-
-        # poids de base selon la rareté
-        weights = [pow(1 / 3, room.rarity) for room in filtered_rooms]
-
-        # Ajustements selon l'inventaire (ex: détecteur, patte de lapin)
-        inv = self.player.inventory
-        for i, room in enumerate(filtered_rooms):
-            if inv.has_tool(PermanentItem.METAL_DETECTOR):
-                if isinstance(room, (UtilityRoom, Armory)):
-                    weights[i] *= 1.8
-            if inv.has_tool(PermanentItem.RABBIT_FOOT):
-                if isinstance(room, (Pantry, PlainRoom, Kitchen)):
-                    weights[i] *= 1.25
+            return None
 
         # Modificateurs contextuels (fournis par la room actuelle)
         try:
             cur_room = self.manor.cell(self.player.pos).room
         except Exception:
             cur_room = None
-        if cur_room is not None:
-            mods = getattr(cur_room, 'draw_modifiers', {}) or {}
-            for i, room in enumerate(filtered_rooms):
-                cls_name = room.__class__.__name__
-                if cls_name in mods:
-                    try:
-                        mult = float(mods[cls_name])
-                        weights[i] *= mult
-                    except Exception:
-                        pass
-
-        # Sélection finale : 3 rooms distinctes,
-        # avec si possible au moins une room gratuite
-        selected_rooms = []
-        zero_cost_found = False
-        while len(selected_rooms) < 3:
-            if len(selected_rooms) == 2 and not zero_cost_found:
-                free_rooms = [r for r in filtered_rooms if r.gem_cost == 0]
-                if free_rooms:
-                    room = random.choices(
-                        free_rooms,
-                        weights=[pow(1 / 3, r.rarity) for r in free_rooms],
-                        k=1
-                    )[0]
-                    selected_rooms.append(room)
-                    break
-
-            room = random.choices(filtered_rooms, weights=weights, k=1)[0]
-            if room.gem_cost == 0:
-                zero_cost_found = True
-            if room not in selected_rooms:
-                selected_rooms.append(room)
-
-        return selected_rooms
+        layers = active_layers(self.player.inventory, cur_room, self._draw_effects)
+
+        # poids (rareté, outils, modificateurs) en cache
+        return ROOM_SAMPLER.table_for(filtered_rooms, layers)
+
+    def draw_three_rooms(self, r: int, c: int, direction: Direction) -> list:
+        table = self._draw_table(r, c, direction)
+        if table is None:
+            return [PlainRoom()]
+
+        # 3 rooms distinctes avec si possible au moins une room gratuite
+        rng = self._stream(STREAM_DRAW, self.manor.topology.coord(r, c))
+        selected_rooms = ROOM_SAMPLER.sample(table, rng, k=3)
+
+        # seules les pièces proposées sont réellement instanciées
+        return [spec.instantiate() for spec in selected_rooms]
+
+    def draw_distribution(self, coord: Coord, direction: Direction) -> Mapping[Type[Room], float]:
+        """
+        Probabilité exacte que chaque type de salle soit parmi les 3 choix d'un tirage en `coord`
+        depuis `direction`, dans l'état actuel (placement, portes, rareté, outils, draw_modifiers
+        de la salle du joueur, effets de tirage actifs, règle de la salle gratuite). Sans aléa : rien n'est tiré.
+        Mis en cache avec la table de tirage (candidats, couches actives).
+        """
+        table = self._draw_table(coord.r, coord.c, direction)
+        if table is None:
+            return MappingProxyType({PlainRoom: 1.0})
+        return ROOM_SAMPLER.inclusion(table, k=3)
 
     def retry_draw(self, r: int, c: int, direction: Direction) -> list:
         # Re-tire 3 salles si le joueur a des dés (dice > 0), et consomme 1 dé
-        if self.player.inventory.dice <= 0:
+        if not self.player.inventory.spend("dice", 1):
             return []
-        self.player.inventory.dice -= 1
         return self.draw_three_rooms(r, c, direction)
 
     # =============================
     # GESTION DES PORTES / SALLES
     # =============================
+    @recorded("open", lambda d: (d.name,))
     def open_or_place(self, d: Direction) -> bool:
         """
         Ouvre/pose une salle adjacente dans la direction d, si possible.
@@ -286,28 +255,38 @@ class Game:
             # une pièce vient d’être posée → ne rien faire de plus ici
             return True
 
-        # sinon la salle existe déjà → on ne fait que créer la porte
+        # sinon la salle existe déjà → on ne fait que créer la porte (une seule par mur)
         cur_cell = self.manor.cell(cur)
-        if d not in cur_cell.doors:
-            lock_level = self._random_lock_for_row(nxt.r)
-            cur_cell.doors[d] = Door(_lock=lock_level, _leads_to=nxt)
-
-        # porte retour
-        back = {
-            Direction.UP: Direction.DOWN,
-            Direction.DOWN: Direction.UP,
-            Direction.LEFT: Direction.RIGHT,
-            Direction.RIGHT: Direction.LEFT
-        }[d]
+        back = OPPOSITE[d]
+        door = cur_cell.doors.get(d)
+        if door is None:
+            # porte déjà ouverte depuis l'autre case : c'est la même
+            door = tgt_cell.doors.get(back)
+            if door is None:
+                lock_level = self._random_lock_for_row(nxt.r, self._stream(STREAM_LOCK, nxt, d.value))
+                door = Door(lock_level, cur, nxt)
+            self.manor.add_door(cur, d, door)
+            self._door_added(cur, d, nxt, door.lock)
+
+        # porte retour : le même objet, vu depuis la salle voisine
         if back not in tgt_cell.doors and back in tgt_cell.room.possible_doors:
-            lock_back = cur_cell.doors[d].lock
-            tgt_cell.doors[back] = Door(_lock=lock_back, _leads_to=cur)
+            self.manor.add_door(nxt, back, door)
+            self._door_added(nxt, back, cur, door.lock)
 
         return True
 
+    def _door_added(self, coord: Coord, d: Direction, leads_to: Coord, lock: LockLevel) -> None:
+        self.door_graph.add_door(coord, d, lock)
+        self.paths.add_door(coord, d, leads_to, lock)
+
+    def _door_unlocked(self, coord: Coord, d: Direction) -> None:
+        self.door_graph.set_lock(coord, d, LockLevel.UNLOCKED)
+        self.paths.set_lock(coord, d, LockLevel.UNLOCKED)
+
     # =============================
     # DÉPLACEMENT / INTERACTIONS
     # =============================
+    @recorded("move", lambda d: (d.name,))
     def move(self, d: Direction) -> bool:
         # Se déplacer via une porte ouverte; consomme 1 step.
         cur_cell = self.manor.cell(self.player.pos)
@@ -325,12 +304,12 @@ class Game:
         self._unlock_both_sides(cur, d)
 
         # Consomme 1 pas
-        if self.player.inventory.steps <= 0:
+        if not self.player.inventory.spend("steps", 1):
             return False
-        self.player.inventory.steps -= 1
+        self.loot_modifiers.tick(STEPS)
 
         # Déplacement
-        self.player.pos = door.leads_to
+        self.player.pos = door.other_side(cur)
 
         # Effet de salle à l'entrée
         new_cell = self.manor.cell(self.player.pos)
@@ -342,9 +321,40 @@ class Game:
     def reached_exit(self) -> bool:
         return self.player.pos == self.manor.goal
 
+    def is_goal_reachable(self) -> bool:
+        """L'antichambre est-elle atteignable par les portes existantes avec les clés actuelles ?"""
+        inv = self.player.inventory
+        return self.door_graph.goal_reachable(
+            self.player.pos, self.manor.goal, inv.keys, inv.has_tool(PermanentItem.LOCKPICK_KIT)
+        )
+
+    def route_to(self, target: Optional[Coord] = None) -> Optional[Route]:
+        """Plus court chemin du joueur vers target (l'antichambre par défaut) avec ses clés actuelles."""
+        inv = self.player.inventory
+        return self.paths.route(
+            self.player.pos, target or self.manor.goal,
+            inv.keys, inv.has_tool(PermanentItem.LOCKPICK_KIT)
+        )
+
+    def is_dead_run(self) -> bool:
+        """
+        Partie perdue : plus de pas, ou objectif inatteignable sans rien à poser/ouvrir
+        et aucun objet à ramasser dans les salles atteignables (source possible de clés).
+        """
+        inv = self.player.inventory
+        if inv.steps <= 0:
+            return True
+        graph = self.door_graph
+        lockpick = inv.has_tool(PermanentItem.LOCKPICK_KIT)
+        if not graph.is_dead(self.player.pos, self.manor.goal, inv.keys, lockpick):
+            return False
+        reach = graph.reachable(self.player.pos, inv.keys, lockpick)
+        return not any(self.manor.cell(c).room.contents for c in graph.cells(reach))
+
     # =============================
     # OBJETS
     # =============================
+    @recorded("place", lambda coord, obj: ([coord.r, coord.c], type(obj).__name__))
     def place_object_at(self, coord, obj) -> bool:
         # Place un objet dans la room à coord. Retourne False si pas de room.
         if not self.manor.in_bounds(coord):
@@ -355,6 +365,7 @@ class Game:
         cell.room.contents.append(obj)
         return True
 
+    @recorded("pick")
     def pick_up_here(self) -> str | None:
         # Interagit avec le premier objet de la room du joueur; retire s'il est consommé.
         cell = self.manor.cell(self.player.pos)
@@ -369,87 +380,25 @@ class Game:
     # =============================
     # VERROUILLAGE (2.8)
     # =============================
-    def _random_lock_for_row(self, row: int) -> LockLevel:
-        # Tire aléatoirement le niveau de verrouillage d'une porte en fonction
-        # de la rangée (0 = haut / 8 = bas).
-        row = max(0, min(self.manor.rows - 1, row))  # sécurité
-
-        # Règles extrêmes fixes
-        if row == self.manor.rows - 1:  # rangée 8 (bas / départ)
-            return LockLevel.UNLOCKED
-        if row == 0:  # rangée 0 (haut / antichambre)
-            return LockLevel.DOUBLE_LOCKED
-
-        p = random.random()
-
-        if row == 7:
-            return LockLevel.UNLOCKED if p < 0.80 else LockLevel.LOCKED
-        elif row == 6:
-            if p < 0.65:
-                return LockLevel.UNLOCKED
-            elif p < 0.95:
-                return LockLevel.LOCKED
-            else:
-                return LockLevel.DOUBLE_LOCKED
-        elif row == 5:
-            if p < 0.50:
-                return LockLevel.UNLOCKED
-            elif p < 0.90:
-                return LockLevel.LOCKED
-            else:
-                return LockLevel.DOUBLE_LOCKED
-        elif row == 4:
-            if p < 0.35:
-                return LockLevel.UNLOCKED
-            elif p < 0.80:
-                return LockLevel.LOCKED
-            else:
-                return LockLevel.DOUBLE_LOCKED
-        elif row == 3:
-            if p < 0.25:
-                return LockLevel.UNLOCKED
-            elif p < 0.70:
-                return LockLevel.LOCKED
-            else:
-                return LockLevel.DOUBLE_LOCKED
-        elif row == 2:
-            if p < 0.15:
-                return LockLevel.UNLOCKED
-            elif p < 0.60:
-                return LockLevel.LOCKED
-            else:
-                return LockLevel.DOUBLE_LOCKED
-        elif row == 1:
-            if p < 0.05:
-                return LockLevel.UNLOCKED
-            elif p < 0.40:
-                return LockLevel.LOCKED
-            else:
-                return LockLevel.DOUBLE_LOCKED
-
-        return LockLevel.UNLOCKED
+    def _random_lock_for_row(self, row: int, rng: Optional[random.Random] = None) -> LockLevel:
+        # Tire le niveau de verrouillage d'une porte en fonction de la rangée (0 = haut),
+        # d'après la table de verrous de la hauteur du manoir (voir world/lock_table.py)
+        return lock_table(self.manor.rows).level(row, rng or self.rng)
 
     def _unlock_both_sides(self, from_coord: Coord, d: Direction) -> None:
-        # """Met la porte traversée ET sa porte jumelle en UNLOCKED."""
+        # """Met la porte traversée en UNLOCKED (partagée : vaut pour les deux côtés du mur)."""
         cur_cell = self.manor.cell(from_coord)
         door = cur_cell.doors.get(d)
-        if not door:
+        if not door or door.lock == LockLevel.UNLOCKED:
             return
-
-        # Déverrouille la porte traversée
         door.lock = LockLevel.UNLOCKED
 
-        # Déverrouille la porte jumelle (sens inverse) si elle existe
-        back = {
-            Direction.UP: Direction.DOWN,
-            Direction.DOWN: Direction.UP,
-            Direction.LEFT: Direction.RIGHT,
-            Direction.RIGHT: Direction.LEFT,
-        }[d]
-        tgt_cell = self.manor.cell(door.leads_to)
-        twin = tgt_cell.doors.get(back)
-        if twin:
-            twin.lock = LockLevel.UNLOCKED
+        # graphes prévenus pour chaque côté où la porte est visible
+        self._door_unlocked(from_coord, d)
+        back = OPPOSITE[d]
+        nxt = door.other_side(from_coord)
+        if back in self.manor.cell(nxt).doors:
+            self._door_unlocked(nxt, back)
 
     # =============================
     # PARTIE 2.7 / 2.8
@@ -457,24 +406,25 @@ class Game:
     def get_current_room_choices(self) -> list:
         return self.current_room_choices
 
+    @recorded("choose")
     def choose_room(self, index: int) -> bool:
         if not self.current_room_choices or not 0 <= index < len(self.current_room_choices):
             return False
 
         chosen_room = self.current_room_choices[index]
-        tgt_cell = self.manor.cell(self.current_draw_position)
 
         # Cohérence : la pièce choisie doit autoriser une porte dans la direction du tirage
         if self.current_draw_direction not in chosen_room.possible_doors:
             return False
-        # Vérifier le coût en gemmes
-        if self.player.inventory.gems < chosen_room.gem_cost:
+        # Vérifier le coût en gemmes et le déduire
+        if not self.player.inventory.spend("gems", chosen_room.gem_cost):
             return False
 
-        # Déduction du coût et pose
-        self.player.inventory.gems -= chosen_room.gem_cost
-        tgt_cell.room = chosen_room
+        # Pose
+        self.manor.place_room(self.current_draw_position, chosen_room)
+        self.door_graph.place_room(self.current_draw_position)
         self.spawn_objects_for_room(self.current_draw_position)
+        self.loot_modifiers.tick(ROOMS)
 
         # Réinitialisation complète après le choix
         self.current_room_choices = []
@@ -482,6 +432,7 @@ class Game:
         self.current_draw_direction = None
         return True
 
+    @recorded("redraw")
     def redraw_rooms(self) -> bool:
         # Re-tire une nouvelle série de 3 salles pour la même position/direction, en consommant 1 dé
         if not self.current_draw_position or not self.current_draw_direction:
@@ -0,0 +1,90 @@
+from __future__ import annotations
+from heapq import heappop, heappush
+from typing import Dict, List, Mapping, Tuple
+
+# horloges de durée de vie (entiers stables, comme les usages de game/rng.py)
+ROOMS = 0   # salles posées
+STEPS = 1   # pas faits
+
+CLOCKS = (ROOMS, STEPS)
+
+
+class ModifierScheduler:
+    """
+    Modificateurs de loot temporaires (nom de classe d'objet -> multiplicateur), chacun avec
+    une durée de vie en salles posées ou en pas faits.
+    Un effet est identifié par sa source : le reprogrammer (ex: repasser par la Veranda)
+    remplace l'effet précédent au lieu de l'empiler. Les effets actifs de sources différentes
+    se multiplient.
+    Expiration par tas d'échéances (un par horloge) : un tick sans échéance atteinte ne coûte
+    qu'une comparaison. Les multiplicateurs combinés sont recalculés seulement quand un effet
+    commence ou expire ; sans effet actif, `modifiers` est vide (chemin de loot uniforme).
+    """
+    def __init__(self):
+        self._clocks: List[int] = [0] * len(CLOCKS)
+        # par horloge : (échéance, n° de programmation, source)
+        self._heaps: Tuple[List[tuple], ...] = tuple([] for _ in CLOCKS)
+        # source -> (n° de programmation, multiplicateurs) ; une entrée de tas dont le n° ne
+        # correspond plus (effet reprogrammé) est ignorée quand elle sort
+        self._effects: Dict[str, Tuple[int, Mapping[str, float]]] = {}
+        self._seq = 0
+        self._modifiers: Dict[str, float] = {}
+
+    def clone(self) -> "ModifierScheduler":
+        new = object.__new__(ModifierScheduler)
+        new._clocks = list(self._clocks)
+        new._heaps = tuple(list(heap) for heap in self._heaps)
+        new._effects = dict(self._effects)
+        new._seq = self._seq
+        new._modifiers = dict(self._modifiers)
+        return new
+
+    @property
+    def modifiers(self) -> Mapping[str, float]:
+        """Multiplicateurs combinés des effets actifs (vide si aucun)."""
+        return self._modifiers
+
+    def __bool__(self) -> bool:
+        return bool(self._effects)
+
+    def clock(self, clock: int) -> int:
+        """Valeur actuelle d'une horloge (salles posées ou pas faits depuis le début)."""
+        return self._clocks[clock]
+
+    def schedule(self, source: str, multipliers: Mapping[str, float], lifetime: int, clock: int = ROOMS) -> None:
+        """Active `multipliers` pour les `lifetime` prochains ticks de `clock` (remplace l'effet de même source)."""
+        if lifetime <= 0:
+            self.cancel(source)
+            return
+        self._seq += 1
+        self._effects[source] = (self._seq, dict(multipliers))
+        heappush(self._heaps[clock], (self._clocks[clock] + lifetime, self._seq, source))
+        self._combine()
+
+    def cancel(self, source: str) -> None:
+        """Retire l'effet de `source` (son entrée de tas sera ignorée à l'échéance)."""
+        if self._effects.pop(source, None) is not None:
+            self._combine()
+
+    def tick(self, clock: int, n: int = 1) -> None:
+        """Avance une horloge de n et retire les effets arrivés à échéance."""
+        now = self._clocks[clock] = self._clocks[clock] + n
+        heap = self._heaps[clock]
+        if not heap or heap[0][0] > now:
+            return
+        changed = False
+        while heap and heap[0][0] <= now:
+            _, seq, source = heappop(heap)
+            effect = self._effects.get(source)
+            if effect is not None and effect[0] == seq:
+                del self._effects[source]
+                changed = True
+        if changed:
+            self._combine()
+
+    def _combine(self) -> None:
+        combined: Dict[str, float] = {}
+        for _, multipliers in self._effects.values():
+            for name, mult in multipliers.items():
+                combined[name] = combined.get(name, 1.0) * mult
+        self._modifiers = combined
@@ -0,0 +1,87 @@
+from __future__ import annotations
+from hashlib import blake2b
+import random
+
+# Flux aléatoires "à compteur" : chaque tirage dépend seulement de
+# (graine, usage, case, numéro du tirage sur cette case), pas de l'ordre global des appels.
+
+MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+
+# usages (entiers stables : le hash() des str change d'un processus à l'autre)
+STREAM_DRAW = 1   # tirage des 3 pièces sur une case
+STREAM_LOCK = 2   # verrou d'une porte vers une case
+
+RNG_MODES = ("sequential", "counter")
+
+
+def _mix64(z: int) -> int:
+    """Fonction de mélange de SplitMix64."""
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+    return z ^ (z >> 31)
+
+
+def stream_key(seed: int, *parts: int) -> int:
+    """Clé 64 bits dérivée de la graine et d'une suite d'entiers (usage, r, c, n...)."""
+    h = _mix64((seed + _GOLDEN) & MASK64)
+    for p in parts:
+        h = _mix64(((h ^ (p & MASK64)) + _GOLDEN) & MASK64)
+    return h
+
+
+class CounterRandom(random.Random):
+    """
+    Générateur SplitMix64 compatible random.Random (random, choice, choices, sample...).
+    Très bon marché à créer : un flux par (case, tirage) ne coûte qu'un entier d'état.
+    """
+    def __init__(self, key: int = 0):
+        self._state = key & MASK64
+        super().__init__()
+
+    def seed(self, a=None, version: int = 2) -> None:
+        # appelé par random.Random.__init__ avec a=None : on garde la clé.
+        # Pas de hash() : celui des str change d'un processus à l'autre (PYTHONHASHSEED)
+        if a is None:
+            return
+        self.gauss_next = None
+        if isinstance(a, int):
+            self._state = a & MASK64
+        else:
+            self._state = int.from_bytes(blake2b(repr(a).encode(), digest_size=8).digest(), "little")
+
+    def _next64(self) -> int:
+        self._state = (self._state + _GOLDEN) & MASK64
+        return _mix64(self._state)
+
+    def random(self) -> float:
+        return (self._next64() >> 11) * (1.0 / (1 << 53))
+
+    def getrandbits(self, k: int) -> int:
+        if k <= 0:
+            return 0
+        bits, n = 0, 0
+        while n < k:
+            bits = (bits << 64) | self._next64()
+            n += 64
+        return bits >> (n - k)
+
+    def getstate(self):
+        # comme random.Random : le second tirage de gauss() en attente fait partie de l'état
+        return self._state, self.gauss_next
+
+    def setstate(self, state) -> None:
+        self._state, self.gauss_next = state
+
+    def copy(self) -> "CounterRandom":
+        """Copie indépendante (même état, même gauss() en attente)."""
+        new = CounterRandom(self._state)
+        new.gauss_next = self.gauss_next
+        return new
+
+    __copy__ = copy
+
+
+def keyed_stream(seed: int, purpose: int, r: int, c: int, n: int, *extra: int) -> CounterRandom:
+    """Flux du n-ième tirage `purpose` sur la case (r, c) : utilisable hors partie (préchargement, workers)."""
+    return CounterRandom(stream_key(seed, purpose, r, c, n, *extra))
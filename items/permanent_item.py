@@ -1,9 +1,20 @@
-from enum import Enum, auto
+from enum import IntFlag, auto
+from typing import Iterable
 
-class PermanentItem(Enum):
+class PermanentItem(IntFlag):
+    # un bit par outil : un ensemble d'outils tient dans un int (voir Inventory.tool_mask)
     SHOVEL = auto()
     HAMMER = auto()
     LOCKPICK_KIT = auto()
     METAL_DETECTOR = auto()
     RABBIT_FOOT = auto()
     SMALL_BUSINESS = auto()  # Fragment qui se transforme en clé quand on en a 10
+
+
+def tool_mask(tools: Iterable[PermanentItem]) -> int:
+    """Masque (int) d'un ensemble d'outils."""
+    mask = 0
+    for tool in tools:
+        # _value_ : int brut, `mask | tool` passerait par les opérateurs (lents) d'IntFlag
+        mask |= tool._value_
+    return mask
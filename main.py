@@ -1,3 +1,6 @@
+import argparse
+import sys
+
 from world.manor import Manor
 from game.game import Game
 from enums.direction import Direction
@@ -24,5 +27,48 @@ def main():
 
     print("Reached exit?", game.reached_exit(), "pos:", game.player.pos, "steps:", game.player.inventory.steps)
 
+def simulate_cli(argv: list[str]) -> None:
+    # Mode headless : python main.py simulate --games 1000 --policy greedy
+    from sim.simulation import MANOR_STORAGES, simulate
+    from sim.policies import POLICIES
+    from game.rng import RNG_MODES
+
+    parser = argparse.ArgumentParser(prog="main.py simulate", description="Simulation de parties sans pygame.")
+    parser.add_argument("--games", type=int, default=1000, help="nombre de parties")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="greedy", help="politique de décision")
+    parser.add_argument("--workers", type=int, default=None, help="processus (défaut : tous les coeurs)")
+    parser.add_argument("--seed", type=int, default=0, help="graine de la première partie")
+    parser.add_argument("--max-actions", type=int, default=2000, help="actions max par partie")
+    parser.add_argument("--rng", choices=RNG_MODES, default="sequential",
+                        help="counter : même contenu de manoir pour une graine, quelle que soit la politique")
+    parser.add_argument("--storage", choices=sorted(MANOR_STORAGES), default="sparse",
+                        help="compact : grille en colonnes uint8 (moins de mémoire par partie)")
+    parser.add_argument("--rows", type=int, default=9, help="hauteur du manoir")
+    parser.add_argument("--cols", type=int, default=5, help="largeur du manoir")
+    args = parser.parse_args(argv)
+
+    report = simulate(args.games, policy=args.policy, workers=args.workers,
+                      seed=args.seed, max_actions=args.max_actions, rng_mode=args.rng, storage=args.storage,
+                      rows=args.rows, cols=args.cols)
+    print(report.summary())
+
+def replay_cli(argv: list[str]) -> None:
+    # Rejeu headless : python main.py replay replays/*.jsonl
+    from sim.replay import replay_many
+
+    parser = argparse.ArgumentParser(prog="main.py replay", description="Rejoue des sessions enregistrées.")
+    parser.add_argument("paths", nargs="+", help="journaux .jsonl")
+    parser.add_argument("--workers", type=int, default=None, help="processus (défaut : tous les coeurs)")
+    args = parser.parse_args(argv)
+
+    for res in replay_many(args.paths, workers=args.workers):
+        print(f"{res.path}: {res.outcome}, pas restants={res.steps_remaining}, "
+              f"salles posées={res.rooms_placed}, actions={res.actions}")
+
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "simulate":
+        simulate_cli(sys.argv[2:])
+    elif len(sys.argv) > 1 and sys.argv[1] == "replay":
+        replay_cli(sys.argv[2:])
+    else:
+        main()
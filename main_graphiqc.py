@@ -1,6 +1,7 @@
-import pygame, sys
+import pygame, sys, os, time
 from world.manor import Manor
 from game.game import Game
+from game.action_log import ActionLog
 from enums.direction import Direction
 from ui.renderer import Renderer
 
@@ -10,8 +11,17 @@ from objects.interactive import Chest, Vendor  #: Vendor pour le shop dans kitch
 
 
 def run():
+    # chaque session est enregistrée dans replays/ (rejouable avec : python main.py replay <fichier>)
+    os.makedirs("replays", exist_ok=True)
+    path = os.path.join("replays", time.strftime("session-%Y%m%d-%H%M%S.jsonl"))
+    # le with ferme (et vide) le journal sur tous les chemins de sortie, sys.exit compris
+    with open(path, "w", encoding="utf-8") as log_file:
+        play(log_file)
+
+
+def play(log_file):
     manor = Manor()
-    game = Game(manor)
+    game = Game(manor, action_log=ActionLog(sink=log_file))
 
     # Placer des objets permanents dans la salle de départ
     game.place_object_at(game.player.pos, ShovelObj())
@@ -1,11 +1,12 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Hashable, Mapping, Optional
 from enums.direction import Direction
 from models.door import Door
 from rooms.room_base import Room
 
-@dataclass
+@dataclass(slots=True)
 class Cell:
     _room: Room | None = None
     _doors: Dict[Direction, Door] = field(default_factory=dict)
@@ -25,3 +26,52 @@ class Cell:
     @doors.setter
     def doors(self, value: Dict[Direction, Door]) -> None:
         self._doors = value
+
+    def clone(self, doors: Optional[Dict[Hashable, Door]] = None) -> "Cell":
+        """
+        Copie indépendante : salle (avec son état) et portes.
+        `doors` (id de porte, ou mur pour un CompactManor -> copie) est partagé entre les cases
+        d'un même manoir pour qu'une porte commune à deux cases reste un seul objet dans la copie.
+        """
+        if self._room is None and not self._doors:
+            return Cell()
+        if doors is None:
+            doors = {}
+        copies = {}
+        for d, door in self._doors.items():
+            copy = doors.get(id(door))
+            if copy is None:
+                copy = doors[id(door)] = door.clone()
+            copies[d] = copy
+        return Cell(self._room.clone() if self._room is not None else None, copies)
+
+
+_NO_DOORS: Mapping[Direction, Door] = MappingProxyType({})
+
+
+class EmptyCell(Cell):
+    """
+    Case jamais utilisée (ni salle ni porte), en lecture seule et partagée : lire une case
+    vide n'alloue rien. Les poses passent par Manor.place_room / Manor.add_door.
+    """
+    __slots__ = ()
+
+    @property
+    def room(self) -> None:
+        return None
+
+    @room.setter
+    def room(self, value) -> None:
+        raise TypeError("Case vide en lecture seule : poser une salle avec Manor.place_room")
+
+    @property
+    def doors(self) -> Mapping[Direction, Door]:
+        return _NO_DOORS
+
+    @doors.setter
+    def doors(self, value) -> None:
+        raise TypeError("Case vide en lecture seule : ajouter une porte avec Manor.add_door")
+
+
+# case vide partagée par tous les manoirs
+EMPTY_CELL = EmptyCell()
@@ -1,7 +1,16 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Coord:
+    # une seule instance par case et par taille de manoir : voir Topology.coord (world/topology.py)
     r: int
     c: int
+    # hash calculé une fois (clé de dict la plus fréquente du jeu), hors égalité et repr
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_hash", hash((self.r, self.c)))
+
+    def __hash__(self) -> int:
+        return self._hash
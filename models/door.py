@@ -1,14 +1,24 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from typing import Tuple
 from enums.lock_level import LockLevel
 from models.coord import Coord
 from models.inventory import Inventory
 from items.permanent_item import PermanentItem
 
-@dataclass
+_LOCKPICK_KIT = PermanentItem.LOCKPICK_KIT._value_
+
+@dataclass(slots=True)
 class Door:
+    """
+    Porte d'un mur : un seul objet, référencé par les deux cases qu'il sépare
+    (Cell.doors des deux côtés), le verrou n'est donc stocké qu'une fois.
+    Une porte peut n'exister que d'un côté si la salle voisine n'autorise pas de porte sur ce mur.
+    La case atteinte dépend de celle d'où on regarde : utiliser other_side(case).
+    """
     _lock: LockLevel
-    _leads_to: Coord
+    _a: Coord   # case d'où la porte a été ouverte
+    _b: Coord   # case de l'autre côté du mur
 
     @property
     def lock(self) -> LockLevel:
@@ -19,17 +29,20 @@ class Door:
         self._lock = value
 
     @property
-    def leads_to(self) -> Coord:
-        return self._leads_to
+    def sides(self) -> Tuple[Coord, Coord]:
+        return self._a, self._b
+
+    def other_side(self, coord: Coord) -> Coord:
+        """Case de l'autre côté du mur, vue depuis coord."""
+        return self._a if coord == self._b else self._b
 
-    @leads_to.setter
-    def leads_to(self, value: Coord) -> None:
-        self._leads_to = value
+    def clone(self) -> "Door":
+        return Door(self._lock, self._a, self._b)
 
     def can_open(self, inv: Inventory) -> bool:
         if self._lock == LockLevel.UNLOCKED:
             return True
-        if self._lock == LockLevel.LOCKED and PermanentItem.LOCKPICK_KIT in inv.tools:
+        if self._lock == LockLevel.LOCKED and inv.tool_mask & _LOCKPICK_KIT:
             return True
         return inv.keys > 0
 
@@ -37,9 +50,6 @@ class Door:
         """Consomme une clé si nécessaire (sauf lockpick sur niveau 1)."""
         if self._lock == LockLevel.UNLOCKED:
             return True
-        if self._lock == LockLevel.LOCKED and PermanentItem.LOCKPICK_KIT in inv.tools:
+        if self._lock == LockLevel.LOCKED and inv.tool_mask & _LOCKPICK_KIT:
             return True
-        if inv.keys <= 0:
-            return False
-        inv.keys -= 1
-        return True
+        return inv.spend("keys", 1)
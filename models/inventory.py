@@ -1,9 +1,9 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Set
+from typing import Dict
 from items.permanent_item import PermanentItem
 
-@dataclass
+@dataclass(slots=True)
 class Inventory:
     # Consommables
     _steps: int = 72
@@ -11,10 +11,12 @@ class Inventory:
     _gems: int = 2
     _keys: int = 0
     _dice: int = 1
-    # Permanents
-    _tools: Set[PermanentItem] = field(default_factory=set)
+    # Permanents : masque de bits PermanentItem (un int, copié et haché sans coût)
+    _tools: int = 0
     # Compteur pour Small Business
     _small_business_count: int = 0
+    # Total dépensé via spend(), par ressource (stats de simulation)
+    _spent: Dict[str, int] = field(default_factory=dict)
 
     @property
     def steps(self) -> int:
@@ -57,23 +59,41 @@ class Inventory:
         self._dice = value
 
     @property
-    def tools(self) -> Set[PermanentItem]:
+    def tools(self) -> PermanentItem:
+        """Outils possédés, en drapeau combiné (`outil in inv.tools`, itérable, faux si vide)."""
+        return PermanentItem(self._tools)
+
+    @property
+    def tool_mask(self) -> int:
+        """Outils possédés en int brut, pour les tests de masque (inv.tool_mask & masque)."""
         return self._tools
 
+    @property
+    def spent(self) -> Dict[str, int]:
+        return self._spent
+
+    def clone(self) -> "Inventory":
+        return Inventory(
+            self._steps, self._gold, self._gems, self._keys, self._dice,
+            self._tools, self._small_business_count, dict(self._spent)
+        )
+
     # --- utilitaires de base ---
     def spend(self, resource: str, amount: int) -> bool:
         """Tente de dépenser `amount` de (steps|gold|gems|keys|dice)."""
-        val = getattr(self, resource)
+        slot = "_" + resource  # accès direct au slot, sans passer par la property
+        val = getattr(self, slot)
         if val < amount:
             return False
-        setattr(self, resource, val - amount)
+        setattr(self, slot, val - amount)
+        self._spent[resource] = self._spent.get(resource, 0) + amount
         return True
 
     def add_tool(self, tool: PermanentItem) -> None:
-        self._tools.add(tool)
+        self._tools |= tool._value_
 
     def has_tool(self, tool: PermanentItem) -> bool:
-        return tool in self._tools
+        return self._tools & tool._value_ != 0
 
     @property
     def small_business_count(self) -> int:
@@ -1,18 +1,74 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Optional, Protocol
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import ClassVar, Optional, Protocol, Tuple
+
+from items.permanent_item import PermanentItem
 
 class Interactable(Protocol):
     def on_interact(self, game: "Game") -> str: ...
     @property
     def consumed(self) -> bool: ...
 
-@dataclass
-class GameObject:
-    """Base générique pour tout objet posé dans une room (consommable, permanent, etc.)."""
+@lru_cache(maxsize=None)
+def _slot_names(cls: type) -> Tuple[str, ...]:
+    """Slots déclarés par cls et ses parents (pour clone)."""
+    names = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        names.extend((slots,) if isinstance(slots, str) else slots)
+    return tuple(n for n in names if n not in ("__dict__", "__weakref__"))
+
+
+@dataclass(slots=True)
+class GameObject(ABC):
+    """
+    Base générique pour tout objet posé dans une room (consommable, permanent, etc.).
+    Seul `consumed` est un état commun : le nom et l'image viennent de la sous-classe
+    (champs de l'instance pour NamedObject, type partagé pour Item). Une sous-classe
+    qui n'en fournit pas un ne peut pas être instanciée.
+    """
+    _consumed: bool = field(default=False, kw_only=True)
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        ...
+
+    @property
+    @abstractmethod
+    def image_path(self) -> Optional[str]:
+        ...
+
+    @property
+    def consumed(self) -> bool:
+        return self._consumed
+
+    @consumed.setter
+    def consumed(self, value: bool) -> None:
+        self._consumed = value
+
+    def clone(self) -> "GameObject":
+        """Copie superficielle (les tables de loot / catalogues sont partagés, jamais modifiés)."""
+        new = object.__new__(type(self))
+        for name in _slot_names(type(self)):
+            object.__setattr__(new, name, getattr(self, name))
+        extra = getattr(self, "__dict__", None)  # attributs des sous-classes sans slots
+        if extra:
+            new.__dict__.update(extra)
+        return new
+
+    @abstractmethod
+    def on_interact(self, game: "Game") -> str:
+        """Action quand le joueur interagit (ramasse / utilise). Retourne un court message UI."""
+
+
+@dataclass(slots=True)
+class NamedObject(GameObject):
+    """Objet dont le nom et l'image sont propres à l'instance (objets interactifs, vendeur)."""
     _name: str
     _image_path: Optional[str] = None
-    _consumed: bool = False
 
     @property
     def name(self) -> str:
@@ -30,14 +86,41 @@ class GameObject:
     def image_path(self, value: Optional[str]) -> None:
         self._image_path = value
 
+
+@dataclass(frozen=True)
+class ItemType:
+    """Descripteur immuable d'un type d'objet ramassable, partagé par toutes ses instances."""
+    name: str
+    image_path: Optional[str] = None
+    steps_gain: int = 0                     # consommables : pas gagnés
+    tool: Optional[PermanentItem] = None    # permanents : outil ajouté à l'inventaire
+
+
+class Item(GameObject):
+    """
+    Objet ramassable poids mouche : nom, image et effet viennent de ITEM_TYPE (un par classe).
+    Une instance n'a qu'un slot, consumed : room.contents ne garde qu'une référence de
+    type (la classe) et ce drapeau par objet.
+    """
+    __slots__ = ()
+    ITEM_TYPE: ClassVar[ItemType]
+
+    def __init__(self):
+        self._consumed = False
+
     @property
-    def consumed(self) -> bool:
-        return self._consumed
+    def item_type(self) -> ItemType:
+        return type(self).ITEM_TYPE
 
-    @consumed.setter
-    def consumed(self, value: bool) -> None:
-        self._consumed = value
+    @property
+    def name(self) -> str:
+        return type(self).ITEM_TYPE.name
 
-    def on_interact(self, game: "Game") -> str:
-        """Action quand le joueur interagit (ramasse / utilise). Retourne un court message UI."""
-        raise NotImplementedError
+    @property
+    def image_path(self) -> Optional[str]:
+        return type(self).ITEM_TYPE.image_path
+
+    def clone(self) -> "Item":
+        new = object.__new__(type(self))
+        new._consumed = self._consumed
+        return new
@@ -1,22 +1,117 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Optional, List
-import random
+from bisect import bisect
+from itertools import accumulate
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
-from objects.base import GameObject
+from objects.base import GameObject, NamedObject
 from objects.consumable import Apple, Banana, Cake, Sandwich, Meal
 from objects.permanent import ShovelObj, HammerObj, LockpickKitObj, MetalDetectorObj, RabbitFootObj
-from items.permanent_item import PermanentItem
+from items.permanent_item import PermanentItem, tool_mask
+
+
+# Probabilité qu'un objet "peut être vide" le soit (réduite par la patte de lapin)
+EMPTY_CHANCE = 0.30
+RABBIT_FOOT_EMPTY_CHANCE = max(0.05, EMPTY_CHANCE - 0.15)
+
+
+@dataclass(frozen=True)
+class CompiledLoot:
+    """Table de loot compilée : probabilités cumulées (même calcul que l'ancien rng.choices normalisé)."""
+    cum: Tuple[float, ...]
+
+    def sample(self, rng) -> int:
+        """Index de l'entrée tirée : un random(), un bisect."""
+        cum = self.cum
+        return bisect(cum, rng.random() * cum[-1], 0, len(cum) - 1)
+
+
+# Entrée de loot : fabrique d'objet (classe ou callable sans argument), ou (fabrique, poids)
+LootEntry = Union[Callable[[], GameObject], Tuple[Callable[[], GameObject], float]]
+
+
+def _entry_factory(entry):
+    return entry[0] if isinstance(entry, tuple) and len(entry) == 2 else entry
+
+
+# fabrique -> (nom, outil) de ses objets, lus sur une instance sonde créée une seule fois
+_PROBES: Dict[Callable, Tuple[str, object]] = {}
+
+
+def _probe(factory) -> Tuple[str, object]:
+    info = _PROBES.get(factory)
+    if info is None:
+        obj = factory()
+        info = _PROBES[factory] = (obj.name, getattr(obj, 'tool', None))
+    return info
+
+
+# (table, détecteur de métaux) -> table compilée (None : rien à tirer)
+_COMPILED: Dict[tuple, Optional[CompiledLoot]] = {}
+
+
+def compile_loot(loot_table: Sequence[LootEntry], metal_detector: bool) -> Optional[CompiledLoot]:
+    """
+    Table compilée pour une _loot_table et l'état du détecteur de métaux (seul outil qui change
+    les poids), calculée une fois : les tables des classes (CHEST_LOOT...) sont des tuples partagés.
+    """
+    key = (loot_table if isinstance(loot_table, tuple) else tuple(loot_table), metal_detector)
+    table = _COMPILED.get(key, _COMPILED)
+    if table is not _COMPILED:
+        return table
+    weights = []
+    for entry in key[0]:
+        w = max(0.0, float(entry[1])) if isinstance(entry, tuple) and len(entry) == 2 else 1.0
+        if metal_detector:
+            # Favorise objets permanents (outils) et gemmes (approx via names)
+            name, tool = _probe(_entry_factory(entry))
+            if tool is not None:
+                w *= 2.0
+            if 'gem' in name.lower() or 'treasure' in name.lower():
+                w *= 1.5
+        weights.append(w)
+    total = sum(weights)
+    table = None
+    if weights and total > 0:
+        table = CompiledLoot(tuple(accumulate(w / total for w in weights)))
+    _COMPILED[key] = table
+    return table
+
+
+def generate_loots(containers: Sequence["InteractiveObject"], game: "Game") -> List[Optional[GameObject]]:
+    """
+    Loot de plusieurs objets d'un coup (simulations) : mêmes tirages, dans le même ordre,
+    que generate_loot appelé sur chacun ; outils lus une seule fois.
+    """
+    inv = game.player.inventory
+    rng = game.rng
+    empty_chance = RABBIT_FOOT_EMPTY_CHANCE if inv.has_tool(PermanentItem.RABBIT_FOOT) else EMPTY_CHANCE
+    detector = inv.has_tool(PermanentItem.METAL_DETECTOR)
+    out: List[Optional[GameObject]] = []
+    for obj in containers:
+        if obj._can_be_empty and rng.random() < empty_chance:
+            out.append(None)
+            continue
+        loot_table = obj._loot_table
+        table = compile_loot(loot_table, detector)
+        out.append(None if table is None else _entry_factory(loot_table[table.sample(rng)])())
+    return out
+
+
+# Tables de loot des objets concrets (partagées : un objet ne crée rien tant qu'il n'est pas ouvert)
+CHEST_LOOT: Tuple[LootEntry, ...] = (Apple, Banana, Cake, Sandwich, Meal, ShovelObj, HammerObj)
+DIG_SPOT_LOOT: Tuple[LootEntry, ...] = (Apple, Banana, Sandwich)
+LOCKER_LOOT: Tuple[LootEntry, ...] = (Apple, Meal, RabbitFootObj)
 
 
 @dataclass
-class InteractiveObject(GameObject):
+class InteractiveObject(NamedObject):
     """
     Classe de base pour les objets interactifs (coffres, spots, casiers).
     """
     _required_tools: List[PermanentItem] = field(default_factory=list)   # outils permanents nécessaires (ex: marteau)
     _can_use_key: bool = False                                           # est-ce qu'une clé peut être utilisée
-    _loot_table: List[GameObject] = field(default_factory=list)          # objets possibles
+    _loot_table: Sequence[LootEntry] = ()                                 # fabriques des objets possibles
     _can_be_empty: bool = False                                          # l'objet peut-il être vide ?
 
     @property
@@ -36,11 +131,11 @@ class InteractiveObject(GameObject):
         self._can_use_key = value
 
     @property
-    def loot_table(self) -> List[GameObject]:
+    def loot_table(self) -> Sequence[LootEntry]:
         return self._loot_table
 
     @loot_table.setter
-    def loot_table(self, value: List[GameObject]) -> None:
+    def loot_table(self, value: Sequence[LootEntry]) -> None:
         self._loot_table = value
 
     @property
@@ -54,7 +149,7 @@ class InteractiveObject(GameObject):
     def can_interact(self, game: "Game") -> bool:
         """Vérifie si le joueur peut interagir avec cet objet"""
         inv = game.player.inventory
-        has_required_tool = any(tool in inv.tools for tool in self._required_tools)
+        has_required_tool = inv.tool_mask & tool_mask(self._required_tools) != 0
         has_key = inv.keys > 0 if self._can_use_key else False
         return has_required_tool or has_key or len(self._required_tools) == 0
 
@@ -62,55 +157,24 @@ class InteractiveObject(GameObject):
         """Détermine ce que le joueur trouve dans l'objet.
 
         On supporte deux formats pour _loot_table:
-        - liste d'objets -> choix uniforme
-        - liste de (objet, weight) -> choix pondéré
+        - fabriques (classes d'objets) -> choix uniforme
+        - (fabrique, weight) -> choix pondéré
+        Chaque loot est un objet neuf, créé seulement quand il est tiré.
 
         Certaines tools (ex: METAL_DETECTOR, RABBIT_FOOT) modifient les probabilités.
+        Les poids sont compilés une fois par table (voir compile_loot) : un tirage = un bisect.
         """
         inv = game.player.inventory
 
-        # Probabilité d'être vide (si possible) - modifiable par chance permanente
-        empty_chance = 0.30
-        if inv.has_tool(PermanentItem.RABBIT_FOOT):
-            # Patte de lapin réduit la probabilité d'être vide
-            empty_chance = max(0.05, empty_chance - 0.15)
-
-        if self._can_be_empty and random.random() < empty_chance:
-            return None
-
-        if not self._loot_table:
+        # Probabilité d'être vide (si possible) - patte de lapin : plus faible
+        empty_chance = RABBIT_FOOT_EMPTY_CHANCE if inv.has_tool(PermanentItem.RABBIT_FOOT) else EMPTY_CHANCE
+        if self._can_be_empty and game.rng.random() < empty_chance:
             return None
 
-        # Construire listes d'items et poids
-        items = []
-        weights = []
-        for entry in self._loot_table:
-            if isinstance(entry, tuple) and len(entry) == 2:
-                item, w = entry
-                items.append(item)
-                weights.append(max(0.0, float(w)))
-            else:
-                items.append(entry)
-                weights.append(1.0)
-
-        # Modifier poids selon outils du joueur
-        if inv.has_tool(PermanentItem.METAL_DETECTOR):
-            # Favorise objets permanents (outils) et gemmes (approx via names)
-            for i, itm in enumerate(items):
-                if getattr(itm, 'tool', None) is not None:
-                    weights[i] *= 2.0
-                # boost items whose name contains 'Gem' or 'Treasure'
-                if 'gem' in itm.name.lower() or 'treasure' in itm.name.lower():
-                    weights[i] *= 1.5
-
-        # Choix pondéré
-        total = sum(weights)
-        if total <= 0:
+        table = compile_loot(self._loot_table, inv.has_tool(PermanentItem.METAL_DETECTOR))
+        if table is None:
             return None
-        # Normaliser et choisir
-        probs = [w/total for w in weights]
-        idx = random.choices(range(len(items)), weights=probs, k=1)[0]
-        return items[idx]
+        return _entry_factory(self._loot_table[table.sample(game.rng)])()
 
     def on_interact(self, game: "Game") -> str:
         if self.consumed:
@@ -119,7 +183,7 @@ class InteractiveObject(GameObject):
         inv = game.player.inventory
 
         # Vérifier les conditions d'ouverture
-        has_tool = any(tool in inv.tools for tool in self._required_tools)
+        has_tool = inv.tool_mask & tool_mask(self._required_tools) != 0
         has_key = inv.keys > 0 if self._can_use_key else False
 
         if not has_tool and not has_key:
@@ -128,7 +192,7 @@ class InteractiveObject(GameObject):
 
         # Consommer une clé si utilisée (et si pas de marteau)
         if has_key and not has_tool:
-            inv.keys = inv.keys - 1
+            inv.spend("keys", 1)
         loot = self.generate_loot(game)
         self.consumed = True
 
@@ -152,7 +216,7 @@ class Chest(InteractiveObject):
             _image_path=image_path,
             _required_tools=[PermanentItem.HAMMER],  # marteau autorisé
             _can_use_key=True,                      # clé autorisée
-            _loot_table=[Apple(), Banana(), Cake(), Sandwich(), Meal(), ShovelObj(), HammerObj()],
+            _loot_table=CHEST_LOOT,
             _can_be_empty=False
         )
 
@@ -165,7 +229,7 @@ class DigSpot(InteractiveObject):
             _image_path=image_path,
             _required_tools=[PermanentItem.SHOVEL],
             _can_use_key=False,
-            _loot_table=[Apple(), Banana(), Sandwich()],
+            _loot_table=DIG_SPOT_LOOT,
             _can_be_empty=True
         )
 
@@ -178,7 +242,7 @@ class Locker(InteractiveObject):
             _image_path=image_path,
             _required_tools=[],     # pas de marteau ici
             _can_use_key=True,     # uniquement clé
-            _loot_table=[Apple(), Meal(), RabbitFootObj()],
+            _loot_table=LOCKER_LOOT,
             _can_be_empty=True
         )
 
@@ -197,7 +261,7 @@ class Vendor(InteractiveObject):
             _image_path=image_path,
             _required_tools=[],
             _can_use_key=False,
-            _loot_table=[],
+            _loot_table=(),
             _can_be_empty=False,
         )
         # catalogue (indexé 1..n côté affichage)
@@ -218,6 +282,11 @@ class Vendor(InteractiveObject):
 
     # -------- achat appelé depuis main_graphiqc --------
     def buy_item(self, game: "Game", index_1based: int) -> str:
+        # journalisé pour le rejeu ; l'objet posé par l'achat n'est pas ré-enregistré
+        with game.recording("buy", index_1based):
+            return self._buy_item(game, index_1based)
+
+    def _buy_item(self, game: "Game", index_1based: int) -> str:
         if index_1based < 1 or index_1based > len(self.catalog):
             return "Article inexistant."
 
@@ -228,7 +297,7 @@ class Vendor(InteractiveObject):
             return f"Pas assez d'or pour {name} (coût : {price})."
 
         # payer
-        inv.gold -= price
+        inv.spend("gold", price)
 
         # donner l'objet / effet
         give_fun(game)
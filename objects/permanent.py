@@ -1,59 +1,54 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Optional
-from objects.base import GameObject
+from objects.base import Item, ItemType
 from items.permanent_item import PermanentItem
 
-@dataclass
-class Permanent(GameObject):
+class Permanent(Item):
     """Objet permanent : une fois ramassé, il va dans Inventory.tools."""
-    _tool: PermanentItem = PermanentItem.SHOVEL  # valeur par défaut; chaque sous-classe la surchargera
+    __slots__ = ()
 
     @property
     def tool(self) -> PermanentItem:
-        return self._tool
-
-    @tool.setter
-    def tool(self, value: PermanentItem) -> None:
-        self._tool = value
+        return type(self).ITEM_TYPE.tool
 
     def on_interact(self, game: "Game") -> str:
         if self.consumed:
             return f"{self.name} déjà ramassé."
         inv = game.player.inventory
-        if self._tool in inv.tools:
+        tool = type(self).ITEM_TYPE.tool
+        if inv.has_tool(tool):
             self.consumed = True
             return f"{self.name} (déjà possédé)."
-        inv.add_tool(self._tool)
+        inv.add_tool(tool)
         self.consumed = True
         return f"{self.name} ajouté aux outils."
 
 # ---- Sous-classes concrètes (pratique pour placer par type + image dédiée) ----
 
 class ShovelObj(Permanent):
-    def __init__(self, image_path: Optional[str] = "assets/rooms/items/shovel.png"):
-        super().__init__(_name="Shovel", _image_path=image_path, _tool=PermanentItem.SHOVEL)
+    __slots__ = ()
+    ITEM_TYPE = ItemType("Shovel", "assets/rooms/items/shovel.png", tool=PermanentItem.SHOVEL)
 
 class HammerObj(Permanent):
-    def __init__(self, image_path: Optional[str] = "assets/rooms/items/hammer.png"):
-        super().__init__(_name="Hammer", _image_path=image_path, _tool=PermanentItem.HAMMER)
+    __slots__ = ()
+    ITEM_TYPE = ItemType("Hammer", "assets/rooms/items/hammer.png", tool=PermanentItem.HAMMER)
 
 class LockpickKitObj(Permanent):
-    def __init__(self, image_path: Optional[str] = "assets/rooms/items/lockpick.png"):
-        super().__init__(_name="Lockpick Kit", _image_path=image_path, _tool=PermanentItem.LOCKPICK_KIT)
+    __slots__ = ()
+    ITEM_TYPE = ItemType("Lockpick Kit", "assets/rooms/items/lockpick.png", tool=PermanentItem.LOCKPICK_KIT)
 
 class MetalDetectorObj(Permanent):
-    def __init__(self, image_path: Optional[str] = "assets/rooms/items/metal_detector.png"):
-        super().__init__(_name="Metal Detector", _image_path=image_path, _tool=PermanentItem.METAL_DETECTOR)
+    __slots__ = ()
+    ITEM_TYPE = ItemType("Metal Detector", "assets/rooms/items/metal_detector.png", tool=PermanentItem.METAL_DETECTOR)
 
 class RabbitFootObj(Permanent):
-    def __init__(self, image_path: Optional[str] = "assets/rooms/items/rabbit_foot.png"):
-        super().__init__(_name="Rabbit Foot", _image_path=image_path, _tool=PermanentItem.RABBIT_FOOT)
+    __slots__ = ()
+    ITEM_TYPE = ItemType("Rabbit Foot", "assets/rooms/items/rabbit_foot.png", tool=PermanentItem.RABBIT_FOOT)
 
 class SmallBusinessObj(Permanent):
     """Fragment qui se transforme en clé une fois qu'on en a collecté 10."""
-    def __init__(self, image_path: Optional[str] = "assets/rooms/items/coin.png"):  # Utilisation temporaire d'une image de pièce
-        super().__init__(_name="Small Business", _image_path=image_path, _tool=PermanentItem.SMALL_BUSINESS)
+    __slots__ = ()
+    # Utilisation temporaire d'une image de pièce
+    ITEM_TYPE = ItemType("Small Business", "assets/rooms/items/coin.png", tool=PermanentItem.SMALL_BUSINESS)
 
     def on_interact(self, game: "Game") -> str:
         if self.consumed:
@@ -0,0 +1,103 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, Mapping, Tuple, Type
+
+from enums.direction import Direction
+from rooms.room_base import Room
+from rooms.special_rooms import (
+    PlainRoom, Kitchen, Pantry, LockerRoom, UtilityRoom,
+    Garden, Armory, Library, Furnace, Greenhouse,
+    Solarium, Veranda, MaidsChamber,
+    WeightRoom, MasterBedroom, ChamberOfMirrors
+)
+
+# Salles tirables de base (même ordre que l'ancienne liste de draw_three_rooms)
+DRAWABLE_ROOM_CLASSES: Tuple[Type[Room], ...] = (
+    PlainRoom, Kitchen, Pantry, LockerRoom, UtilityRoom,
+    Garden, Armory, Library, Furnace, Greenhouse,
+    Solarium, Veranda, MaidsChamber,
+    WeightRoom, MasterBedroom, ChamberOfMirrors,
+)
+
+
+@dataclass(frozen=True)
+class RoomSpec:
+    """Métadonnées d'une salle tirable, lues une seule fois à la construction du catalogue."""
+    cls: Type[Room]
+    gem_cost: int
+    rarity: int
+    possible_doors: FrozenSet[Direction]
+
+    @property
+    def name(self) -> str:
+        return self.cls.__name__
+
+    def instantiate(self) -> Room:
+        """Crée la salle réelle (seulement pour les pièces effectivement proposées)."""
+        return self.cls()
+
+
+class RoomCatalog:
+    """
+    Index immuable des salles tirables :
+    (r, c, direction) -> tuple des RoomSpec qui peuvent être posées là avec une porte dans cette direction.
+    Les listes ne dépendent que des conditions de placement vérifiées sur la case : elles sont
+    construites à la demande, une fois par combinaison de conditions (taille du manoir quelconque).
+    """
+    def __init__(self, room_classes: Iterable[Type[Room]], rows: int, cols: int):
+        # une seule instance "sonde" par classe pour lire les métadonnées et la condition de placement
+        probes = [cls() for cls in room_classes]
+        self._specs = tuple(
+            RoomSpec(type(p), p.gem_cost, p.rarity, frozenset(p.possible_doors)) for p in probes
+        )
+        self._rows = rows
+        self._cols = cols
+        # seules les salles avec une condition sont évaluées case par case
+        self._conditional = tuple(p for p in probes if p.placement_condition is not None)
+        self._has_condition = tuple(p.placement_condition is not None for p in probes)
+
+        # (conditions vérifiées) -> {direction: candidats} ; les listes identiques partagent
+        # le même tuple (moins de mémoire, clés de cache stables)
+        self._by_mask: Dict[Tuple[bool, ...], Mapping[Direction, Tuple[RoomSpec, ...]]] = {}
+        self._interned: Dict[Tuple[RoomSpec, ...], Tuple[RoomSpec, ...]] = {}
+
+    def _lists_for(self, mask: Tuple[bool, ...]) -> Mapping[Direction, Tuple[RoomSpec, ...]]:
+        ok = iter(mask)
+        placeable = [spec for spec, cond in zip(self._specs, self._has_condition) if not cond or next(ok)]
+        lists = {}
+        for d in Direction:
+            candidates = tuple(spec for spec in placeable if d in spec.possible_doors)
+            lists[d] = self._interned.setdefault(candidates, candidates)
+        lists = self._by_mask[mask] = MappingProxyType(lists)
+        return lists
+
+    @property
+    def specs(self) -> Tuple[RoomSpec, ...]:
+        return self._specs
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    @property
+    def cols(self) -> int:
+        return self._cols
+
+    def candidates(self, r: int, c: int, direction: Direction) -> Tuple[RoomSpec, ...]:
+        """Salles éligibles pour la case (r, c) tirée depuis `direction` (tuple vide si hors manoir)."""
+        if not (0 <= r < self._rows and 0 <= c < self._cols):
+            return ()
+        rows, cols = self._rows, self._cols
+        mask = tuple(p.can_be_placed(r, c, rows, cols) for p in self._conditional)
+        lists = self._by_mask.get(mask)
+        if lists is None:
+            lists = self._lists_for(mask)
+        return lists[direction]
+
+
+@lru_cache(maxsize=None)
+def get_catalog(room_classes: Tuple[Type[Room], ...], rows: int, cols: int) -> RoomCatalog:
+    """Catalogue partagé pour un ensemble de classes et une taille de manoir."""
+    return RoomCatalog(room_classes, rows, cols)
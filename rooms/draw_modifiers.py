@@ -0,0 +1,188 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Type
+
+from items.permanent_item import PermanentItem, tool_mask
+from rooms.catalog import RoomSpec
+from rooms.room_base import Room, RoomType
+from rooms.special_rooms import UtilityRoom, Armory, Pantry, PlainRoom, Kitchen
+
+
+# ================================
+#   COUCHES DE POIDS DE TIRAGE
+# ================================
+
+class DrawLayer(ABC):
+    """
+    Couche de poids de tirage : un facteur multiplicatif par salle candidate.
+    Le poids d'une salle est le produit des couches actives (rareté, outils, salle actuelle,
+    effets). Les couches sont des objets partagés comparés par identité : un tuple de
+    couches actives sert directement de clé de cache des tables de tirage.
+    """
+
+    @abstractmethod
+    def factor(self, spec: RoomSpec) -> float:
+        ...
+
+
+class RarityLayer(DrawLayer):
+    """Poids de base : 1/3 par niveau de rareté (toujours active)."""
+
+    def factor(self, spec: RoomSpec) -> float:
+        return pow(1 / 3, spec.rarity)
+
+    def __repr__(self) -> str:
+        return "RarityLayer()"
+
+
+@dataclass(frozen=True, eq=False)
+class ClassBoost(DrawLayer):
+    """Multiplicateurs par classe de salle (sous-classes comprises), d'une source nommée."""
+    source: str
+    boosts: Tuple[Tuple[Tuple[Type[Room], ...], float], ...]
+
+    def __post_init__(self):
+        for classes, mult in self.boosts:
+            if mult < 0:
+                raise ValueError(f"{self.source} : multiplicateur négatif pour {classes}")
+
+    def factor(self, spec: RoomSpec) -> float:
+        f = 1.0
+        for classes, mult in self.boosts:
+            if issubclass(spec.cls, classes):
+                f *= mult
+        return f
+
+
+RARITY = RarityLayer()
+
+# Bonus de tirage apportés par les outils : (outil, salles favorisées, multiplicateur)
+TOOL_DRAW_BOOSTS = (
+    (PermanentItem.METAL_DETECTOR, (UtilityRoom, Armory), 1.8),
+    (PermanentItem.RABBIT_FOOT, (Pantry, PlainRoom, Kitchen), 1.25),
+)
+# outils qui changent les poids : les autres bits de l'inventaire ne changent pas la table
+TOOL_DRAW_MASK = tool_mask(tool for tool, _, _ in TOOL_DRAW_BOOSTS)
+# une couche par outil : (bit de l'outil, couche)
+TOOL_LAYERS: Tuple[Tuple[int, ClassBoost], ...] = tuple(
+    (tool._value_, ClassBoost(tool.name, ((favoured, mult),))) for tool, favoured, mult in TOOL_DRAW_BOOSTS
+)
+
+
+# ================================
+#   MODIFICATEURS DES SALLES
+# ================================
+
+_ROOM_CLASSES: Dict[str, Type[Room]] = {}
+
+
+def _register_room_classes() -> None:
+    todo = list(Room.__subclasses__())
+    while todo:
+        sub = todo.pop()
+        _ROOM_CLASSES.setdefault(sub.__name__, sub)
+        todo.extend(sub.__subclasses__())
+
+
+def room_class(name: str) -> Type[Room]:
+    """Classe de salle nommée `name` (sous-classes de Room chargées) ; KeyError si inconnue."""
+    cls = _ROOM_CLASSES.get(name)
+    if cls is None:
+        # nouvelles salles (extensions) : on reparcourt la hiérarchie avant d'échouer
+        _register_room_classes()
+        cls = _ROOM_CLASSES[name]
+    return cls
+
+
+def compile_draw_modifiers(room_type: RoomType) -> Optional[ClassBoost]:
+    """
+    Couche des draw_modifiers d'un type de salle (None s'il n'en a pas).
+    Les clés sont des noms de classes de salles : un nom inconnu ou un multiplicateur
+    non numérique lève ValueError (au chargement plutôt qu'en silence au tirage).
+    """
+    if not room_type.draw_modifiers:
+        return None
+    boosts = []
+    for name, mult in room_type.draw_modifiers.items():
+        try:
+            cls = room_class(name)
+        except KeyError:
+            raise ValueError(f"draw_modifiers de {room_type.name} : salle inconnue {name!r}") from None
+        try:
+            mult = float(mult)
+        except (TypeError, ValueError):
+            raise ValueError(f"draw_modifiers de {room_type.name} : multiplicateur invalide pour {name!r}") from None
+        boosts.append(((cls,), mult))
+    return ClassBoost(room_type.name, tuple(boosts))
+
+
+# au-delà, les caches de couches sont vidés (types de salles modifiés à la volée)
+MAX_CACHED_LAYERS = 4096
+
+# type de salle (id) -> (type, couche) ; le type est gardé pour que l'id reste valide
+_ROOM_LAYERS: Dict[int, Tuple[RoomType, Optional[ClassBoost]]] = {}
+
+
+def room_layer(room_type: RoomType) -> Optional[ClassBoost]:
+    """Couche (en cache) des draw_modifiers d'un type de salle."""
+    entry = _ROOM_LAYERS.get(id(room_type))
+    if entry is None or entry[0] is not room_type:
+        if len(_ROOM_LAYERS) >= MAX_CACHED_LAYERS:
+            _ROOM_LAYERS.clear()
+        entry = _ROOM_LAYERS[id(room_type)] = (room_type, compile_draw_modifiers(room_type))
+    return entry[1]
+
+
+def validate_room_types() -> None:
+    """Compile les draw_modifiers de toutes les salles chargées (ValueError au premier nom inconnu)."""
+    _register_room_classes()
+    for cls in list(_ROOM_CLASSES.values()):
+        room_type = vars(cls).get("ROOM_TYPE")
+        if room_type is not None:
+            room_layer(room_type)
+
+
+# ================================
+#   COUCHES ACTIVES
+# ================================
+
+# (bits d'outils utiles, id du type de salle) -> (type, couches) : même tuple à chaque tirage
+_SIGNATURES: Dict[tuple, Tuple[Optional[RoomType], Tuple[DrawLayer, ...]]] = {}
+
+
+def active_layers(inventory, room: Optional[Room] = None,
+                  effects: Tuple[DrawLayer, ...] = ()) -> Tuple[DrawLayer, ...]:
+    """
+    Couches actives d'un tirage, dans l'ordre d'application : rareté, outils de
+    l'inventaire, draw_modifiers de la salle actuelle, puis `effects` (effets temporaires).
+    """
+    tools = inventory.tool_mask & TOOL_DRAW_MASK
+    room_type = room.room_type if room is not None else None
+    key = (tools, id(room_type))
+    entry = _SIGNATURES.get(key)
+    if entry is None or entry[0] is not room_type:
+        layers = [RARITY]
+        layers.extend(layer for bit, layer in TOOL_LAYERS if tools & bit)
+        own = room_layer(room_type) if room_type is not None else None
+        if own is not None:
+            layers.append(own)
+        if len(_SIGNATURES) >= MAX_CACHED_LAYERS:
+            _SIGNATURES.clear()
+        entry = _SIGNATURES[key] = (room_type, tuple(layers))
+    return entry[1] + effects if effects else entry[1]
+
+
+def combined_weights(candidates: Tuple[RoomSpec, ...], layers: Tuple[DrawLayer, ...]) -> List[float]:
+    """Poids de chaque candidat : produit des facteurs des couches, dans l'ordre des couches."""
+    weights = [1.0] * len(candidates)
+    for layer in layers:
+        for i, spec in enumerate(candidates):
+            f = layer.factor(spec)
+            if f != 1.0:
+                weights[i] *= f
+    return weights
+
+
+# validation au chargement : un nom de salle inconnu fait échouer l'import, pas le tirage
+validate_room_types()
@@ -0,0 +1,142 @@
+from __future__ import annotations
+from heapq import nlargest
+from math import log
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Sequence, Tuple, Type
+
+from rooms.catalog import RoomSpec
+from rooms.draw_modifiers import DrawLayer, combined_weights
+from rooms.room_base import Room
+
+
+class AliasTable:
+    """Table d'alias (méthode de Vose) : un tirage pondéré avec remise en O(1)."""
+
+    def __init__(self, weights: Sequence[float]):
+        n = len(weights)
+        total = float(sum(weights))
+        scaled = [w * n / total for w in weights]
+        self._prob = [1.0] * n
+        self._alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self._prob[s] = scaled[s]
+            self._alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        self._n = n
+
+    def sample(self, rng) -> int:
+        u = rng.random() * self._n
+        i = int(u)
+        return i if u - i < self._prob[i] else self._alias[i]
+
+
+class DrawTable:
+    """Poids précalculés pour une liste de candidats et un contexte de tirage donné."""
+
+    def __init__(self, candidates: Tuple[RoomSpec, ...], weights: Sequence[float]):
+        self.candidates = candidates
+        self.weights = tuple(weights)
+        # clé d'Efraimidis-Spirakis : log(u) / w -> on garde 1/w (poids nul = jamais tiré)
+        self.inv_weights = [(i, 1.0 / w) for i, w in enumerate(weights) if w > 0]
+        # règle "au moins une salle gratuite" : tirage parmi les gratuites au poids de rareté seul
+        self.free = [i for i, spec in enumerate(candidates) if spec.gem_cost == 0]
+        self.free_alias = AliasTable([pow(1 / 3, candidates[i].rarity) for i in self.free]) if self.free else None
+        # k -> probabilités d'apparition (voir RoomDrawSampler.inclusion), calculées à la demande
+        self.inclusion: Dict[int, Mapping[Type[Room], float]] = {}
+
+
+class RoomDrawSampler:
+    """
+    Tire k salles distinctes en temps borné (une passe, O(n log k)) :
+    échantillonnage pondéré sans remise par clés aléatoires, équivalent en loi
+    à des tirages successifs pondérés en rejetant les doublons.
+    Les tables sont mises en cache par (candidats, couches actives) : un tirage dans un
+    contexte déjà vu ne coûte qu'une recherche de dict et l'échantillonnage.
+    """
+    def __init__(self, max_tables: int = 4096):
+        self._tables: Dict[tuple, DrawTable] = {}
+        self._max_tables = max_tables
+
+    def table_for(self, candidates: Tuple[RoomSpec, ...], layers: Tuple[DrawLayer, ...]) -> DrawTable:
+        """Table des candidats pondérés par les couches `layers` (voir draw_modifiers.active_layers)."""
+        key = (id(candidates), layers)
+        table = self._tables.get(key)
+        if table is not None and table.candidates is candidates:
+            return table
+
+        table = DrawTable(candidates, combined_weights(candidates, layers))
+        if len(self._tables) >= self._max_tables:
+            self._tables.clear()
+        self._tables[key] = table
+        return table
+
+    def sample(self, table: DrawTable, rng, k: int = 3) -> List[RoomSpec]:
+        """k salles distinctes (moins s'il n'y a pas assez de candidats), avec si possible une gratuite."""
+        order = nlargest(k, table.inv_weights, key=lambda e: log(1.0 - rng.random()) * e[1])
+        picked = [i for i, _ in order]
+
+        # si les k-1 premières ne contiennent aucune salle gratuite, la dernière est prise parmi les gratuites
+        if len(picked) == k and table.free and not any(table.candidates[i].gem_cost == 0 for i in picked[:-1]):
+            picked[-1] = table.free[table.free_alias.sample(rng)]
+        return [table.candidates[i] for i in picked]
+
+    def inclusion(self, table: DrawTable, k: int = 3) -> Mapping[Type[Room], float]:
+        """
+        Probabilité exacte que chaque candidat de `table` soit parmi les salles proposées par
+        sample(table, rng, k) : les k-1 premiers tirages (successifs, pondérés, sans remise)
+        sont énumérés, le dernier (ou la salle gratuite imposée) est calculé en forme close.
+        O(n^(k-1)), mis en cache sur la table (même clé : candidats, couches actives).
+        """
+        cached = table.inclusion.get(k)
+        if cached is not None:
+            return cached
+
+        candidates, weights = table.candidates, table.weights
+        probs = [0.0] * len(candidates)
+        pos = [i for i, w in enumerate(weights) if w > 0]
+        if len(pos) < k:
+            # moins de k candidats tirables : tous proposés, pas de règle de salle gratuite
+            for i in pos:
+                probs[i] = 1.0
+        else:
+            free_total = sum(pow(1 / 3, candidates[f].rarity) for f in table.free)
+            free_probs = [(f, pow(1 / 3, candidates[f].rarity) / free_total) for f in table.free]
+            is_free = [spec.gem_cost == 0 for spec in candidates]
+            used: List[int] = []
+            # dernier tirage en forme close : chaque feuille (p, remaining) donne p * w_i / remaining
+            # à tous les candidats ; on accumule p / remaining (last[0]) et on retire la part des
+            # déjà tirés de la feuille. Idem pour la salle gratuite imposée (last[1]).
+            last = [0.0, 0.0]
+
+            def walk(p: float, remaining: float, depth: int, has_free: bool) -> None:
+                if depth == k - 1:
+                    if free_probs and not has_free:
+                        # aucune gratuite dans les k-1 premières : la dernière est tirée parmi les gratuites
+                        last[1] += p
+                    else:
+                        scale = p / remaining
+                        last[0] += scale
+                        for u in used:
+                            probs[u] -= scale * weights[u]
+                    return
+                for i in pos:
+                    if i in used:
+                        continue
+                    q = p * weights[i] / remaining
+                    probs[i] += q
+                    used.append(i)
+                    walk(q, remaining - weights[i], depth + 1, has_free or is_free[i])
+                    used.pop()
+
+            walk(1.0, sum(weights[i] for i in pos), 0, False)
+            for i in pos:
+                probs[i] += last[0] * weights[i]
+            for f, q in free_probs:
+                probs[f] += last[1] * q
+
+        result = table.inclusion[k] = MappingProxyType({spec.cls: p for spec, p in zip(candidates, probs)})
+        return result
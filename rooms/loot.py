@@ -0,0 +1,114 @@
+from __future__ import annotations
+from bisect import bisect
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Callable, Dict, List, Mapping, Optional, Tuple, Type
+
+from objects.base import GameObject
+from objects.consumable import Apple, Banana, Cake, Sandwich, Meal
+from objects.permanent import ShovelObj, HammerObj, LockpickKitObj, MetalDetectorObj, RabbitFootObj
+from objects.interactive import Chest, DigSpot, Locker
+from rooms.room_base import Room
+from rooms.special_rooms import (
+    Kitchen, Pantry, Garden, LockerRoom, UtilityRoom, Armory, Library, PlainRoom,
+    EntranceHall, Antechamber
+)
+
+Factory = Callable[[], GameObject]
+
+
+@dataclass(frozen=True)
+class LootPick:
+    """
+    Un objet tiré parmi `factories` (avec probabilité `chance`) : seul l'objet retenu est créé.
+    Uniforme par défaut ; avec des modificateurs de loot (Veranda : nom de classe -> multiplicateur),
+    pondéré par un vecteur de poids cumulés calculé une fois par jeu de modificateurs.
+    """
+    factories: Tuple[Factory, ...]
+    chance: float = 1.0
+    names: Tuple[str, ...] = field(init=False)
+    # modificateurs (items du dict) -> poids cumulés
+    _cum: Dict[tuple, List[float]] = field(init=False, default_factory=dict, compare=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "names", tuple(f.__name__ for f in self.factories))
+
+    def cum_weights(self, modifiers: Mapping[str, float], key: tuple) -> List[float]:
+        cum = self._cum.get(key)
+        if cum is None:
+            cum = self._cum[key] = list(accumulate(modifiers.get(n, 1.0) for n in self.names))
+        return cum
+
+    def roll(self, rng, modifiers: Mapping[str, float], key: tuple) -> Optional[GameObject]:
+        if self.chance < 1.0 and rng.random() >= self.chance:
+            return None
+        if len(self.factories) == 1:
+            return self.factories[0]()  # objet fixe : aucun tirage
+        if not modifiers:
+            return rng.choice(self.factories)()
+        # même tirage que rng.choices(..., weights=...) : un random(), bisect sur les cumuls
+        cum = self.cum_weights(modifiers, key)
+        return self.factories[bisect(cum, rng.random() * cum[-1], 0, len(cum) - 1)]()
+
+
+@dataclass(frozen=True)
+class LootSpec:
+    """Loot d'un type de salle : tirages successifs, puis repli nourriture si un boost n'a rien donné."""
+    picks: Tuple[LootPick, ...] = ()
+    fallback: bool = True   # False : aucune apparition, même boostée (hall, antichambre)
+
+
+FOOD = (Apple, Banana, Cake, Sandwich, Meal)
+PERMANENTS = (ShovelObj, HammerObj, LockpickKitObj, MetalDetectorObj)
+
+# Repli quand une salle boostée (Veranda) n'a rien eu : 50% de chance de nourriture
+FALLBACK_FOOD = LootPick(FOOD, chance=0.50)
+
+NO_LOOT = LootSpec(fallback=False)
+DEFAULT_LOOT = LootSpec()
+
+# Type de salle -> loot (les sous-classes héritent du loot de leur parent, comme isinstance)
+LOOT_TABLES: Dict[Type[Room], LootSpec] = {
+    EntranceHall: NO_LOOT,
+    Antechamber: NO_LOOT,
+    # beaucoup de nourriture (éventuellement boostée par Veranda)
+    Kitchen: LootSpec((LootPick(FOOD),)),
+    # nourriture plus forte
+    Pantry: LootSpec((LootPick((Sandwich, Meal)),)),
+    Garden: LootSpec((LootPick((DigSpot,)),)),
+    LockerRoom: LootSpec((LootPick((Locker,)),)),
+    # salle trésor : un coffre, et un outil une fois sur deux
+    UtilityRoom: LootSpec((LootPick((Chest,)), LootPick(PERMANENTS, chance=0.5))),
+    Armory: LootSpec((LootPick(PERMANENTS),)),
+    Library: LootSpec((LootPick((RabbitFootObj, ShovelObj, MetalDetectorObj, Apple)),)),
+    PlainRoom: LootSpec((LootPick((Apple, Banana, ShovelObj), chance=0.2),)),
+}
+
+# résolution par classe (MRO) mise en cache : une recherche de dict par salle posée
+_RESOLVED: Dict[type, LootSpec] = {}
+
+
+def loot_for(cls: type) -> LootSpec:
+    """Loot du type de salle cls (DEFAULT_LOOT si aucun ancêtre n'est enregistré)."""
+    spec = _RESOLVED.get(cls)
+    if spec is None:
+        spec = next((LOOT_TABLES[k] for k in cls.__mro__ if k in LOOT_TABLES), DEFAULT_LOOT)
+        _RESOLVED[cls] = spec
+    return spec
+
+
+def roll_loot(room: Room, rng, modifiers: Optional[Mapping[str, float]] = None) -> List[GameObject]:
+    """Objets qui apparaissent dans une salle qui vient d'être posée."""
+    spec = loot_for(type(room))
+    modifiers = modifiers or {}
+    key = tuple(modifiers.items())
+    out = []
+    for pick in spec.picks:
+        obj = pick.roll(rng, modifiers, key)
+        if obj is not None:
+            out.append(obj)
+    if spec.fallback and modifiers and not out:
+        obj = FALLBACK_FOOD.roll(rng, modifiers, key)
+        if obj is not None:
+            out.append(obj)
+    return out
@@ -1,47 +1,84 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import List, Callable, Optional, Set
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import ClassVar, FrozenSet, List, Callable, Mapping, Optional, Set
 from abc import ABC, abstractmethod
 from enums.direction import Direction
 from enums.room_colors import CouleurPiece
 
+# toutes les portes (type de salle le plus courant)
+ALL_DOORS: FrozenSet[Direction] = frozenset((Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT))
+
+
+@dataclass(frozen=True)
+class RoomType:
+    """
+    Métadonnées immuables d'un type de salle, partagées par toutes ses instances (poids mouche) :
+    une salle posée ne garde que son contenu et ses drapeaux d'état (_used, _taken...).
+    """
+    name: str
+    image_path: str = ""
+    gem_cost: int = 0
+    rarity: int = 0  # 0-3, où 3 est le plus rare
+    possible_doors: FrozenSet[Direction] = frozenset()
+    placement_condition: Optional[Callable[[int, int, int, int], bool]] = None  # (r, c, rows, cols)
+
+    # Ancien système (optionnel) + modificateurs de tirage
+    special_effect: Optional[Callable[["Game", int, int], None]] = None
+    draw_modifiers: Optional[Mapping[str, float]] = None  # mapping of room class name -> multiplier
+
+    # Partie 2.4
+    couleur: CouleurPiece = CouleurPiece.BLEUE
+    effet_texte: str = ""
+
+    def __post_init__(self):
+        if not 0 <= self.rarity <= 3:
+            raise ValueError("Rarity must be between 0 and 3")
+        object.__setattr__(self, "possible_doors", frozenset(self.possible_doors))
+        if self.draw_modifiers is not None:
+            object.__setattr__(self, "draw_modifiers", MappingProxyType(dict(self.draw_modifiers)))
+
+
 @dataclass
 class Room(ABC):
-    _name: str
+    """
+    Salle posée : type partagé (ROOM_TYPE de la classe) + état propre (contenu, drapeaux).
+    Les setters de métadonnées (name, gem_cost...) remplacent le type de cette seule salle par une copie.
+    """
+    ROOM_TYPE: ClassVar[RoomType]
+
+    _type: Optional[RoomType] = None   # défaut : ROOM_TYPE de la classe
     _contents: List["GameObject"] = field(default_factory=list)
-    _image_path: str = ""
-    _gem_cost: int = 0
-    _rarity: int = 0  # 0-3, où 3 est le plus rare
-    _possible_doors: Set[Direction] = field(default_factory=set)
-    _placement_condition: Optional[Callable[[int, int], bool]] = None
 
-    # Ancien système (optionnel) + modificateurs de tirage
-    _special_effect: Optional[Callable[["Game", int, int], None]] = None
-    _draw_modifiers: Optional[dict] = None  # mapping of room class name -> multiplier
+    def __post_init__(self):
+        if self._type is None:
+            self._type = type(self).ROOM_TYPE
 
-    
-    ###PAUL###############@
-    # Partie 2.4
-    _couleur: CouleurPiece = CouleurPiece.BLEUE
-    _effet_texte: str = ""
+    def _retype(self, **changes) -> None:
+        self._type = replace(self._type, **changes)
 
+    @property
+    def room_type(self) -> RoomType:
+        return self._type
+
+    ###PAUL###############@
     ###---------- Getters 2.4 ----------
     @property
     def couleur(self) -> CouleurPiece:
-        return self._couleur
+        return self._type.couleur
 
     @property
     def effet_texte(self) -> str:
-        return self._effet_texte
+        return self._type.effet_texte
 
     #2.4###########Paul
     @property
     def name(self) -> str:
-        return self._name
+        return self._type.name
 
     @name.setter
     def name(self, value: str) -> None:
-        self._name = value
+        self._retype(name=value)
 
     @property
     def contents(self) -> List["GameObject"]:
@@ -53,75 +90,84 @@ class Room(ABC):
 
     @property
     def image_path(self) -> str:
-        return self._image_path
+        return self._type.image_path
 
     @image_path.setter
     def image_path(self, value: str) -> None:
-        self._image_path = value
+        self._retype(image_path=value)
 
     @property
     def gem_cost(self) -> int:
-        return self._gem_cost
+        return self._type.gem_cost
 
     @gem_cost.setter
     def gem_cost(self, value: int) -> None:
-        self._gem_cost = value
+        self._retype(gem_cost=value)
 
     @property
     def rarity(self) -> int:
-        return self._rarity
+        return self._type.rarity
 
     @rarity.setter
     def rarity(self, value: int) -> None:
-        if 0 <= value <= 3:
-            self._rarity = value
-        else:
-            raise ValueError("Rarity must be between 0 and 3")
+        self._retype(rarity=value)  # RoomType vérifie 0 <= rarity <= 3
 
     @property
-    def possible_doors(self) -> Set[Direction]:
-        return self._possible_doors
+    def possible_doors(self) -> FrozenSet[Direction]:
+        return self._type.possible_doors
 
     @possible_doors.setter
     def possible_doors(self, value: Set[Direction]) -> None:
-        self._possible_doors = value
+        self._retype(possible_doors=value)
 
     @property
-    def placement_condition(self) -> Optional[Callable[[int, int], bool]]:
-        return self._placement_condition
+    def placement_condition(self) -> Optional[Callable[[int, int, int, int], bool]]:
+        return self._type.placement_condition
 
     @placement_condition.setter
-    def placement_condition(self, value: Optional[Callable[[int, int], bool]]) -> None:
-        self._placement_condition = value
+    def placement_condition(self, value: Optional[Callable[[int, int, int, int], bool]]) -> None:
+        self._retype(placement_condition=value)
 
     @property
     def special_effect(self) -> Optional[Callable[["Game", int, int], None]]:
-        return self._special_effect
+        return self._type.special_effect
 
     @special_effect.setter
     def special_effect(self, value: Optional[Callable[["Game", int, int], None]]) -> None:
-        self._special_effect = value
+        self._retype(special_effect=value)
 
     @property
-    def draw_modifiers(self) -> dict:
+    def draw_modifiers(self) -> Mapping[str, float]:
         """Retourne un mapping optionnel {room_class_name: multiplier} pour ajuster probabilités de tirage."""
-        return self._draw_modifiers or {}
+        return self._type.draw_modifiers or {}
 
     @draw_modifiers.setter
     def draw_modifiers(self, value: dict) -> None:
-        self._draw_modifiers = value
+        self._retype(draw_modifiers=value)
+
+    def clone(self) -> "Room":
+        """
+        Copie de la salle posée : drapeaux d'état (_used, _taken, _bonus_given...) et contenu.
+        Le type (métadonnées immuables) est partagé.
+        """
+        new = object.__new__(type(self))
+        new.__dict__.update(self.__dict__)
+        new._contents = [obj.clone() for obj in self._contents]
+        return new
 
     # ---------- Comportements ----------
-    def can_be_placed(self, r: int, c: int) -> bool:
-        """Vérifie si la pièce peut être placée aux coordonnées données."""
-        if self._placement_condition is None:
+    def can_be_placed(self, r: int, c: int, rows: int, cols: int) -> bool:
+        """Vérifie si la pièce peut être placée aux coordonnées données, dans un manoir rows x cols."""
+        condition = self._type.placement_condition
+        if condition is None:
             return True
-        return self._placement_condition(r, c)
+        return condition(r, c, rows, cols)
 
     def on_enter(self, game: "Game", r: int, c: int) -> None:
         """Hook d'entrée : exécute _special_effect si défini, sinon l'effet standard abstrait."""
-        if self._special_effect is not None:
-            self._special_effect(game, r, c)
+        effect = self._type.special_effect
+        if effect is not None:
+            effect(game, r, c)
         else:
             self.on_enter_default(game, r, c)
 
@@ -1,8 +1,10 @@
 from __future__ import annotations
 from dataclasses import dataclass
-import random
+from types import MappingProxyType
+from typing import ClassVar, Mapping
 
-from rooms.room_base import Room
+from game.modifiers import ROOMS
+from rooms.room_base import ALL_DOORS, Room, RoomType
 from enums.direction import Direction
 from enums.room_colors import CouleurPiece
 from models.coord import Coord
@@ -23,16 +25,18 @@ from objects.permanent import (
 @dataclass
 class EntranceHall(Room):
     """Hall d'entrée, point de départ du joueur."""
+    ROOM_TYPE = RoomType(
+        name="Entrance Hall",
+        image_path="assets/rooms/entrance.png",
+        gem_cost=0,
+        rarity=0,
+        possible_doors=ALL_DOORS,
+        couleur=CouleurPiece.BLEUE,
+        effet_texte="Aucun effet."
+    )
+
     def __init__(self):
-        super().__init__(
-            _name="Entrance Hall",
-            _image_path="assets/rooms/entrance.png",
-            _gem_cost=0,
-            _rarity=0,
-            _possible_doors={Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT},
-            _couleur=CouleurPiece.BLEUE,
-            _effet_texte="Aucun effet."
-        )
+        super().__init__()
 
     def on_enter_default(self, game: "Game", r: int, c: int) -> None:
         pass
@@ -41,16 +45,18 @@ class EntranceHall(Room):
 @dataclass
 class PlainRoom(Room):
     """Salle générique sans effet particulier."""
+    ROOM_TYPE = RoomType(
+        name="Plain Room",
+        image_path="assets/rooms/sauna.png",
+        gem_cost=0,
+        rarity=1,
+        possible_doors=ALL_DOORS,
+        couleur=CouleurPiece.BLEUE,
+        effet_texte="Aucun effet."
+    )
+
     def __init__(self):
-        super().__init__(
-            _name="Plain Room",
-            _image_path="assets/rooms/sauna.png",
-            _gem_cost=0,
-            _rarity=1,
-            _possible_doors={Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT},
-            _couleur=CouleurPiece.BLEUE,
-            _effet_texte="Aucun effet."
-        )
+        super().__init__()
         self._used = False
 
     def on_enter_default(self, game: "Game", r: int, c: int) -> None:
@@ -73,22 +79,24 @@ class PlainRoom(Room):
 @dataclass
 class Kitchen(Room):
     """Salle de cuisine, sert aussi de petite boutique."""
+    ROOM_TYPE = RoomType(
+        name="Kitchen",
+        image_path="assets/rooms/Kitchen.png",
+        gem_cost=0,
+        rarity=1,
+        possible_doors=ALL_DOORS,
+        couleur=CouleurPiece.JAUNE,
+        effet_texte="30% : +2 pas (1 seule fois). Contient un comptoir, 1–5 pour acheter."
+    )
+
     def __init__(self):
-        super().__init__(
-            _name="Kitchen",
-            _image_path="assets/rooms/Kitchen.png",
-            _gem_cost=0,
-            _rarity=1,
-            _possible_doors={Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT},
-            _couleur=CouleurPiece.JAUNE,
-            _effet_texte="30% : +2 pas (1 seule fois). Contient un comptoir, 1–5 pour acheter."
-        )
+        super().__init__()
         self._bonus_given = False
 
     def on_enter_default(self, game: "Game", r: int, c: int) -> None:
         # 30% de chance de donner +2 pas, mais uniquement la première fois
         if not self._bonus_given:
-            if random.random() < 0.30:
+            if game.rng.random() < 0.30:
                 game.player.inventory.steps += 2
             self._bonus_given = True
 
@@ -101,16 +109,18 @@ class Kitchen(Room):
 @dataclass
 class Pantry(Room):
     """Réserve / salle de repos."""
+    ROOM_TYPE = RoomType(
+        name="Pantry",
+        image_path="assets/rooms/Pantry.png",
+        gem_cost=2,
+        rarity=2,
+        possible_doors={Direction.UP, Direction.DOWN},
+        couleur=CouleurPiece.BLEUE,
+        effet_texte="Vous vous reposez (+3 pas) et obtenez 1 clé (une seule fois)."
+    )
+
     def __init__(self):
-        super().__init__(
-            _name="Pantry",
-            _image_path="assets/rooms/Pantry.png",
-            _gem_cost=2,
-            _rarity=2,
-            _possible_doors={Direction.UP, Direction.DOWN},
-            _couleur=CouleurPiece.BLEUE,
-            _effet_texte="Vous vous reposez (+3 pas) et obtenez 1 clé (une seule fois)."
-        )
+        super().__init__()
         self._used = False
 
     def on_enter_default(self, game: "Game", r: int, c: int) -> None:
@@ -124,16 +134,18 @@ class Pantry(Room):
 @dataclass
 class LockerRoom(Room):
     """Salle de casiers avec un effet de repos : entrer ne coûte aucun pas."""
+    ROOM_TYPE = RoomType(
+        name="Locker Room",
+        image_path="assets/rooms/Locker.png",
+        gem_cost=1,
+        rarity=1,
+        possible_doors=ALL_DOORS,
+        couleur=CouleurPiece.VIOLETTE,  # Garde sa couleur d'origine
+        effet_texte="Salle de repos : le déplacement vers cette salle ne coûte pas de pas. Peut contenir des casiers à ouvrir."
+    )
+
     def __init__(self):
-        super().__init__(
-            _name="Locker Room",
-            _image_path="assets/rooms/Locker.png",
-            _gem_cost=1,
-            _rarity=1,
-            _possible_doors={Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT},
-            _couleur=CouleurPiece.VIOLETTE,  # Garde sa couleur d'origine
-            _effet_texte="Salle de repos : le déplacement vers cette salle ne coûte pas de pas. Peut contenir des casiers à ouvrir."
-        )
+        super().__init__()
         
 
     def on_enter_default(self, game: "Game", r: int, c: int) -> None:
@@ -141,25 +153,28 @@ class LockerRoom(Room):
         game.player.inventory.steps += 1
 
 
+def treasure_condition(r: int, c: int, rows: int, cols: int) -> bool:
+    return r < 4 * rows // 9  # moitié haute du manoir (r < 4 sur 9 rangées)
+
+
 @dataclass
 class UtilityRoom(Room):
     """Salle d'armoire, stock (+8 or, 15 clés), rare ."""
+    ROOM_TYPE = RoomType(
+        name="Treasure Room",
+        image_path="assets/rooms/UtilityCloset.png",
+        gem_cost=3,
+        rarity=3,
+        possible_doors={Direction.UP, Direction.DOWN},
+        couleur=CouleurPiece.JAUNE,
+        effet_texte="+4 or et 1 clé, mais une seule fois. Pas sur la rangée de départ.",
+        placement_condition=treasure_condition
+    )
+
     def __init__(self):
-        super().__init__(
-            _name="Treasure Room",
-            _image_path="assets/rooms/UtilityCloset.png",
-            _gem_cost=3,
-            _rarity=3,
-            _possible_doors={Direction.UP, Direction.DOWN},
-            _couleur=CouleurPiece.JAUNE,
-            _effet_texte="+4 or et 1 clé, mais une seule fois. Pas sur la rangée de départ."
-        )
+        super().__init__()
         self._taken = False
 
-        def treasure_condition(r: int, c: int) -> bool:
-            return r < 4  # pas sur la rangée de départ
-        self._placement_condition = treasure_condition
-
     def on_enter_default(self, game: "Game", r: int, c: int) -> None:
         if self._taken:
             return
@@ -168,34 +183,37 @@ class UtilityRoom(Room):
         self._taken = True
 
 
+def garden_condition(r: int, c: int, rows: int, cols: int) -> bool:
+    """Condition de placement : doit être sur les bords du manoir."""
+    return c == 0 or c == cols - 1  # en bordure
+
+
 @dataclass
 class Garden(Room):
     """Jardin : +1 gemme (et 30% de chance +1) — effet donné une seule fois."""
+    ROOM_TYPE = RoomType(
+        name="Garden",
+        image_path="assets/rooms/Garden.png",
+        gem_cost=1,
+        rarity=1,
+        possible_doors=ALL_DOORS,
+        couleur=CouleurPiece.VERTE,
+        effet_texte="+1 gemme garantie (une seule fois), 30% de chance d'en gagner +1 supplémentaire.",
+        placement_condition=garden_condition
+    )
+
     def __init__(self):
-        super().__init__(
-            _name="Garden",
-            _image_path="assets/rooms/Garden.png",
-            _gem_cost=1,
-            _rarity=1,
-            _possible_doors={Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT},
-            _couleur=CouleurPiece.VERTE,
-            _effet_texte="+1 gemme garantie (une seule fois), 30% de chance d'en gagner +1 supplémentaire."
-        )
+        super().__init__()
 
         self._used = False  #
 
-        def garden_condition(r: int, c: int) -> bool:
-            """Condition de placement : doit être sur les bords du manoir."""
-            return c == 0 or c == 8  # en bordure
-        self._placement_condition = garden_condition
-
     def on_enter_default(self, game: "Game", r: int, c: int) -> None:
         """Effet unique : +1 gemme (garantie) et 30% de chance d’en obtenir une deuxième."""
         if self._used:
             return  # déjà utilisé → ne rien faire
 
         game.player.inventory.gems += 1  # gemme garantie
-        if random.random() < 0.30:
+        if game.rng.random() < 0.30:
             game.player.inventory.gems += 1  # bonus aléatoire
 
         self._used = True  
@@ -205,16 +223,18 @@ class Garden(Room):
 @dataclass
 class Armory(Room):
     """Salle d'armurerie : clé + parfois un gros objet."""
+    ROOM_TYPE = RoomType(
+        name="Armory",
+        image_path="assets/rooms/Armory.png",
+        gem_cost=1,
+        rarity=2,
+        possible_doors=ALL_DOORS,
+        couleur=CouleurPiece.JAUNE,
+        effet_texte="Donne 1 clé et parfois un objet permanent (1 seule fois)."
+    )
+
     def __init__(self):
-        super().__init__(
-            _name="Armory",
-            _image_path="assets/rooms/Armory.png",
-            _gem_cost=1,
-            _rarity=2,
-            _possible_doors={Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT},
-            _couleur=CouleurPiece.JAUNE,
-            _effet_texte="Donne 1 clé et parfois un objet permanent (1 seule fois)."
-        )
+        super().__init__()
         self._gave_loot = False
 
     def on_enter_default(self, game: "Game", r: int, c: int) -> None:
@@ -225,10 +245,10 @@ class Armory(Room):
         game.player.inventory.keys += 1
 
         # 50% : un objet permanent dans la pièce
-        if random.random() < 0.5:
-            perm = random.choice([
-                ShovelObj(), HammerObj(), LockpickKitObj(), MetalDetectorObj(), RabbitFootObj()
-            ])
+        if game.rng.random() < 0.5:
+            perm = game.rng.choice([
+                ShovelObj, HammerObj, LockpickKitObj, MetalDetectorObj, RabbitFootObj
+            ])()
             cell = game.manor.cell(Coord(r, c))
             cell.room.contents.append(perm)
 
@@ -238,16 +258,18 @@ class Armory(Room):
 @dataclass
 class Library(Room):
     """Bibliothèque : +3 dé en entrant."""
+    ROOM_TYPE = RoomType(
+        name="Library",
+        image_path="assets/rooms/Library.png",
+        gem_cost=2,
+        rarity=2,
+        possible_doors=ALL_DOORS,
+        couleur=CouleurPiece.BLEUE,
+        effet_texte="+1 dé en entrant (une seule fois)."
+    )
+
     def __init__(self):
-        super().__init__(
-            _name="Library",
-            _image_path="assets/rooms/Library.png",
-            _gem_cost=2,
-            _rarity=2,
-            _possible_doors={Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT},
-            _couleur=CouleurPiece.BLEUE,
-            _effet_texte="+1 dé en entrant (une seule fois)."
-        )
+        super().__init__()
         self._used = False
 
     def on_enter_default(self, game: "Game", r: int, c: int) -> None:
@@ -260,16 +282,18 @@ class Library(Room):
 @dataclass
 class Antechamber(Room):
     """Salle finale du manoir (objectif)."""
+    ROOM_TYPE = RoomType(
+        name="Antechamber",
+        image_path="assets/rooms/exit.png",
+        gem_cost=0,
+        rarity=0,
+        possible_doors=ALL_DOORS,
+        couleur=CouleurPiece.BLEUE,
+        effet_texte="Objectif accompli."
+    )
+
     def __init__(self):
-        super().__init__(
-            _name="Antechamber",
-            _image_path="assets/rooms/exit.png",
-            _gem_cost=0,
-            _rarity=0,
-            _possible_doors={Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT},
-            _couleur=CouleurPiece.BLEUE,
-            _effet_texte="Objectif accompli."
-        )
+        super().__init__()
 
     def on_enter_default(self, game: "Game", r: int, c: int) -> None:
         pass
@@ -282,17 +306,19 @@ class Antechamber(Room):
 @dataclass
 class Furnace(Room):
     """Furnace : favorise salles riches, +10 or une seule fois et 5 clés, 7 gemmes mais enleve 2 pas a chauqe passage."""
+    ROOM_TYPE = RoomType(
+        name="Furnace",
+        image_path="assets/rooms/Furnace.png",
+        gem_cost=0,
+        rarity=2,
+        possible_doors=ALL_DOORS,
+        couleur=CouleurPiece.ROUGE,
+        effet_texte="Chaleur qui attire les trésors. +10 or (1 seule fois) mais perds 2 pas à chaque passage.",
+        draw_modifiers={"UtilityRoom": 1.6, "Armory": 1.3}
+    )
+
     def __init__(self):
-        super().__init__(
-            _name="Furnace",
-            _image_path="assets/rooms/Furnace.png",
-            _gem_cost=0,
-            _rarity=2,
-            _possible_doors={Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT},
-            _couleur=CouleurPiece.ROUGE,
-            _effet_texte="Chaleur qui attire les trésors. +10 or (1 seule fois) mais perds 2 pas à chaque passage."
-        )
-        self.draw_modifiers = {"TreasureRoom": 1.6, "Armory": 1.3}
+        super().__init__()
         self._gold_given = False
 
     def on_enter_default(self, game: "Game", r: int, c: int) -> None:
@@ -308,17 +334,19 @@ class Furnace(Room):
 @dataclass
 class Greenhouse(Room):
     """Greenhouse : favorise jardins et nourriture."""
+    ROOM_TYPE = RoomType(
+        name="Greenhouse",
+        image_path="assets/rooms/Greenhouse.png",
+        gem_cost=1,
+        rarity=1,
+        possible_doors=ALL_DOORS,
+        couleur=CouleurPiece.VERTE,
+        effet_texte="Atmosphère humide propice aux jardins.",
+        draw_modifiers={"Garden": 2.0, "Pantry": 1.2}
+    )
+
     def __init__(self):
-        super().__init__(
-            _name="Greenhouse",
-            _image_path="assets/rooms/Greenhouse.png",
-            _gem_cost=1,
-            _rarity=1,
-            _possible_doors={Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT},
-            _couleur=CouleurPiece.VERTE,
-            _effet_texte="Atmosphère humide propice aux jardins."
-        )
-        self.draw_modifiers = {"Garden": 2.0, "Pantry": 1.2}
+        super().__init__()
         self.used = False
 
     def on_enter_default(self, game: "Game", r: int, c: int) -> None:
@@ -336,17 +364,19 @@ class Greenhouse(Room):
 @dataclass
 class Solarium(Room):
     """Solarium : favorise salles de savoir + donne 1 clé une fois."""
+    ROOM_TYPE = RoomType(
+        name="Solarium",
+        image_path="assets/rooms/Solarium.png",
+        gem_cost=1,
+        rarity=1,
+        possible_doors=ALL_DOORS,
+        couleur=CouleurPiece.VERTE,
+        effet_texte="Favorise Library. Donne 1 clé (1 fois).",
+        draw_modifiers={"Library": 1.5, "PlainRoom": 1.2}
+    )
+
     def __init__(self):
-        super().__init__(
-            _name="Solarium",
-            _image_path="assets/rooms/Solarium.png",
-            _gem_cost=1,
-            _rarity=1,
-            _possible_doors={Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT},
-            _couleur=CouleurPiece.VERTE,
-            _effet_texte="Favorise Library. Donne 1 clé (1 fois)."
-        )
-        self.draw_modifiers = {"Library": 1.5, "PlainRoom": 1.2}
+        super().__init__()
         self._gave_key = False
 
     def on_enter_default(self, game: "Game", r: int, c: int) -> None:
@@ -359,35 +389,38 @@ class Solarium(Room):
 @dataclass
 class Veranda(Room):
     """Veranda : petite chance de gemme et influence sur les loots et la salle Garden.""" #ici on modifie la proba de cherccher de la nourriture apres passage dans chaque salle
-    def __init__(self):
-        super().__init__(
-            _name="Veranda",
-            _image_path="assets/rooms/Veranda.png",
-            _gem_cost=0,
-            _rarity=2,
-            _possible_doors={Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT},
-            _couleur=CouleurPiece.VERTE,
-            _effet_texte=(
-                "30% de chance de +1 gemme en entrant. "
-                "Augmente les chances de nourriture de 60% pour les prochaines salles."
-            )
-        )
+    ROOM_TYPE = RoomType(
+        name="Veranda",
+        image_path="assets/rooms/Veranda.png",
+        gem_cost=0,
+        rarity=2,
+        possible_doors=ALL_DOORS,
+        couleur=CouleurPiece.VERTE,
+        effet_texte=(
+            "30% de chance de +1 gemme en entrant. "
+            "Augmente les chances de nourriture de 60% pour les 3 prochaines salles posées."
+        ),
         #le TIRAGE DE SALLES, pas pour le loot
-        self.draw_modifiers = {"Garden": 1.5}
+        draw_modifiers={"Garden": 1.5}
+    )
+
+    # boost de loot (nom de classe d'objet -> multiplicateur) et sa durée en salles posées
+    LOOT_BOOST: ClassVar[Mapping[str, float]] = MappingProxyType(
+        {name: 1.5 for name in ("Apple", "Banana", "Cake", "Sandwich", "Meal", "Chest")}
+    )
+    LOOT_BOOST_ROOMS: ClassVar[int] = 3
+
+    def __init__(self):
+        super().__init__()
 
     def on_enter_default(self, game: "Game", r: int, c: int) -> None:
         # petit bonus immédiat
-        if random.random() < 0.30:
+        if game.rng.random() < 0.30:
             game.player.inventory.gems += 1
 
-        # s'assurer que le dict existe (au cas où)
-        if not hasattr(game, "temporary_loot_modifiers") or game.temporary_loot_modifiers is None:
-            game.temporary_loot_modifiers = {}
-
         # 👉 ici on booste VIOLEMMENT la nourriture et le coffre
-        # pour que tu le voies tout de suite dans la prochaine salle générée
-        for obj_name in ("Apple", "Banana", "Cake", "Sandwich", "Meal", "Chest"):
-            game.temporary_loot_modifiers[obj_name] = 1.5
+        # pour les prochaines salles posées (repasser par la Veranda relance la durée)
+        game.loot_modifiers.schedule("Veranda", self.LOOT_BOOST, self.LOOT_BOOST_ROOMS, ROOMS)
 
 
 
@@ -395,22 +428,24 @@ class Veranda(Room):
 @dataclass
 class MaidsChamber(Room):
     """Maid's Chamber : chance d'un dé."""
+    ROOM_TYPE = RoomType(
+        name="Maid's Chamber",
+        image_path="assets/rooms/MaidsChamber.png",
+        gem_cost=0,
+        rarity=1,
+        possible_doors=ALL_DOORS,
+        couleur=CouleurPiece.ROUGE,
+        effet_texte="20% : +1 dé."
+    )
+
     def __init__(self):
-        super().__init__(
-            _name="Maid's Chamber",
-            _image_path="assets/rooms/MaidsChamber.png",
-            _gem_cost=0,
-            _rarity=1,
-            _possible_doors={Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT},
-            _couleur=CouleurPiece.ROUGE,
-            _effet_texte="20% : +1 dé."
-        )
+        super().__init__()
         self.used=False
 
     def on_enter_default(self, game: "Game", r: int, c: int) -> None:
         if self.used:
             return
-        if random.random() < 0.20:
+        if game.rng.random() < 0.20:
             game.player.inventory.dice += 1
         self.used=True
         
@@ -423,16 +458,18 @@ class MaidsChamber(Room):
 @dataclass
 class MasterBedroom(Room):
     """Quand elle est tirée : donne 1 clé."""
+    ROOM_TYPE = RoomType(
+        name="Master Bedroom",
+        image_path="assets/rooms/bedroom.png",
+        gem_cost=1,
+        rarity=2,
+        possible_doors=ALL_DOORS,
+        couleur=CouleurPiece.VIOLETTE,
+        effet_texte="Donne 1 clé quand elle apparaît dans les choix."
+    )
+
     def __init__(self):
-        super().__init__(
-            _name="Master Bedroom",
-            _image_path="assets/rooms/bedroom.png",
-            _gem_cost=1,
-            _rarity=2,
-            _possible_doors={Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT},
-            _couleur=CouleurPiece.VIOLETTE,
-            _effet_texte="Donne 1 clé quand elle apparaît dans les choix."
-        )
+        super().__init__()
         self._bonus_given = False
 
     def on_enter_default(self, game, r, c):
@@ -446,16 +483,18 @@ class MasterBedroom(Room):
 @dataclass
 class WeightRoom(Room):
     """Quand elle est tirée : enlève la moitié des pas."""
+    ROOM_TYPE = RoomType(
+        name="Weight Room",
+        image_path="assets/rooms/weightroom.png",
+        gem_cost=0,
+        rarity=1,
+        possible_doors=ALL_DOORS,
+        couleur=CouleurPiece.ROUGE,
+        effet_texte="Au tirage : vous perdez la moitie de vos pas."
+    )
+
     def __init__(self):
-        super().__init__(
-            _name="Weight Room",
-            _image_path="assets/rooms/weightroom.png",
-            _gem_cost=0,
-            _rarity=1,
-            _possible_doors={Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT},
-            _couleur=CouleurPiece.ROUGE,
-            _effet_texte="Au tirage : vous perdez la moitie de vos pas."
-        )
+        super().__init__()
         self._done = False
 
     def on_enter_default(self, game, r, c):
@@ -476,16 +515,18 @@ class ChamberOfMirrors(Room):
     Quand tu ENTRES dans cette salle pour la première fois,
     elle ajoute la salle PoolRoom au catalogue de tirage.
     """
+    ROOM_TYPE = RoomType(
+        name="Chamber of Mirrors",
+        image_path="assets/rooms/Chamberofmirrors.png",
+        gem_cost=0,
+        rarity=2,
+        possible_doors=ALL_DOORS,
+        couleur=CouleurPiece.VIOLETTE,
+        effet_texte="Ajoute 'Pool Room' au tirage (une seule fois)."
+    )
+
     def __init__(self):
-        super().__init__(
-            _name="Chamber of Mirrors",
-            _image_path="assets/rooms/Chamberofmirrors.png",
-            _gem_cost=0,
-            _rarity=2,
-            _possible_doors={Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT},
-            _couleur=CouleurPiece.VIOLETTE,
-            _effet_texte="Ajoute 'Pool Room' au tirage (une seule fois)."
-        )
+        super().__init__()
         self._done = False
 
     def on_enter_default(self, game: "Game", r: int, c: int) -> None:
@@ -506,17 +547,19 @@ class RumpusRoom(Room):
     Petite salle bonus qu'on ne peut pas tirer au début,
     mais qu'on pourra tirer après être passé dans ChamberOfMirrors.
     """
-    def __init__(self):
-        super().__init__(
-            _name="Pool Room",
-            _image_path="assets/rooms/RumusRoom.png",
-            _gem_cost=1,
-            _rarity=1,
-            _possible_doors={Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT},
-            _couleur=CouleurPiece.BLEUE,
-            _effet_texte="+8 golds en entrant (salle débloquée)."
+    ROOM_TYPE = RoomType(
+        name="Pool Room",
+        image_path="assets/rooms/RumusRoom.png",
+        gem_cost=1,
+        rarity=1,
+        possible_doors=ALL_DOORS,
+        couleur=CouleurPiece.BLEUE,
+        effet_texte="+8 golds en entrant (salle débloquée)."
             
-        )
+    )
+
+    def __init__(self):
+        super().__init__()
         self.used = False
 
     def on_enter_default(self, game: "Game", r: int, c: int) -> None:
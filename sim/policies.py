@@ -0,0 +1,157 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+import random
+
+from enums.direction import Direction
+from models.coord import Coord
+from world.topology import DIRS
+from objects.interactive import InteractiveObject, Vendor
+from items.permanent_item import tool_mask
+
+# Une action = (type, argument éventuel) :
+#   ("open", Direction)  -> Game.open_or_place
+#   ("choose", int)      -> Game.choose_room (+ création de la porte, comme main_graphiqc)
+#   ("redraw",)          -> Game.redraw_rooms
+#   ("move", Direction)  -> Game.move
+#   ("pick",)            -> Game.pick_up_here
+#   ("buy", int)         -> Vendor.buy_item (index 1..n)
+Action = Tuple
+
+
+class Policy(ABC):
+    """
+    Politique de décision pour une partie sans interface.
+    Une instance est créée par partie : elle peut garder un état interne.
+    """
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng or random.Random()
+
+    @abstractmethod
+    def choose_action(self, game: "Game") -> Optional[Action]:
+        """Retourne la prochaine action, ou None pour abandonner la partie."""
+        pass
+
+    def on_result(self, game: "Game", action: Action, ok: bool) -> None:
+        """Hook appelé après chaque action (par défaut, rien)."""
+        pass
+
+    # ---------- helpers communs ----------
+    @staticmethod
+    def affordable_choices(game: "Game") -> list[int]:
+        """Index des pièces tirées que le joueur peut payer."""
+        gems = game.player.inventory.gems
+        return [i for i, room in enumerate(game.current_room_choices) if room.gem_cost <= gems]
+
+    @staticmethod
+    def can_pick_first(game: "Game") -> bool:
+        """Le premier objet de la salle peut-il être pris sans dépenser de clé ?"""
+        room = game.manor.cell(game.player.pos).room
+        if room is None or not room.contents:
+            return False
+        obj = room.contents[0]
+        if isinstance(obj, Vendor):
+            return False
+        if isinstance(obj, InteractiveObject):
+            inv = game.player.inventory
+            return inv.tool_mask & tool_mask(obj.required_tools) != 0
+        return True
+
+
+class RandomPolicy(Policy):
+    """Choisit uniformément parmi les actions plausibles (référence basse)."""
+
+    def choose_action(self, game: "Game") -> Optional[Action]:
+        if game.current_room_choices:
+            options = [("choose", i) for i in self.affordable_choices(game)]
+            if game.player.inventory.dice > 0:
+                options.append(("redraw",))
+            return self.rng.choice(options) if options else None
+
+        options = []
+        if self.can_pick_first(game):
+            options.append(("pick",))
+        cur_cell = game.manor.cell(game.player.pos)
+        for d in DIRS:
+            nxt = game._neighbor(game.player.pos, d)
+            if nxt is None:
+                continue
+            door = cur_cell.doors.get(d)
+            if door is None:
+                options.append(("open", d))
+            elif door.can_open(game.player.inventory):
+                options.append(("move", d))
+        return self.rng.choice(options) if options else None
+
+
+class GreedyPolicy(Policy):
+    """
+    Monte vers l'antichambre : explore les cases qui rapprochent de l'objectif,
+    évite de tourner en rond, prend les pièces les moins chères et ramasse
+    tout ce qui ne coûte pas de clé.
+    """
+    def __init__(self, rng: Optional[random.Random] = None):
+        super().__init__(rng)
+        self._visits: Dict[Coord, int] = {}
+
+    def choose_action(self, game: "Game") -> Optional[Action]:
+        inv = game.player.inventory
+
+        # 1) un tirage est affiché : la pièce payable la moins chère
+        if game.current_room_choices:
+            options = self.affordable_choices(game)
+            if not options:
+                return ("redraw",) if inv.dice > 0 else None
+            choices = game.current_room_choices
+            best = min(options, key=lambda i: (choices[i].gem_cost, -len(choices[i].possible_doors)))
+            return ("choose", best)
+
+        pos = game.player.pos
+        self._visits[pos] = self._visits.get(pos, 0) + 1
+
+        # 2) ramasser ce qui est gratuit
+        if self.can_pick_first(game):
+            return ("pick",)
+
+        # 3) acheter une clé si on a l'or
+        room = game.manor.cell(pos).room
+        if room is not None and inv.gold >= 8 and any(isinstance(o, Vendor) for o in room.contents):
+            return ("buy", 3)
+
+        # 4) l'antichambre est atteignable par les portes existantes : on y va directement
+        route = game.route_to()
+        if route is not None and 0 < route.steps <= inv.steps:
+            return ("move", route.directions[0])
+
+        # 5) direction au meilleur score (distance à l'objectif + pénalité de revisite)
+        goal = game.manor.goal
+        cur_cell = game.manor.cell(pos)
+        best_action, best_score = None, None
+        for d in DIRS:
+            nxt = game._neighbor(pos, d)
+            if nxt is None:
+                continue
+            dist = abs(nxt.r - goal.r) + abs(nxt.c - goal.c)
+            door = cur_cell.doors.get(d)
+            if door is not None:
+                if not door.can_open(inv):
+                    continue
+                action = ("move", d)
+                score = dist + 3 * self._visits.get(nxt, 0)
+            elif game.manor.room_at(nxt) is None:
+                action = ("open", d)
+                score = dist - 0.5
+            else:
+                action = ("open", d)
+                score = dist + 3 * self._visits.get(nxt, 0) + 0.25
+            score += self.rng.random() * 0.1  # départage les égalités
+            if best_score is None or score < best_score:
+                best_action, best_score = action, score
+        return best_action
+
+
+# Politiques disponibles par nom (utilisé par la CLI et les workers)
+POLICIES = {
+    "random": RandomPolicy,
+    "greedy": GreedyPolicy,
+}
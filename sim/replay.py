@@ -0,0 +1,107 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Type, Union
+import os
+
+from enums.direction import Direction
+from game.action_log import ActionLog, LOG_VERSION
+from game.game import Game
+from models.coord import Coord
+from objects.base import GameObject
+from objects.interactive import Vendor
+from world.manor import Manor
+
+# s'assure que toutes les sous-classes d'objets sont chargées pour le registre
+import objects.consumable  # noqa: F401
+import objects.permanent  # noqa: F401
+
+
+def _object_types() -> Dict[str, Type[GameObject]]:
+    """Classes d'objets par nom (pour rejouer les "place")."""
+    types: Dict[str, Type[GameObject]] = {}
+    stack = list(GameObject.__subclasses__())
+    while stack:
+        cls = stack.pop()
+        types.setdefault(cls.__name__, cls)
+        stack.extend(cls.__subclasses__())
+    return types
+
+
+def apply_logged(game: Game, entry: tuple, object_types: Optional[Dict[str, Type[GameObject]]] = None) -> None:
+    """Rejoue une entrée (op, *args) du journal sur la partie."""
+    op, args = entry[0], entry[1:]
+    if op == "open":
+        game.open_or_place(Direction[args[0]])
+    elif op == "move":
+        game.move(Direction[args[0]])
+    elif op == "choose":
+        game.choose_room(args[0])
+    elif op == "redraw":
+        game.redraw_rooms()
+    elif op == "pick":
+        game.pick_up_here()
+    elif op == "place":
+        (r, c), type_name = args
+        cls = (object_types or _object_types())[type_name]
+        game.place_object_at(Coord(r, c), cls())
+    elif op == "buy":
+        room = game.manor.cell(game.player.pos).room
+        vendor = next((o for o in room.contents if isinstance(o, Vendor)), None) if room else None
+        if vendor is not None:
+            vendor.buy_item(game, args[0])
+    else:
+        raise ValueError(f"Action de journal inconnue : {op}")
+
+
+def replay(log: Union[ActionLog, str]) -> Game:
+    """Reconstruit la partie finale d'un journal (objet ou chemin de fichier), sans interface."""
+    if isinstance(log, str):
+        log = ActionLog.load_file(log)
+    header = log.header
+    if header.get("version") != LOG_VERSION:
+        raise ValueError(f"Version de journal non supportée : {header.get('version')}")
+    if header.get("seed") is None:
+        raise ValueError("Journal sans graine : la partie n'est pas rejouable.")
+
+    manor = Manor(header.get("rows", 9), header.get("cols", 5))
+    game = Game(manor, seed=header["seed"], rng_mode=header.get("rng_mode", "sequential"))
+
+    object_types = _object_types()
+    for entry in log.actions:
+        apply_logged(game, entry, object_types)
+    return game
+
+
+@dataclass
+class ReplayResult:
+    """État final d'une session rejouée."""
+    path: str
+    outcome: str          # "win" | "out_of_steps" | "unfinished"
+    steps_remaining: int
+    rooms_placed: int
+    actions: int
+
+
+def replay_file(path: str) -> ReplayResult:
+    log = ActionLog.load_file(path)
+    game = replay(log)
+    inv = game.player.inventory
+    if game.reached_exit():
+        outcome = "win"
+    elif inv.steps <= 0:
+        outcome = "out_of_steps"
+    else:
+        outcome = "unfinished"
+    rooms = game.manor.placed_count() - 2
+    return ReplayResult(path, outcome, inv.steps, rooms, len(log))
+
+
+def replay_many(paths: Iterable[str], workers: Optional[int] = None) -> List[ReplayResult]:
+    """Rejoue un lot de sessions (ex: celles d'une journée après un changement de règles)."""
+    paths = list(paths)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) <= 1:
+        return [replay_file(p) for p in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(replay_file, paths))
@@ -0,0 +1,200 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Dict, List, Optional, Type, Union
+import os
+import random
+
+from game.game import Game
+from world.manor import Manor
+from world.compact_manor import CompactManor
+from objects.interactive import Vendor
+from sim.policies import Action, Policy, POLICIES
+
+RESOURCES = ("steps", "gold", "gems", "keys", "dice")
+
+# stockages de grille disponibles
+MANOR_STORAGES = {
+    "sparse": Manor,
+    "compact": CompactManor,
+}
+
+
+@dataclass
+class GameResult:
+    """Résultat d'une partie simulée."""
+    seed: int
+    outcome: str                 # "win" | "out_of_steps" | "dead" | "stuck" | "max_actions"
+    steps_remaining: int
+    rooms_placed: int
+    actions: int
+    spent: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def won(self) -> bool:
+        return self.outcome == "win"
+
+
+@dataclass
+class SimulationReport:
+    """Agrégat de plusieurs parties simulées."""
+    policy: str
+    results: List[GameResult] = field(default_factory=list)
+
+    @property
+    def games(self) -> int:
+        return len(self.results)
+
+    @property
+    def win_rate(self) -> float:
+        return sum(r.won for r in self.results) / self.games if self.results else 0.0
+
+    def mean(self, attr: str) -> float:
+        return sum(getattr(r, attr) for r in self.results) / self.games if self.results else 0.0
+
+    def mean_spent(self) -> Dict[str, float]:
+        n = self.games or 1
+        return {res: sum(r.spent.get(res, 0) for r in self.results) / n for res in RESOURCES}
+
+    def outcomes(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for r in self.results:
+            counts[r.outcome] = counts.get(r.outcome, 0) + 1
+        return counts
+
+    def summary(self) -> str:
+        spent = ", ".join(f"{k}={v:.2f}" for k, v in self.mean_spent().items())
+        return "\n".join([
+            f"Politique : {self.policy} ({self.games} parties)",
+            f"Taux de victoire : {self.win_rate:.1%}",
+            f"Issues : {self.outcomes()}",
+            f"Pas restants (moyenne) : {self.mean('steps_remaining'):.2f}",
+            f"Salles posées (moyenne) : {self.mean('rooms_placed'):.2f}",
+            f"Ressources dépensées (moyenne) : {spent}",
+        ])
+
+
+# =============================
+# APPLICATION DES ACTIONS
+# =============================
+def apply_action(game: Game, action: Action) -> bool:
+    """Applique une action de politique sur la partie (même enchaînement que main_graphiqc)."""
+    kind = action[0]
+    if kind == "open":
+        return game.open_or_place(action[1])
+    if kind == "choose":
+        direction = game.current_draw_direction
+        if not game.choose_room(action[1]):
+            return False
+        # comme dans l'interface : la porte est créée juste après la pose
+        game.open_or_place(direction)
+        return True
+    if kind == "redraw":
+        return game.redraw_rooms()
+    if kind == "move":
+        return game.move(action[1])
+    if kind == "pick":
+        return game.pick_up_here() is not None
+    if kind == "buy":
+        room = game.manor.cell(game.player.pos).room
+        vendor = next((o for o in room.contents if isinstance(o, Vendor)), None) if room else None
+        if vendor is None:
+            return False
+        before = game.player.inventory.gold
+        vendor.buy_item(game, action[1])
+        return game.player.inventory.gold < before
+    raise ValueError(f"Action inconnue : {kind}")
+
+
+def _resolve_policy(policy: Union[str, Type[Policy]]) -> Type[Policy]:
+    if isinstance(policy, str):
+        try:
+            return POLICIES[policy]
+        except KeyError:
+            raise ValueError(f"Politique inconnue : {policy} (disponibles : {sorted(POLICIES)})")
+    return policy
+
+
+def run_game(
+    seed: int,
+    policy: Union[str, Type[Policy]] = "greedy",
+    max_actions: int = 2000,
+    rng_mode: str = "sequential",
+    storage: str = "sparse",
+    rows: int = 9,
+    cols: int = 5,
+) -> GameResult:
+    """
+    Joue une partie complète sans pygame et retourne son résultat.
+    Avec rng_mode="counter", deux politiques jouées sur la même graine voient
+    le même contenu de manoir (nombres aléatoires communs).
+    """
+    policy_cls = _resolve_policy(policy)
+
+    game = Game(MANOR_STORAGES[storage](rows, cols), seed=seed, rng_mode=rng_mode)
+    agent = policy_cls(random.Random(seed ^ 0x5EED))
+
+    rooms_placed = 0
+    outcome = "max_actions"
+    n = 0
+    for n in range(1, max_actions + 1):
+        action = agent.choose_action(game)
+        if action is None:
+            outcome = "stuck"
+            break
+        ok = apply_action(game, action)
+        if ok and action[0] == "choose":
+            rooms_placed += 1
+        agent.on_result(game, action, ok)
+
+        if game.reached_exit():
+            outcome = "win"
+            break
+        if game.player.inventory.steps <= 0:
+            outcome = "out_of_steps"
+            break
+        if game.is_dead_run():
+            outcome = "dead"
+            break
+
+    inv = game.player.inventory
+    return GameResult(
+        seed=seed,
+        outcome=outcome,
+        steps_remaining=inv.steps,
+        rooms_placed=rooms_placed,
+        actions=n,
+        spent=dict(inv.spent),
+    )
+
+
+def simulate(
+    games: int,
+    policy: Union[str, Type[Policy]] = "greedy",
+    workers: Optional[int] = None,
+    seed: int = 0,
+    max_actions: int = 2000,
+    rng_mode: str = "sequential",
+    storage: str = "sparse",
+    rows: int = 9,
+    cols: int = 5,
+) -> SimulationReport:
+    """
+    Lance `games` parties (graines seed..seed+games-1) réparties sur un pool de processus.
+    workers=1 joue tout dans le processus courant.
+    """
+    seeds = range(seed, seed + games)
+    job = partial(run_game, policy=policy, max_actions=max_actions, rng_mode=rng_mode,
+                  storage=storage, rows=rows, cols=cols)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        results = [job(s) for s in seeds]
+    else:
+        chunksize = max(1, games // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(job, seeds, chunksize=chunksize))
+
+    name = policy if isinstance(policy, str) else policy.__name__
+    return SimulationReport(policy=name, results=results)
@@ -0,0 +1,34 @@
+import pytest
+
+from enums.direction import Direction
+from game.action_log import ActionLog
+from game.game import Game
+from sim.replay import replay
+from world.manor import Manor
+
+
+def _play_with_keywords(game):
+    assert game.open_or_place(d=Direction.UP)
+    assert game.current_room_choices
+    assert game.choose_room(index=0)
+    game.move(d=Direction.UP)
+    return game
+
+
+def test_keyword_call_without_log():
+    game = _play_with_keywords(Game(Manor(), seed=4))
+    assert game.manor.room_at(game.manor.topology.neighbor(game.manor.start, Direction.UP)) is not None
+
+
+def test_keyword_call_with_log_replays():
+    game = _play_with_keywords(Game(Manor(), seed=4, action_log=ActionLog()))
+    assert game.action_log.actions[:3] == [("open", "UP"), ("choose", 0), ("move", "UP")]
+    again = replay(game.action_log)
+    assert again.manor == game.manor
+    assert again.player.pos == game.player.pos
+
+
+def test_unknown_keyword_still_raises():
+    game = Game(Manor(), seed=4, action_log=ActionLog())
+    with pytest.raises(TypeError):
+        game.move(direction=Direction.UP)
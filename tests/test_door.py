@@ -0,0 +1,41 @@
+import pytest
+
+from enums.direction import Direction
+from enums.lock_level import LockLevel
+from models.coord import Coord
+from models.door import Door
+from rooms.special_rooms import PlainRoom
+from sim.simulation import MANOR_STORAGES
+
+
+def _manor_with_door(storage):
+    """Manoir 9x5 avec une porte ouverte de (8, 2) vers (7, 2), posée des deux côtés du mur."""
+    manor = MANOR_STORAGES[storage](9, 5)
+    near, far = Coord(8, 2), Coord(7, 2)
+    manor.place_room(near, PlainRoom())
+    manor.place_room(far, PlainRoom())
+    door = Door(LockLevel.LOCKED, near, far)
+    manor.add_door(near, Direction.UP, door)
+    manor.add_door(far, Direction.DOWN, door)
+    return manor, near, far
+
+
+@pytest.mark.parametrize("storage", sorted(MANOR_STORAGES))
+def test_other_side_from_both_sides(storage):
+    manor, near, far = _manor_with_door(storage)
+    assert manor.cell(near).doors[Direction.UP].other_side(near) == far
+    assert manor.cell(far).doors[Direction.DOWN].other_side(far) == near
+
+
+def test_backends_agree_from_far_side():
+    results = []
+    for storage in sorted(MANOR_STORAGES):
+        manor, near, far = _manor_with_door(storage)
+        door = manor.cell(far).doors[Direction.DOWN]
+        results.append((door.other_side(far), door.lock, set(door.sides)))
+    assert all(r == results[0] for r in results)
+    assert results[0] == (Coord(8, 2), LockLevel.LOCKED, {Coord(8, 2), Coord(7, 2)})
+
+
+def test_door_has_no_viewer_independent_target():
+    assert not hasattr(Door, "leads_to")
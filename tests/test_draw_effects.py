@@ -0,0 +1,40 @@
+import random
+
+from enums.direction import Direction
+from game.game import Game
+from models.coord import Coord
+from rooms.draw_modifiers import ClassBoost
+from rooms.special_rooms import Library
+from world.manor import Manor
+
+TARGET = Coord(7, 2)
+
+
+def test_draw_effect_changes_distribution_and_draws():
+    game = Game(Manor(), seed=1)
+    before = game.draw_distribution(TARGET, Direction.UP)[Library]
+
+    game.add_draw_effect(ClassBoost("Study", (((Library,), 20.0),)))
+    boosted = game.draw_distribution(TARGET, Direction.UP)[Library]
+    assert boosted > before + 0.3
+
+    # les tirages réels suivent la même table
+    rng, hits, n = random.Random(0), 0, 2000
+    game.rng = rng
+    for _ in range(n):
+        hits += any(isinstance(room, Library) for room in game.draw_three_rooms(TARGET.r, TARGET.c, Direction.UP))
+    assert abs(hits / n - boosted) < 0.05
+
+    # même source : remplacé, pas empilé ; retiré : retour à la distribution de base
+    game.add_draw_effect(ClassBoost("Study", (((Library,), 20.0),)))
+    assert len(game.draw_effects) == 1
+    game.remove_draw_effect("Study")
+    assert game.draw_distribution(TARGET, Direction.UP)[Library] == before
+
+
+def test_clone_keeps_draw_effects():
+    game = Game(Manor(), seed=1)
+    game.add_draw_effect(ClassBoost("Study", (((Library,), 20.0),)))
+    clone = game.clone()
+    clone.remove_draw_effect("Study")
+    assert len(game.draw_effects) == 1 and clone.draw_effects == ()
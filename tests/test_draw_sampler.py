@@ -0,0 +1,73 @@
+import random
+import time
+from itertools import permutations
+
+import pytest
+
+from enums.direction import Direction
+from rooms.catalog import RoomSpec
+from rooms.draw_sampler import DrawTable, RoomDrawSampler
+
+
+def _table(n, seed=0):
+    """Catalogue synthétique de n salles (coûts et raretés variés, environ un tiers gratuites)."""
+    rng = random.Random(seed)
+    specs = tuple(
+        RoomSpec(type(f"Synthetic{i}", (), {}), i % 3, rng.randrange(4), frozenset({Direction.UP}))
+        for i in range(n)
+    )
+    return DrawTable(specs, [pow(1 / 3, s.rarity) * rng.uniform(0.5, 2.0) for s in specs])
+
+
+def _brute_force(table, k):
+    """Énumère toutes les suites ordonnées de k tirages (règle de la salle gratuite comprise)."""
+    cands, w = table.candidates, table.weights
+    free_w = {f: pow(1 / 3, cands[f].rarity) for f in table.free}
+    probs = [0.0] * len(cands)
+    for seq in permutations(range(len(cands)), k - 1):
+        p, remaining = 1.0, sum(w)
+        for i in seq:
+            p *= w[i] / remaining
+            remaining -= w[i]
+        for i in seq:
+            probs[i] += p
+        if free_w and not any(cands[i].gem_cost == 0 for i in seq):
+            for f, fw in free_w.items():
+                probs[f] += p * fw / sum(free_w.values())
+        else:
+            for i in range(len(cands)):
+                if i not in seq:
+                    probs[i] += p * w[i] / remaining
+    return {spec.cls: p for spec, p in zip(cands, probs)}
+
+
+@pytest.mark.parametrize("k", [2, 3])
+def test_inclusion_matches_enumeration(k):
+    table = _table(9, seed=k)
+    exact = _brute_force(table, k)
+    got = RoomDrawSampler().inclusion(table, k)
+    assert got.keys() == exact.keys()
+    for cls, p in exact.items():
+        assert got[cls] == pytest.approx(p, abs=1e-12)
+
+
+def test_inclusion_large_catalog():
+    table = _table(300)
+    t0 = time.perf_counter()
+    probs = RoomDrawSampler().inclusion(table, 3)
+    elapsed = time.perf_counter() - t0
+    assert len(probs) == 300
+    assert sum(probs.values()) == pytest.approx(3.0)
+    assert all(0.0 <= p <= 1.0 for p in probs.values())
+    # O(n^2) : quelques centièmes de seconde ici (l'énumération des 3 tirages prenait plusieurs secondes)
+    assert elapsed < 1.0
+
+    # cohérent avec le tirage réel
+    sampler, rng, n = RoomDrawSampler(), random.Random(1), 20000
+    counts = {}
+    for _ in range(n):
+        for spec in sampler.sample(table, rng, k=3):
+            counts[spec.cls] = counts.get(spec.cls, 0) + 1
+    top = sorted(probs, key=probs.get, reverse=True)[:5]
+    for cls in top:
+        assert counts.get(cls, 0) / n == pytest.approx(probs[cls], abs=0.02)
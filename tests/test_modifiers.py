@@ -0,0 +1,18 @@
+import pytest
+
+from game.game import Game
+from game.modifiers import ROOMS
+from world.manor import Manor
+
+
+def test_temporary_loot_modifiers_is_read_only():
+    game = Game(Manor(), seed=1)
+    game.loot_modifiers.schedule("Veranda", {"Apple": 2.0}, lifetime=2, clock=ROOMS)
+    view = game.temporary_loot_modifiers
+    assert view == {"Apple": 2.0}
+    with pytest.raises(TypeError):
+        view["Apple"] = 5
+    assert game.loot_modifiers.modifiers == {"Apple": 2.0}
+
+    game.loot_modifiers.tick(ROOMS, 2)
+    assert game.temporary_loot_modifiers == {}
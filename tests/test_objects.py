@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+
+import pytest
+
+from objects.base import GameObject, NamedObject
+from objects.consumable import Apple
+from objects.interactive import Chest, Vendor
+
+
+def test_incomplete_subclass_fails_at_creation():
+    @dataclass(slots=True)
+    class Nameless(GameObject):
+        def on_interact(self, game):
+            return ""
+
+    with pytest.raises(TypeError):
+        Nameless()
+
+
+def test_named_object_needs_on_interact():
+    with pytest.raises(TypeError):
+        NamedObject("Statue")
+
+
+def test_item_state_is_consumed_only():
+    apple = Apple()
+    assert not hasattr(apple, "__dict__")
+    assert apple.name == "Apple" and apple.image_path == Apple.ITEM_TYPE.image_path
+    apple.consumed = True
+    copy = apple.clone()
+    assert type(copy) is Apple and copy.consumed
+
+
+@pytest.mark.parametrize("cls", [Chest, Vendor])
+def test_interactive_objects_clone(cls):
+    obj = cls()
+    copy = obj.clone()
+    assert type(copy) is cls
+    assert (copy.name, copy.image_path, copy.consumed) == (obj.name, obj.image_path, obj.consumed)
@@ -0,0 +1,37 @@
+import pickle
+import random
+
+import pytest
+
+from game.game import Game
+from game.rng import CounterRandom
+from world.manor import Manor
+
+
+def test_counter_random_copy_keeps_gauss_state():
+    rng = CounterRandom(12345)
+    rng.gauss(0, 1)  # laisse un second tirage en attente
+    twin = rng.copy()
+    assert twin.getstate() == rng.getstate()
+    assert [twin.gauss(0, 1) for _ in range(3)] == [rng.gauss(0, 1) for _ in range(3)]
+
+
+def test_counter_random_setstate_restores_gauss_next():
+    rng = CounterRandom(7)
+    rng.gauss(0, 1)
+    state = rng.getstate()
+    expected = [rng.gauss(0, 1), rng.random()]
+    rng.setstate(state)
+    assert [rng.gauss(0, 1), rng.random()] == expected
+    assert pickle.loads(pickle.dumps(rng)).getstate() == rng.getstate()
+
+
+@pytest.mark.parametrize("rng_mode", ["sequential", "counter"])
+@pytest.mark.parametrize("rng_cls", [random.Random, CounterRandom])
+def test_game_clone_copies_rng(rng_mode, rng_cls):
+    game = Game(Manor(), seed=3, rng=rng_cls(3), rng_mode=rng_mode)
+    game.rng.gauss(0, 1)
+    clone = game.clone()
+    assert type(clone.rng) is rng_cls
+    assert clone.rng is not game.rng
+    assert [clone.rng.gauss(0, 1) for _ in range(3)] == [game.rng.gauss(0, 1) for _ in range(3)]
@@ -1,7 +1,6 @@
 import pygame
 from pygame import Rect
 from enums.direction import Direction
-from models.coord import Coord
 from objects.interactive import Vendor
 import os
 
@@ -43,6 +42,8 @@ class Renderer:
         self.grid_y_offset = (self.h - used_grid_height) // 2
 
         self.room_images = {}
+        # (manoir, nombre de salles) lors du dernier nettoyage de room_images
+        self._pruned_for = None
         self.error_message = ""
 
         # Charger les icônes et les redimensionner automatiquement
@@ -75,21 +76,23 @@ class Renderer:
         self.selected_room_index = 0  # Index de la pièce sélectionnée
 
     def draw(self):
-        # Nettoyer le cache d'images si nécessaire
-        if not self.game.current_room_choices:
-            # Conserver uniquement les images des pièces placées et les previews
+        # Nettoyer le cache d'images si nécessaire : seulement quand le manoir a changé
+        # (salle posée, tirage terminé), pas à chaque image
+        m = self.game.manor
+        if self.game.current_room_choices:
+            self._pruned_for = None
+        elif self._pruned_for != (id(m), m.placed_count()):
+            self._pruned_for = (id(m), m.placed_count())
+            # Conserver uniquement les images des pièces placées (index du manoir)
+            used_paths = {m.room_at(c).image_path for c in m.placed_cells()}
             kept_images = {}
             for path, img in self.room_images.items():
                 # Garder les images de preview
                 if path.startswith("preview_"):
                     continue
                 # Vérifier si l'image est utilisée dans le manoir
-                for r in range(self.game.manor.rows):
-                    for c in range(self.game.manor.cols):
-                        cell = self.game.manor.cell(Coord(r, c))
-                        if cell.room and cell.room.image_path == path:
-                            kept_images[path] = img
-                            break
+                if path in used_paths:
+                    kept_images[path] = img
 
             # Mettre à jour le cache d'images
             self.room_images = kept_images
@@ -126,7 +129,7 @@ class Renderer:
             pygame.draw.rect(self.screen, (255, 255, 255), (x, start_y, card_width, card_height))
             pygame.draw.rect(
                 self.screen,
-                room._couleur.value if hasattr(room._couleur, 'value') else room._couleur,
+                room.couleur.value if hasattr(room.couleur, 'value') else room.couleur,
                 (x + 5, start_y + 5, card_width - 10, card_height - 10)
             )
 
@@ -250,7 +253,7 @@ class Renderer:
             y_info += 22
 
             # Couleur (si disponible)
-            couleur = getattr(room, "_couleur", None)
+            couleur = getattr(room, "couleur", None)
             if couleur is not None:
                 try:
                     couleur_label = couleur.name.title()
@@ -304,67 +307,72 @@ class Renderer:
 
     def _draw_grid(self):
         m = self.game.manor
+        # fond : cases vides (aucune Cell n'est allouée pour elles)
         for r in range(m.rows):
             for c in range(m.cols):
                 x = int(c * self.cell_size)
                 y = int(self.grid_y_offset + r * self.cell_size)
-
                 rect = Rect(x, y, int(self.cell_size), int(self.cell_size))
                 pygame.draw.rect(self.screen, (35, 35, 42), rect, border_radius=6)
 
-                cell = m.grid[r][c]
-
-                if cell.room:
-                    # Charger l'image si pas encore dans le cache
-                    if hasattr(cell.room, 'image_path') and cell.room.image_path:
-                        if cell.room.image_path not in self.room_images:
-                            try:
-                                img = pygame.image.load(cell.room.image_path).convert_alpha()
-                                img = pygame.transform.smoothscale(img, (int(self.cell_size), int(self.cell_size)))
-                                self.room_images[cell.room.image_path] = img
-                            except (pygame.error, FileNotFoundError):
-                                # En cas d'erreur de chargement, on utilise une couleur de fond
-                                color = cell.room._couleur.value if hasattr(cell.room._couleur, 'value') else cell.room._couleur
-                                pygame.draw.rect(self.screen, color, rect)
-                                continue
-
-                        # Récupérer et afficher l'image
-                        room_img = self.room_images[cell.room.image_path]
-                        self.screen.blit(room_img, (x, y))
-                    else:
-                        # Si pas d'image, utiliser la couleur de la pièce
-                        color = cell.room._couleur.value if hasattr(cell.room._couleur, 'value') else cell.room._couleur
-                        pygame.draw.rect(self.screen, color, rect)
-
-                    name = cell.room.name.upper()
-                    txt = self.font_tools.render(name, True, (30, 30, 30))
-                    self.screen.blit(txt, (x + self.cell_size * 0.08, y + self.cell_size * 0.08))
-
-                # Portes
-                for d in cell.doors.keys():
-                    tab_w = int(self.cell_size * 0.35)
-                    tab_h = int(self.cell_size * 0.24)
-                    edge_t = max(2, int(self.cell_size * 0.06))
-
-                    if d is Direction.UP:
-                        px = int(x + self.cell_size / 2 - tab_w / 2)
-                        py = int(y - edge_t)
-                        pygame.draw.rect(self.screen, DOOR_COL, Rect(px, py, tab_w, edge_t + 2))
-
-                    if d is Direction.DOWN:
-                        px = int(x + self.cell_size / 2 - tab_w / 2)
-                        py = int(y + self.cell_size - 2)
-                        pygame.draw.rect(self.screen, DOOR_COL, Rect(px, py, tab_w, edge_t + 2))
-
-                    if d is Direction.LEFT:
-                        px = int(x - edge_t)
-                        py = int(y + self.cell_size / 2 - tab_h / 2)
-                        pygame.draw.rect(self.screen, DOOR_COL, Rect(px, py, edge_t + 2, tab_h))
-
-                    if d is Direction.RIGHT:
-                        px = int(x + self.cell_size - 2)
-                        py = int(y + self.cell_size / 2 - tab_h / 2)
-                        pygame.draw.rect(self.screen, DOOR_COL, Rect(px, py, edge_t + 2, tab_h))
+        # salles et portes : seulement les cases occupées
+        for coord, cell in m.cells():
+            r, c = coord.r, coord.c
+            x = int(c * self.cell_size)
+            y = int(self.grid_y_offset + r * self.cell_size)
+            rect = Rect(x, y, int(self.cell_size), int(self.cell_size))
+
+            if cell.room:
+                # Charger l'image si pas encore dans le cache
+                if hasattr(cell.room, 'image_path') and cell.room.image_path:
+                    if cell.room.image_path not in self.room_images:
+                        try:
+                            img = pygame.image.load(cell.room.image_path).convert_alpha()
+                            img = pygame.transform.smoothscale(img, (int(self.cell_size), int(self.cell_size)))
+                            self.room_images[cell.room.image_path] = img
+                        except (pygame.error, FileNotFoundError):
+                            # En cas d'erreur de chargement, on utilise une couleur de fond
+                            color = cell.room.couleur.value if hasattr(cell.room.couleur, 'value') else cell.room.couleur
+                            pygame.draw.rect(self.screen, color, rect)
+                            continue
+
+                    # Récupérer et afficher l'image
+                    room_img = self.room_images[cell.room.image_path]
+                    self.screen.blit(room_img, (x, y))
+                else:
+                    # Si pas d'image, utiliser la couleur de la pièce
+                    color = cell.room.couleur.value if hasattr(cell.room.couleur, 'value') else cell.room.couleur
+                    pygame.draw.rect(self.screen, color, rect)
+
+                name = cell.room.name.upper()
+                txt = self.font_tools.render(name, True, (30, 30, 30))
+                self.screen.blit(txt, (x + self.cell_size * 0.08, y + self.cell_size * 0.08))
+
+            # Portes
+            for d in cell.doors.keys():
+                tab_w = int(self.cell_size * 0.35)
+                tab_h = int(self.cell_size * 0.24)
+                edge_t = max(2, int(self.cell_size * 0.06))
+
+                if d is Direction.UP:
+                    px = int(x + self.cell_size / 2 - tab_w / 2)
+                    py = int(y - edge_t)
+                    pygame.draw.rect(self.screen, DOOR_COL, Rect(px, py, tab_w, edge_t + 2))
+
+                if d is Direction.DOWN:
+                    px = int(x + self.cell_size / 2 - tab_w / 2)
+                    py = int(y + self.cell_size - 2)
+                    pygame.draw.rect(self.screen, DOOR_COL, Rect(px, py, tab_w, edge_t + 2))
+
+                if d is Direction.LEFT:
+                    px = int(x - edge_t)
+                    py = int(y + self.cell_size / 2 - tab_h / 2)
+                    pygame.draw.rect(self.screen, DOOR_COL, Rect(px, py, edge_t + 2, tab_h))
+
+                if d is Direction.RIGHT:
+                    px = int(x + self.cell_size - 2)
+                    py = int(y + self.cell_size / 2 - tab_h / 2)
+                    pygame.draw.rect(self.screen, DOOR_COL, Rect(px, py, edge_t + 2, tab_h))
 
         # position du joueur
         pr, pc = self.game.player.pos.r, self.game.player.pos.c
@@ -0,0 +1,277 @@
+from __future__ import annotations
+from array import array
+from collections.abc import MutableMapping
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple, Type
+
+from enums.direction import Direction
+from enums.lock_level import LockLevel
+from models.cell import Cell
+from models.coord import Coord
+from models.door import Door
+from rooms.room_base import Room
+from world.manor import MAX_COLS, MAX_ROWS, Manor
+from world.topology import DIR_INDEX, DIRS, get_topology
+
+# ordre des directions dans door_bits (bit k = DIRS[k]) : celui de DIRS, l'opposée de k est k ^ 1
+
+# identifiant uint8 par type de salle (0 = case vide), attribué à la première pose
+_ROOM_TYPES: List[Optional[Type[Room]]] = [None]
+_ROOM_TYPE_IDS: Dict[Type[Room], int] = {}
+
+
+def room_type_id(cls: Type[Room]) -> int:
+    """Identifiant compact d'un type de salle (stable pendant la vie du processus)."""
+    tid = _ROOM_TYPE_IDS.get(cls)
+    if tid is None:
+        if len(_ROOM_TYPES) > 255:
+            raise ValueError("Trop de types de salles pour un identifiant uint8")
+        tid = len(_ROOM_TYPES)
+        _ROOM_TYPES.append(cls)
+        _ROOM_TYPE_IDS[cls] = tid
+    return tid
+
+
+def room_type_for_id(tid: int) -> Optional[Type[Room]]:
+    return _ROOM_TYPES[tid]
+
+
+class CompactManor(Manor):
+    """
+    Manoir à stockage en colonnes (array uint8) :
+    - room_type[i]     : identifiant du type de salle de la case i (0 = vide)
+    - door_bits[i]     : bit k = porte dans DIRS[k]
+    - locks[2 * i]     : LockLevel de la porte du mur haut de la case i (0 si pas de porte)
+    - locks[2 * i + 1] : LockLevel de la porte du mur gauche de la case i
+    Un verrou par mur, partagé par les deux cases (voir _wall) : les deux côtés ne peuvent pas diverger.
+    Seules les salles posées gardent un objet Room (leur état : _used, contenu...).
+    cell() et Cell.doors restent disponibles sous forme de vues.
+    Stockage dense (rows * cols * 4 octets) : pour les très grands manoirs peu explorés, Manor est plus léger.
+    """
+    def __init__(self, rows: int = 9, cols: int = 5, start: Optional[Coord] = None, goal: Optional[Coord] = None):
+        if not (1 <= rows <= MAX_ROWS and 1 <= cols <= MAX_COLS):
+            raise ValueError(f"Taille de manoir invalide : {rows}x{cols} (max {MAX_ROWS}x{MAX_COLS})")
+        self._rows = rows
+        self._cols = cols
+        self._topology = topo = get_topology(rows, cols)
+        start = start or Coord(rows - 1, cols // 2)
+        goal = goal or Coord(0, cols // 2)
+        self._start = topo.coord(start.r, start.c)
+        self._goal = topo.coord(goal.r, goal.c)
+        n = rows * cols
+        self._room_type = array("B", bytes(n))
+        self._door_bits = array("B", bytes(n))
+        self._locks = array("B", bytes(2 * n))
+        self._rooms: Dict[int, Room] = {}
+        # décalage d'identifiant vers la case voisine, par direction (ordre DIRS)
+        self._steps = (-cols, cols, -1, 1)
+        self._init_index()
+
+    # ---------- API Manor ----------
+    # __repr__ / __eq__ du dataclass Manor lisent _cells, absent ici : versions sur les colonnes
+    def __repr__(self) -> str:
+        return (f"CompactManor(rows={self._rows}, cols={self._cols}, start={self._start}, "
+                f"goal={self._goal}, rooms={len(self._rooms)})")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CompactManor):
+            return NotImplemented
+        return (
+            (self._rows, self._cols, self._start, self._goal) == (other._rows, other._cols, other._start, other._goal)
+            and self._room_type == other._room_type
+            and self._door_bits == other._door_bits
+            and self._locks == other._locks
+            and self._rooms == other._rooms
+        )
+
+    __hash__ = None  # mutable, comme Manor
+
+    @property
+    def grid(self) -> List[List[Cell]]:
+        """Vues ligne par ligne (compatibilité : préférer cell() ou les requêtes groupées)."""
+        return [[CompactCell(self, r * self._cols + c) for c in range(self._cols)] for r in range(self._rows)]
+
+    def cell(self, c: Coord) -> Cell:
+        return CompactCell(self, c.r * self._cols + c.c)
+
+    # les vues écrivent directement dans les colonnes : rien à allouer pour une pose
+    _cell_for_write = cell
+
+    def clone(self) -> "CompactManor":
+        new = object.__new__(CompactManor)
+        new._rows, new._cols, new._start, new._goal = self._rows, self._cols, self._start, self._goal
+        new._topology, new._steps = self._topology, self._steps
+        new._room_type = array("B", self._room_type)
+        new._door_bits = array("B", self._door_bits)
+        new._locks = array("B", self._locks)
+        new._rooms = {i: room.clone() for i, room in self._rooms.items()}
+        new._placed = dict(self._placed)
+        new._by_type = {cls: dict(coords) for cls, coords in self._by_type.items()}
+        new._frontier = dict(self._frontier)
+        new._used = dict(self._used)
+        return new
+
+    def room_at(self, c: Coord) -> Optional[Room]:
+        return self._rooms.get(c.r * self._cols + c.c)
+
+    def cells(self) -> Iterator[Tuple[Coord, Cell]]:
+        """Cases avec une salle ou des portes (index des cases utilisées)."""
+        cols = self._cols
+        for coord in self._used:
+            yield coord, CompactCell(self, coord.r * cols + coord.c)
+
+    def coord_of(self, i: int) -> Coord:
+        return self._topology.coord_of(i)
+
+    def _wall(self, i: int, k: int) -> int:
+        """Index dans locks du mur entre la case i et sa voisine dans DIRS[k] (le mur haut ou gauche de la plus grande)."""
+        return 2 * max(i, i + self._steps[k]) + (k >> 1)
+
+    # ---------- requêtes groupées (boucles en C sur les colonnes) ----------
+    def count_locked_doors(self, row: Optional[int] = None) -> int:
+        """
+        Nombre de portes verrouillées (LOCKED ou DOUBLE_LOCKED), sur tout le manoir ou sur une rangée
+        (portes des murs haut et gauche de ses cases).
+        """
+        locks = self._locks if row is None else self._row_locks(row)
+        return len(locks) - locks.count(0)
+
+    def locked_doors_in_row(self, row: int) -> List[Tuple[Coord, Direction, LockLevel]]:
+        """Portes verrouillées des murs haut et gauche des cases de la rangée `row` (une entrée par mur)."""
+        base = row * self._cols
+        locks = self._row_locks(row)
+        out, k = [], 0
+        while True:
+            k = _find_nonzero(locks, k)
+            if k < 0:
+                return out
+            out.append((self.coord_of(base + k // 2), DIRS[2 * (k % 2)], LockLevel(locks[k])))
+            k += 1
+
+    def _row_locks(self, row: int) -> bytes:
+        start = 2 * row * self._cols
+        return self._locks[start:start + 2 * self._cols].tobytes()
+
+
+def _find_nonzero(buf: bytes, start: int) -> int:
+    """Premier index >= start dont l'octet est non nul (-1 sinon), sans boucle Python par octet."""
+    rest = buf[start:].lstrip(b"\x00")
+    return -1 if not rest else len(buf) - len(rest)
+
+
+class CompactCell(Cell):
+    """Vue d'une case d'un CompactManor (même API que Cell)."""
+    __slots__ = ("_manor", "_i")
+
+    def __init__(self, manor: CompactManor, i: int):
+        self._manor = manor
+        self._i = i
+
+    @property
+    def _room(self) -> Optional[Room]:
+        return self._manor._rooms.get(self._i)
+
+    @_room.setter
+    def _room(self, value: Optional[Room]) -> None:
+        m = self._manor
+        if value is None:
+            m._rooms.pop(self._i, None)
+            m._room_type[self._i] = 0
+        else:
+            m._rooms[self._i] = value
+            m._room_type[self._i] = room_type_id(type(value))
+
+    @property
+    def _doors(self) -> "DoorMap":
+        return DoorMap(self._manor, self._i)
+
+    @_doors.setter
+    def _doors(self, value) -> None:
+        doors = DoorMap(self._manor, self._i)
+        doors.clear()
+        doors.update(value)
+
+    def clone(self, doors: Optional[Dict[Hashable, Door]] = None) -> Cell:
+        """
+        Copie en Cell ordinaire. Les DoorView sont recréées à chaque accès : le mémo `doors`
+        est indexé par mur ((manoir, _wall)) pour que les deux cases d'un mur partagent
+        une seule Door dans la copie, comme pour Manor.
+        """
+        if doors is None:
+            doors = {}
+        m, i = self._manor, self._i
+        copies = {}
+        for d in self._doors:
+            k = DIR_INDEX[d]
+            key = (id(m), m._wall(i, k))
+            copy = doors.get(key)
+            if copy is None:
+                copy = doors[key] = DoorView(m, i, k).clone()
+            copies[d] = copy
+        return Cell(self._room.clone() if self._room is not None else None, copies)
+
+
+class DoorMap(MutableMapping):
+    """
+    Vue Dict[Direction, Door] sur les colonnes door_bits / locks d'une case.
+    Poser une porte écrit le verrou du mur : la porte du même mur, vue depuis la voisine, le suit.
+    """
+    __slots__ = ("_manor", "_i")
+
+    def __init__(self, manor: CompactManor, i: int):
+        self._manor = manor
+        self._i = i
+
+    def __contains__(self, d) -> bool:
+        return bool(self._manor._door_bits[self._i] >> DIR_INDEX[d] & 1)
+
+    def __getitem__(self, d: Direction) -> Door:
+        if d not in self:
+            raise KeyError(d)
+        return DoorView(self._manor, self._i, DIR_INDEX[d])
+
+    def __setitem__(self, d: Direction, door: Door) -> None:
+        m, k = self._manor, DIR_INDEX[d]
+        m._door_bits[self._i] |= 1 << k
+        m._locks[m._wall(self._i, k)] = int(door.lock)
+
+    def __delitem__(self, d: Direction) -> None:
+        if d not in self:
+            raise KeyError(d)
+        m, k = self._manor, DIR_INDEX[d]
+        m._door_bits[self._i] &= ~(1 << k) & 0xFF
+        # le verrou reste tant que la porte existe de l'autre côté du mur
+        if not m._door_bits[self._i + m._steps[k]] >> (k ^ 1) & 1:
+            m._locks[m._wall(self._i, k)] = 0
+
+    def __iter__(self) -> Iterator[Direction]:
+        bits = self._manor._door_bits[self._i]
+        return iter([d for k, d in enumerate(DIRS) if bits >> k & 1])
+
+    def __len__(self) -> int:
+        return bin(self._manor._door_bits[self._i]).count("1")
+
+
+class DoorView(Door):
+    """Vue d'une porte : le verrou est lu/écrit dans le mur (colonne locks), l'autre côté est la case voisine."""
+    __slots__ = ("_manor", "_i", "_k")
+
+    def __init__(self, manor: CompactManor, i: int, k: int):
+        self._manor = manor
+        self._i = i
+        self._k = k
+
+    @property
+    def _lock(self) -> LockLevel:
+        return LockLevel(self._manor._locks[self._manor._wall(self._i, self._k)])
+
+    @_lock.setter
+    def _lock(self, value: LockLevel) -> None:
+        self._manor._locks[self._manor._wall(self._i, self._k)] = int(value)
+
+    @property
+    def _a(self) -> Coord:
+        return self._manor.coord_of(self._i)
+
+    @property
+    def _b(self) -> Coord:
+        return self._manor.coord_of(self._i + self._manor._steps[self._k])
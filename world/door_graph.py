@@ -0,0 +1,209 @@
+from __future__ import annotations
+from typing import Dict, List, Set, Tuple
+
+from enums.direction import Direction
+from enums.lock_level import LockLevel
+from models.coord import Coord
+from world.topology import DIRS, get_topology
+
+_UP, _DOWN, _LEFT, _RIGHT = DIRS
+
+
+class DoorGraph:
+    """
+    Graphe des portes en bitsets (un entier Python par ensemble de cases).
+    Les bits couvrent une fenêtre du manoir : tout le manoir s'il est petit, sinon le rectangle
+    des cases explorées (+1 case de marge), agrandi au besoin. Bit i = case
+    (bas - r) * largeur + (c - gauche) : la taille des entiers suit la zone explorée,
+    pas la surface du manoir.
+    Tenu à jour par Game à chaque pose de salle, création de porte et déverrouillage :
+    les questions "l'objectif est-il atteignable ?", "quelles cases avec N clés ?",
+    "la partie est-elle perdue ?" se résolvent en quelques opérations sur les bits.
+    """
+    # en dessous de cette surface, la fenêtre est le manoir entier (jamais réencodée)
+    FULL_WINDOW_AREA = 4096
+
+    def __init__(self, rows: int, cols: int):
+        self._rows = rows
+        self._cols = cols
+        self._topology = get_topology(rows, cols)
+        # état de référence (creux), pour réencoder les bitsets quand la fenêtre s'agrandit
+        self._placed_cells: Set[Coord] = set()
+        self._door_locks: Dict[Tuple[Coord, Direction], LockLevel] = {}
+        if rows * cols <= self.FULL_WINDOW_AREA:
+            self._set_window(0, 0, rows, cols)
+        else:
+            self._set_window(0, 0, 0, 0)
+
+    def _set_window(self, r0: int, c0: int, h: int, w: int) -> None:
+        """Fenêtre [r0, r0 + h) x [c0, c0 + w) ; reconstruit les bitsets depuis l'état de référence."""
+        self._r0, self._c0, self._h, self._w = r0, c0, h, w
+        self._all = (1 << (h * w)) - 1
+        # colonnes de bord (pour ne pas "déborder" d'une ligne à l'autre en décalant de 1)
+        left_col = int(("0" * (w - 1) + "1") * h, 2) if h and w else 0
+        self._not_left = self._all & ~left_col
+        self._not_right = self._all & ~(left_col << (w - 1)) if w else 0
+
+        self._placed = 0
+        # par direction : cases qui ont une porte dans cette direction / verrouillée / double
+        self._doors: Dict[Direction, int] = {d: 0 for d in DIRS}
+        self._locked: Dict[Direction, int] = {d: 0 for d in DIRS}
+        self._double: Dict[Direction, int] = {d: 0 for d in DIRS}
+        for coord in self._placed_cells:
+            self._placed |= self.bit(coord)
+        for (coord, d), lock in self._door_locks.items():
+            self._set_bits(coord, d, lock)
+
+    def _ensure(self, coord: Coord) -> None:
+        """Agrandit la fenêtre pour contenir coord et ses voisines (avec de la marge pour amortir)."""
+        r0, c0, h, w = self._r0, self._c0, self._h, self._w
+        lo_r, hi_r = max(0, coord.r - 1), min(self._rows - 1, coord.r + 1)
+        lo_c, hi_c = max(0, coord.c - 1), min(self._cols - 1, coord.c + 1)
+        if h and w and r0 <= lo_r and hi_r < r0 + h and c0 <= lo_c and hi_c < c0 + w:
+            return
+        if not (h and w):
+            r0, c0, r1, c1 = lo_r, lo_c, hi_r + 1, hi_c + 1
+        else:
+            r1, c1 = r0 + h, c0 + w
+            if lo_r < r0:
+                r0 = max(0, min(lo_r, r0 - h // 2))
+            if hi_r >= r1:
+                r1 = min(self._rows, max(hi_r + 1, r1 + h // 2))
+            if lo_c < c0:
+                c0 = max(0, min(lo_c, c0 - w // 2))
+            if hi_c >= c1:
+                c1 = min(self._cols, max(hi_c + 1, c1 + w // 2))
+        self._set_window(r0, c0, r1 - r0, c1 - c0)
+
+    @classmethod
+    def from_manor(cls, manor) -> "DoorGraph":
+        graph = cls(manor.rows, manor.cols)
+        for coord, cell in manor.cells():
+            if cell.room is not None:
+                graph.place_room(coord)
+            for d, door in cell.doors.items():
+                graph.add_door(coord, d, door.lock)
+        return graph
+
+    def clone(self) -> "DoorGraph":
+        new = object.__new__(DoorGraph)
+        new.__dict__.update(self.__dict__)
+        new._placed_cells = set(self._placed_cells)
+        new._door_locks = dict(self._door_locks)
+        new._doors = dict(self._doors)
+        new._locked = dict(self._locked)
+        new._double = dict(self._double)
+        return new
+
+    # ---------- mises à jour ----------
+    def bit(self, coord: Coord) -> int:
+        """Bit de la case (0 si elle est hors de la fenêtre : jamais posée ni atteinte)."""
+        r, c = coord.r - self._r0, coord.c - self._c0
+        if not (0 <= r < self._h and 0 <= c < self._w):
+            return 0
+        return 1 << ((self._h - 1 - r) * self._w + c)
+
+    def place_room(self, coord: Coord) -> None:
+        self._ensure(coord)
+        self._placed_cells.add(coord)
+        self._placed |= self.bit(coord)
+
+    def add_door(self, coord: Coord, d: Direction, lock: LockLevel) -> None:
+        self._ensure(coord)
+        self._door_locks[(coord, d)] = lock
+        self._set_bits(coord, d, lock)
+
+    def set_lock(self, coord: Coord, d: Direction, lock: LockLevel) -> None:
+        self._door_locks[(coord, d)] = lock
+        self._set_bits(coord, d, lock)
+
+    def _set_bits(self, coord: Coord, d: Direction, lock: LockLevel) -> None:
+        b = self.bit(coord)
+        self._doors[d] |= b
+        self._locked[d] = self._locked[d] | b if lock == LockLevel.LOCKED else self._locked[d] & ~b
+        self._double[d] = self._double[d] | b if lock == LockLevel.DOUBLE_LOCKED else self._double[d] & ~b
+
+    # ---------- décalages ----------
+    def _shift(self, bits: int, d: Direction) -> int:
+        """Cases voisines dans la direction d des cases de `bits` (restent dans la fenêtre)."""
+        if d is _UP:
+            return (bits << self._w) & self._all
+        if d is _DOWN:
+            return bits >> self._w
+        if d is _LEFT:
+            return (bits & self._not_left) >> 1
+        return (bits & self._not_right) << 1
+
+    def _masks(self, lockpick: bool) -> tuple:
+        """
+        (portes franchissables sans clé, portes qui demandent une clé), chacune en
+        tuple (UP, DOWN, LEFT, RIGHT). LOCKED est gratuit avec le kit de crochetage.
+        """
+        doors = [self._doors[d] for d in DIRS]
+        blocked = [self._double[d] | (0 if lockpick else self._locked[d]) for d in DIRS]
+        free = tuple(m & ~b for m, b in zip(doors, blocked))
+        keyed = tuple(m & b for m, b in zip(doors, blocked))
+        return free, keyed
+
+    def _step(self, reach: int, masks: tuple) -> int:
+        # une porte n'existe que vers une case du manoir : pas besoin de masquer les bords
+        up, down, left, right = masks
+        cols = self._w
+        return ((reach & up) << cols) | ((reach & down) >> cols) | ((reach & left) >> 1) | ((reach & right) << 1)
+
+    def _closure(self, reach: int, masks: tuple) -> int:
+        up, down, left, right = masks
+        cols = self._w
+        while True:
+            nxt = reach | ((reach & up) << cols) | ((reach & down) >> cols) | ((reach & left) >> 1) | ((reach & right) << 1)
+            if nxt == reach:
+                return reach
+            reach = nxt
+
+    # ---------- requêtes ----------
+    def reachable(self, start: Coord, keys: int = 0, lockpick: bool = False) -> int:
+        """
+        Bitset des cases atteignables depuis `start` en utilisant au plus `keys` clés
+        (une clé par porte verrouillée franchie, comme Door.open).
+        """
+        free, keyed = self._masks(lockpick)
+        reach = self._closure(self.bit(start), free)
+        for _ in range(keys):
+            nxt = self._closure(reach | self._step(reach, keyed), free)
+            if nxt == reach:
+                break
+            reach = nxt
+        return reach
+
+    def goal_reachable(self, start: Coord, goal: Coord, keys: int = 0, lockpick: bool = False) -> bool:
+        return bool(self.reachable(start, keys, lockpick) & self.bit(goal))
+
+    def expandable(self, reach: int) -> int:
+        """
+        Cases où la partie peut encore progresser depuis `reach` : cases vides voisines
+        (nouvelle salle) et salles voisines sans porte de ce côté (nouvelle porte).
+        """
+        # & ~placed sur un entier positif : coût proportionnel à la taille de l'opérande positif
+        not_placed = ~self._placed
+        out = 0
+        for d in DIRS:
+            out |= self._shift(reach, d) & not_placed
+            out |= self._shift(reach & ~self._doors[d], d) & self._placed
+        return out
+
+    def is_dead(self, start: Coord, goal: Coord, keys: int, lockpick: bool) -> bool:
+        """Partie perdue : objectif inatteignable avec les clés actuelles et plus rien à ouvrir ou poser."""
+        reach = self.reachable(start, keys, lockpick)
+        if reach & self.bit(goal):
+            return False
+        return not self.expandable(reach)
+
+    def cells(self, bits: int) -> List[Coord]:
+        """Coordonnées des cases d'un bitset."""
+        out = []
+        while bits:
+            low = bits & -bits
+            i = low.bit_length() - 1
+            out.append(self._topology.coord(self._r0 + self._h - 1 - i // self._w, self._c0 + i % self._w))
+            bits ^= low
+        return out
@@ -0,0 +1,105 @@
+from __future__ import annotations
+from functools import lru_cache
+from math import ceil, floor
+from typing import List, Sequence, Tuple
+import random
+import struct
+
+from enums.lock_level import LockLevel
+
+# Table de référence (manoir de 9 rangées, 0 = haut / antichambre) :
+# par rangée, seuils cumulés (UNLOCKED, UNLOCKED + LOCKED) ; le reste est DOUBLE_LOCKED.
+# Première et dernière rangées : verrou fixe, aucun tirage.
+BASE_LOCK_TABLE: Tuple[Tuple[float, float], ...] = (
+    (0.00, 0.00),   # 0 : toujours DOUBLE_LOCKED
+    (0.05, 0.40),
+    (0.15, 0.60),
+    (0.25, 0.70),
+    (0.35, 0.80),
+    (0.50, 0.90),
+    (0.65, 0.95),
+    (0.80, 1.00),
+    (1.00, 1.00),   # 8 : toujours UNLOCKED
+)
+
+_LEVELS = (LockLevel.UNLOCKED, LockLevel.LOCKED, LockLevel.DOUBLE_LOCKED)
+_SCALE = 1 << 32
+
+
+class LockTable:
+    """
+    Distribution des verrous par rangée pour un manoir de `rows` rangées.
+    Les rangées intermédiaires sont interpolées linéairement sur la profondeur normalisée
+    entre les rangées intermédiaires de la table de référence (identique à celle-ci pour 9 rangées).
+    """
+    def __init__(self, rows: int, base: Sequence[Tuple[float, float]] = BASE_LOCK_TABLE):
+        if rows < 1:
+            raise ValueError("Le manoir doit avoir au moins une rangée")
+        self._rows = rows
+        self._cum = tuple(self._interpolate(base, row) for row in range(rows))
+        # seuils entiers pour le tirage groupé : p < seuil  <=>  x < ceil(seuil * 2^32)
+        self._icum = tuple((ceil(u * _SCALE), ceil(l * _SCALE)) for u, l in self._cum)
+
+    def _interpolate(self, base: Sequence[Tuple[float, float]], row: int) -> Tuple[float, float]:
+        last = self._rows - 1
+        if row == last:
+            return (1.0, 1.0)
+        if row == 0:
+            return (0.0, 0.0)
+        # rangées intermédiaires : [1, last - 1] -> [1, len(base) - 2]
+        inner = len(base) - 3
+        x = 1 + (row - 1) * inner / (last - 2) if last > 2 else 1 + inner / 2
+        i = floor(x)
+        t = x - i
+        if t == 0:
+            return tuple(base[i])  # rangée de la table : valeurs exactes
+        (u0, l0), (u1, l1) = base[i], base[i + 1]
+        return (u0 + (u1 - u0) * t, l0 + (l1 - l0) * t)
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    def cumulative(self, row: int) -> Tuple[float, float]:
+        return self._cum[max(0, min(self._rows - 1, row))]
+
+    def probabilities(self, row: int) -> Tuple[float, float, float]:
+        """(UNLOCKED, LOCKED, DOUBLE_LOCKED) pour une rangée."""
+        u, l = self.cumulative(row)
+        return (u, l - u, 1.0 - l)
+
+    def level(self, row: int, rng: random.Random) -> LockLevel:
+        """Verrou d'une porte vers la rangée `row` (un seul random() sauf première/dernière rangée)."""
+        row = max(0, min(self._rows - 1, row))  # sécurité
+        if row == self._rows - 1:
+            return LockLevel.UNLOCKED
+        if row == 0:
+            return LockLevel.DOUBLE_LOCKED
+        u, l = self._cum[row]
+        p = rng.random()
+        if p < u:
+            return LockLevel.UNLOCKED
+        return LockLevel.LOCKED if p < l else LockLevel.DOUBLE_LOCKED
+
+    def levels(self, rows: Sequence[int], rng: random.Random) -> List[LockLevel]:
+        """
+        Tirage groupé : un verrou par rangée de `rows` (plusieurs portes, plusieurs parties...).
+        Un seul appel au générateur (32 bits par porte) et aucune branche par rangée.
+        Suite de tirages différente de level() appelé en boucle.
+        """
+        n = len(rows)
+        if n == 0:
+            return []
+        draws = struct.unpack(f"<{n}I", rng.getrandbits(32 * n).to_bytes(4 * n, "little"))
+        last = self._rows - 1
+        if min(rows) < 0 or max(rows) > last:
+            rows = [max(0, min(last, row)) for row in rows]  # sécurité
+        unlocked = [u for u, _ in self._icum]
+        locked = [l for _, l in self._icum]
+        return [_LEVELS[(x >= unlocked[row]) + (x >= locked[row])] for row, x in zip(rows, draws)]
+
+
+@lru_cache(maxsize=None)
+def lock_table(rows: int) -> LockTable:
+    """Table partagée pour une hauteur de manoir."""
+    return LockTable(rows)
@@ -1,18 +1,80 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import List
-from models.cell import Cell
+from typing import Dict, Iterator, KeysView, List, Optional, Tuple, Type
+from models.cell import EMPTY_CELL, Cell
 from models.coord import Coord
+from models.door import Door
+from enums.direction import Direction
+from rooms.room_base import Room
+from world.topology import Topology, get_topology
+
+# au-delà, la grille dense (Manor.grid) n'a plus de sens : on reste en stockage creux
+MAX_ROWS = 1000
+MAX_COLS = 1000
+
 
 @dataclass
 class Manor:
-    """Manoir : 9 lignes (vertical)x 5 colonnes (horizontal)."""
+    """
+    Manoir : `rows` lignes (vertical) x `cols` colonnes (horizontal), 9 x 5 par défaut.
+    Stockage creux : seules les cases avec une salle ou une porte ont un objet Cell ; une case
+    jamais utilisée se lit comme EMPTY_CELL (partagée, en lecture seule) sans rien allouer.
+    Index tenus à jour à chaque place_room / add_door (requêtes en O(1) ou O(k)) :
+    cases occupées, cases par type de salle, frontière (cases vides voisines d'une salle)
+    et cases utilisées (salle ou porte). Les poses et portes passent par ces deux méthodes.
+    Entrée par défaut au milieu de la rangée du bas, sortie au milieu de la rangée du haut.
+    """
 
     _rows: int = 9  # hauteur (vertical)
     _cols: int = 5  # largeur (horizontal)
-    _grid: List[List[Cell]] = field(default_factory=lambda: [[Cell() for _ in range(5)] for _ in range(9)])
-    _start: Coord = Coord(8, 2)   # entrée en bas (ligne 8, colonne 2)
-    _goal:  Coord = Coord(0, 2)   # sortie en haut (ligne 0, colonne 2)
+    _cells: Dict[Coord, Cell] = field(default_factory=dict)
+    _start: Optional[Coord] = None   # défaut : (rows - 1, cols // 2)
+    _goal: Optional[Coord] = None    # défaut : (0, cols // 2)
+    # ids, voisins et Coord internés, partagés par les manoirs de même taille
+    _topology: Topology = field(init=False, repr=False, compare=False)
+    # index (dict = ensemble ordonné par première pose) ; _placed : case -> type de sa salle
+    _placed: Dict[Coord, Type[Room]] = field(init=False, repr=False, compare=False)
+    _by_type: Dict[Type[Room], Dict[Coord, None]] = field(init=False, repr=False, compare=False)
+    _frontier: Dict[Coord, None] = field(init=False, repr=False, compare=False)
+    _used: Dict[Coord, None] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not (1 <= self._rows <= MAX_ROWS and 1 <= self._cols <= MAX_COLS):
+            raise ValueError(f"Taille de manoir invalide : {self._rows}x{self._cols} (max {MAX_ROWS}x{MAX_COLS})")
+        self._topology = topo = get_topology(self._rows, self._cols)
+        if self._start is None:
+            self._start = Coord(self._rows - 1, self._cols // 2)
+        if self._goal is None:
+            self._goal = Coord(0, self._cols // 2)
+        if not (self.in_bounds(self._start) and self.in_bounds(self._goal)):
+            raise ValueError("L'entrée et la sortie doivent être dans le manoir")
+        self._start = topo.coord(self._start.r, self._start.c)
+        self._goal = topo.coord(self._goal.r, self._goal.c)
+        self._init_index()
+        for coord, cell in list(self._cells.items()):
+            if cell.room is not None:
+                self._index_room(topo.coord(coord.r, coord.c), cell.room)
+            elif cell.doors:
+                self._used[topo.coord(coord.r, coord.c)] = None
+
+    # ---------- index ----------
+    def _init_index(self) -> None:
+        self._placed = {}
+        self._by_type = {}
+        self._frontier = {}
+        self._used = {}
+
+    def _index_room(self, c: Coord, room: Room) -> None:
+        old = self._placed.get(c)
+        if old is not None:
+            del self._by_type[old][c]
+        self._placed[c] = type(room)
+        self._used[c] = None
+        self._by_type.setdefault(type(room), {})[c] = None
+        self._frontier.pop(c, None)
+        for n in self._topology.neighbors(c).values():
+            if n is not None and n not in self._placed:
+                self._frontier[n] = None
 
     @property
     def rows(self) -> int:
@@ -22,9 +84,15 @@ class Manor:
     def cols(self) -> int:
         return self._cols
 
+    @property
+    def topology(self) -> Topology:
+        return self._topology
+
     @property
     def grid(self) -> List[List[Cell]]:
-        return self._grid
+        """Vue dense ligne par ligne (compatibilité : cases vides = EMPTY_CELL, rien n'est alloué)."""
+        coord = self._topology.coord
+        return [[self.cell(coord(r, c)) for c in range(self._cols)] for r in range(self._rows)]
 
     @property
     def start(self) -> Coord:
@@ -39,5 +107,57 @@ class Manor:
         return 0 <= c.r < self._rows and 0 <= c.c < self._cols
 
     def cell(self, c: Coord) -> Cell:
-        """Retourne la cellule en (r, c)."""
-        return self._grid[c.r][c.c]
+        """Cellule en (r, c) ; EMPTY_CELL (lecture seule) si la case n'a jamais été utilisée."""
+        return self._cells.get(c, EMPTY_CELL)
+
+    def _cell_for_write(self, c: Coord) -> Cell:
+        cell = self._cells.get(c)
+        if cell is None:
+            cell = self._cells[self._topology.coord(c.r, c.c)] = Cell()
+        return cell
+
+    def room_at(self, c: Coord):
+        """Salle posée en (r, c), ou None (sans allouer de case)."""
+        cell = self._cells.get(c)
+        return cell.room if cell is not None else None
+
+    def cells(self) -> Iterator[Tuple[Coord, Cell]]:
+        """Cases utilisées (salle ou portes), dans l'ordre de première utilisation."""
+        cells = self._cells
+        for coord in self._used:
+            yield coord, cells[coord]
+
+    # ---------- modifications (tiennent les index à jour) ----------
+    def place_room(self, c: Coord, room: Room) -> Cell:
+        """Pose `room` en c et met les index à jour ; retourne la case."""
+        cell = self._cell_for_write(c)
+        cell.room = room
+        self._index_room(self._topology.coord(c.r, c.c), room)
+        return cell
+
+    def add_door(self, c: Coord, d: Direction, door: Door) -> None:
+        """Ajoute la porte `door` de la case c dans la direction d."""
+        self._cell_for_write(c).doors[d] = door
+        self._used[self._topology.coord(c.r, c.c)] = None
+
+    # ---------- requêtes (index) ----------
+    def placed_count(self) -> int:
+        """Nombre de cases occupées par une salle."""
+        return len(self._placed)
+
+    def placed_cells(self) -> KeysView[Coord]:
+        """Cases occupées par une salle (vue en lecture seule, ordre de pose)."""
+        return self._placed.keys()
+
+    def cells_of_type(self, cls: Type[Room]) -> List[Coord]:
+        """Coordonnées des salles d'un type donné (type exact)."""
+        return list(self._by_type.get(cls, ()))
+
+    def frontier(self) -> KeysView[Coord]:
+        """Cases vides du manoir voisines d'au moins une salle posée (vue en lecture seule)."""
+        return self._frontier.keys()
+
+    def clone(self) -> "Manor":
+        doors = {}  # une copie par porte, partagée par les deux cases du mur
+        cells = {coord: cell.clone(doors) for coord, cell in self.cells()}
+        return Manor(self._rows, self._cols, cells, self._start, self._goal)
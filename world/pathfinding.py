@@ -0,0 +1,191 @@
+from __future__ import annotations
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from enums.direction import Direction
+from enums.lock_level import LockLevel
+from models.coord import Coord
+
+_UNLOCKED, _LOCKED = LockLevel.UNLOCKED, LockLevel.LOCKED
+
+# front de Pareto d'une case : [(clés utilisées, pas)], clés croissantes / pas strictement décroissants
+Front = List[Tuple[int, int]]
+
+
+def key_cost(lock: LockLevel, lockpick: bool) -> int:
+    """Clés consommées pour franchir une porte (mêmes règles que Door.can_open / Door.open)."""
+    if lock == _UNLOCKED:
+        return 0
+    if lock == _LOCKED and lockpick:
+        return 0
+    return 1
+
+
+def _insert(front: Front, keys: int, steps: int) -> bool:
+    """Ajoute (keys, steps) au front s'il n'est dominé par aucun label ; retire ceux qu'il domine."""
+    i = 0
+    while i < len(front) and front[i][0] < keys:
+        if front[i][1] <= steps:
+            return False
+        i += 1
+    if i < len(front) and front[i][0] == keys and front[i][1] <= steps:
+        return False
+    # labels avec au moins autant de clés et de pas : dominés
+    j = i
+    while j < len(front) and front[j][1] >= steps:
+        j += 1
+    front[i:j] = [(keys, steps)]
+    return True
+
+
+@dataclass(frozen=True)
+class Route:
+    """Chemin le plus court (en pas) entre deux cases, avec le nombre de clés qu'il consomme."""
+    directions: Tuple[Direction, ...]
+    cells: Tuple[Coord, ...]   # cases traversées, départ et arrivée compris
+    keys: int
+
+    @property
+    def steps(self) -> int:
+        return len(self.directions)
+
+
+class PathFinder:
+    """
+    Plus courts chemins dans le graphe des portes, en tenant compte des verrous :
+    pour chaque case atteignable on garde le front de Pareto (clés, pas), puis une requête
+    choisit le meilleur label compatible avec les clés du joueur.
+    Les arbres calculés (un par départ et par présence du kit de crochetage) sont gardés en
+    cache et mis à jour incrémentalement quand une porte est créée ou déverrouillée :
+    ces événements ne font qu'améliorer des chemins, on ne propage que ce qui change.
+    """
+    MAX_TREES = 32
+
+    def __init__(self):
+        # portes sortantes : case -> {direction: (case d'arrivée, verrou)}
+        self._out: Dict[Coord, Dict[Direction, Tuple[Coord, LockLevel]]] = {}
+        # portes entrantes : case -> {(case de départ, direction): None} (pour reconstruire les chemins ;
+        # un dict plutôt qu'un set pour un ordre stable d'un processus à l'autre)
+        self._in: Dict[Coord, Dict[Tuple[Coord, Direction], None]] = {}
+        self._trees: "OrderedDict[Tuple[Coord, bool], Dict[Coord, Front]]" = OrderedDict()
+        # chemins déjà reconstruits, vidé à chaque changement de porte
+        self._routes: Dict[Tuple[Coord, Coord, bool, int], Route] = {}
+
+    @classmethod
+    def from_manor(cls, manor) -> "PathFinder":
+        finder = cls()
+        for coord, cell in manor.cells():
+            for d, door in cell.doors.items():
+                finder.add_door(coord, d, door.other_side(coord), door.lock)
+        return finder
+
+    def clone(self) -> "PathFinder":
+        # les arbres ne sont pas copiés : la copie les recalcule à la demande
+        new = PathFinder()
+        new._out = {u: dict(doors) for u, doors in self._out.items()}
+        new._in = {v: dict(edges) for v, edges in self._in.items()}
+        return new
+
+    # ---------- mises à jour ----------
+    def add_door(self, coord: Coord, d: Direction, leads_to: Coord, lock: LockLevel) -> None:
+        old = self._out.get(coord, {}).get(d)
+        self._out.setdefault(coord, {})[d] = (leads_to, lock)
+        self._in.setdefault(leads_to, {})[(coord, d)] = None
+        self._routes.clear()
+        if old is not None and old[1] < lock:
+            self._trees.clear()  # un verrou plus fort peut allonger des chemins
+            return
+        for (_, lockpick), tree in self._trees.items():
+            self._relax_edge(tree, coord, leads_to, key_cost(lock, lockpick), lockpick)
+
+    def set_lock(self, coord: Coord, d: Direction, lock: LockLevel) -> None:
+        leads_to, _ = self._out[coord][d]
+        self.add_door(coord, d, leads_to, lock)
+
+    # ---------- calcul des fronts ----------
+    def _relax_edge(self, tree: Dict[Coord, Front], u: Coord, v: Coord, cost: int, lockpick: bool) -> None:
+        front_u = tree.get(u)
+        if not front_u:
+            return
+        front_v = tree.setdefault(v, [])
+        changed = False
+        for keys, steps in list(front_u):
+            changed |= _insert(front_v, keys + cost, steps + 1)
+        if changed:
+            self._propagate(tree, deque([v]), lockpick)
+
+    def _propagate(self, tree: Dict[Coord, Front], queue: deque, lockpick: bool) -> None:
+        queued = set(queue)
+        while queue:
+            u = queue.popleft()
+            queued.discard(u)
+            labels = list(tree[u])
+            for v, lock in self._out.get(u, {}).values():
+                cost = key_cost(lock, lockpick)
+                front_v = tree.setdefault(v, [])
+                changed = False
+                for keys, steps in labels:
+                    changed |= _insert(front_v, keys + cost, steps + 1)
+                if changed and v not in queued:
+                    queue.append(v)
+                    queued.add(v)
+
+    def _tree(self, source: Coord, lockpick: bool) -> Dict[Coord, Front]:
+        key = (source, lockpick)
+        tree = self._trees.get(key)
+        if tree is not None:
+            self._trees.move_to_end(key)
+            return tree
+        tree = {source: [(0, 0)]}
+        self._propagate(tree, deque([source]), lockpick)
+        self._trees[key] = tree
+        if len(self._trees) > self.MAX_TREES:
+            self._trees.popitem(last=False)
+        return tree
+
+    # ---------- requêtes ----------
+    def front(self, source: Coord, target: Coord, lockpick: bool = False) -> Front:
+        """Compromis (clés, pas) non dominés pour aller de source à target ([] si inatteignable)."""
+        return list(self._tree(source, lockpick).get(target, ()))
+
+    def distance(self, source: Coord, target: Coord, keys: int = 0, lockpick: bool = False) -> Optional[Tuple[int, int]]:
+        """(pas, clés utilisées) du plus court chemin avec au plus `keys` clés, None si impossible."""
+        best = None
+        for used, steps in self._tree(source, lockpick).get(target, ()):
+            if used > keys:
+                break
+            best = (steps, used)
+        return best
+
+    def route(self, source: Coord, target: Coord, keys: int = 0, lockpick: bool = False) -> Optional[Route]:
+        """Plus court chemin (en pas) de source à target avec au plus `keys` clés."""
+        found = self.distance(source, target, keys, lockpick)
+        if found is None:
+            return None
+        steps, used = found
+        key = (source, target, lockpick, used)
+        route = self._routes.get(key)
+        if route is not None:
+            return route
+        tree = self._tree(source, lockpick)
+
+        # remontée : un prédécesseur avec un label (k', steps - 1) tel que k' + coût <= k existe toujours
+        cells, dirs = [target], []
+        v, k, s = target, used, steps
+        while s > 0:
+            for u, d in self._in.get(v, ()):
+                front_u = tree.get(u)
+                if not front_u:
+                    continue
+                cost = key_cost(self._out[u][d][1], lockpick)
+                prev = next((pk for pk, ps in front_u if pk + cost <= k and ps == s - 1), None)
+                if prev is not None:
+                    break
+            cells.append(u)
+            dirs.append(d)
+            v, k, s = u, prev, s - 1
+        cells.reverse()
+        dirs.reverse()
+        route = self._routes[key] = Route(tuple(dirs), tuple(cells), used)
+        return route
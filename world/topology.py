@@ -0,0 +1,92 @@
+from __future__ import annotations
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from enums.direction import Direction, OPPOSITE
+from models.coord import Coord
+
+# ordre des directions dans les tuples de voisins
+DIRS: Tuple[Direction, ...] = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+DIR_INDEX: Dict[Direction, int] = {d: i for i, d in enumerate(DIRS)}
+
+# en dessous de cette surface, toute la table est construite d'avance
+EAGER_AREA = 4096
+
+
+class Topology:
+    """
+    Topologie d'un manoir rows x cols, partagée par tous les manoirs de cette taille :
+    - identifiant entier de case : r * cols + c
+    - Coord internés (un seul objet par case)
+    - voisins par (case, direction), None hors du manoir
+    Construite d'avance pour les petits manoirs, case par case (à la première visite) sinon.
+    """
+    def __init__(self, rows: int, cols: int):
+        self._rows = rows
+        self._cols = cols
+        self._coords: Dict[int, Coord] = {}
+        # case -> {direction: voisine ou None}
+        self._adj: Dict[Coord, Dict[Direction, Optional[Coord]]] = {}
+        if rows * cols <= EAGER_AREA:
+            for r in range(rows):
+                for c in range(cols):
+                    self._neighbors_of(self.coord(r, c))
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    @property
+    def cols(self) -> int:
+        return self._cols
+
+    # ---------- identifiants ----------
+    def cell_id(self, coord: Coord) -> int:
+        return coord.r * self._cols + coord.c
+
+    def coord_of(self, i: int) -> Coord:
+        """Coord interné de la case d'identifiant i."""
+        coord = self._coords.get(i)
+        if coord is None:
+            coord = self._coords[i] = Coord(i // self._cols, i % self._cols)
+        return coord
+
+    def coord(self, r: int, c: int) -> Coord:
+        """Coord interné de (r, c)."""
+        return self.coord_of(r * self._cols + c)
+
+    # ---------- voisinage ----------
+    def _neighbors_of(self, coord: Coord) -> Dict[Direction, Optional[Coord]]:
+        rows, cols = self._rows, self._cols
+        table = {}
+        for d in DIRS:
+            dr, dc = Direction.delta(d)
+            r, c = coord.r + dr, coord.c + dc
+            table[d] = self.coord(r, c) if 0 <= r < rows and 0 <= c < cols else None
+        if 0 <= coord.r < rows and 0 <= coord.c < cols:
+            self._adj[self.coord(coord.r, coord.c)] = table  # seules les cases du manoir sont gardées
+        return table
+
+    def neighbor(self, coord: Coord, d: Direction) -> Optional[Coord]:
+        """Case voisine dans la direction d (Coord interné), None si hors du manoir."""
+        table = self._adj.get(coord)
+        if table is None:
+            table = self._neighbors_of(coord)
+        return table[d]
+
+    def neighbors(self, coord: Coord) -> Dict[Direction, Optional[Coord]]:
+        """Table {direction: voisine ou None} de la case (partagée, ne pas modifier)."""
+        table = self._adj.get(coord)
+        if table is None:
+            table = self._neighbors_of(coord)
+        return table
+
+    @staticmethod
+    def opposite(d: Direction) -> Direction:
+        return OPPOSITE[d]
+
+
+@lru_cache(maxsize=None)
+def get_topology(rows: int, cols: int) -> Topology:
+    """Topologie partagée pour une taille de manoir."""
+    return Topology(rows, cols)